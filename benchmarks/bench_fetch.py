@@ -0,0 +1,198 @@
+"""Fetch-layer benchmarks against the local stand-in HTTP server.
+
+Runs HttpFetcher and FetchUseCase against synthetic files served from
+tests/support/http_server.py, so changes to the fetch path can be
+measured offline and repeatably. For each scenario it reports requests
+per second, MB per second and p50/p99 request latency.
+
+Usage:
+    PYTHONPATH=src:. python benchmarks/bench_fetch.py [--files 32] [--size-kb 512]
+"""
+
+import argparse
+import json
+import math
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from radar_data.application.use_cases.fetch_use_case import FetchUseCase
+from radar_data.domain.entities import FetchResult
+from radar_data.infrastructure.net.concurrent_fetcher import ConcurrentFetcher
+from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+from radar_data.infrastructure.net.validator_store import ValidatorStore
+from tests.support.http_server import serve_files, synthetic_files
+
+
+@dataclass
+class BenchResult:
+    """Summary of one benchmark scenario.
+
+    Attributes:
+        scenario: Scenario name.
+        requests: Number of fetches performed.
+        errors: Number of fetches that failed after retries.
+        seconds: Wall-clock duration of the scenario.
+        requests_per_second: Completed fetches per second.
+        mb_per_second: Body megabytes downloaded per second.
+        p50_ms: Median fetch latency in milliseconds.
+        p99_ms: 99th percentile fetch latency in milliseconds.
+    """
+
+    scenario: str
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_second: float
+    mb_per_second: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def downloaded_bytes(result: FetchResult) -> int:
+    """Return the body bytes transferred by a fetch (0 for a 304)."""
+    metadata = result.metadata or {}
+    if metadata.get("Status") == "304":
+        return 0
+    return int(metadata.get("Content-Length") or 0)
+
+
+def run_scenario(name: str, fetch: Callable[[], Iterator[FetchResult]]) -> BenchResult:
+    """Run one scenario and summarize its results.
+
+    Args:
+        name: Scenario name.
+        fetch: Callable performing the fetches and yielding their results.
+
+    Returns:
+        BenchResult of the scenario.
+    """
+    started = time.perf_counter()
+    results = list(fetch())
+    seconds = time.perf_counter() - started
+    latencies = [result.elapsed_seconds * 1000 for result in results]
+    megabytes = sum(downloaded_bytes(result) for result in results) / 1e6
+    return BenchResult(
+        scenario=name,
+        requests=len(results),
+        errors=sum(not result.ok for result in results),
+        seconds=round(seconds, 3),
+        requests_per_second=round(len(results) / seconds, 1),
+        mb_per_second=round(megabytes / seconds, 2),
+        p50_ms=round(percentile(latencies, 50), 2),
+        p99_ms=round(percentile(latencies, 99), 2),
+    )
+
+
+def run_benchmarks(args: argparse.Namespace) -> list[BenchResult]:
+    """Run every scenario with the given settings.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        One BenchResult per scenario.
+    """
+    files = synthetic_files(args.files, args.size_kb * 1024)
+    bandwidth = args.bandwidth_mbps * 1e6 / 8 if args.bandwidth_mbps else None
+    results = []
+    with (
+        serve_files(files, latency=args.latency_ms / 1000, bandwidth=bandwidth) as (
+            base_url,
+            state,
+        ),
+        tempfile.TemporaryDirectory() as tmp,
+    ):
+        root = Path(tmp)
+
+        def targets(run: str) -> list[tuple[str, str]]:
+            return [(base_url + path, str(root / run / path.lstrip("/"))) for path in files]
+
+        for run in ("serial", "concurrent", "warm", "errors"):
+            (root / run).mkdir()
+
+        def use_case(fetcher: HttpFetcher, concurrent: bool) -> FetchUseCase:
+            if not concurrent:
+                return FetchUseCase(fetcher)
+            batch = ConcurrentFetcher(
+                fetcher, max_concurrency=args.concurrency, max_per_host=args.concurrency
+            )
+            return FetchUseCase(fetcher, batch)
+
+        # Cold runs keep no validators, so every fetch downloads the body.
+        cold = HttpFetcher(backoff_base=0.01)
+        # Conditional runs reuse validators from a warm-up pass and get 304s.
+        warm = HttpFetcher(validator_store=ValidatorStore(root / "warm"), backoff_base=0.01)
+        list(use_case(warm, concurrent=False).execute_many(targets("warm")))
+
+        scenarios = [
+            ("serial_cold", use_case(cold, False), "serial"),
+            ("concurrent_cold", use_case(cold, True), "concurrent"),
+            ("serial_conditional", use_case(warm, False), "warm"),
+            ("concurrent_conditional", use_case(warm, True), "warm"),
+        ]
+        flaky = use_case(cold, True)
+        for _ in range(args.repeat):
+            for name, case, run in scenarios:
+                results.append(run_scenario(name, lambda c=case, r=run: c.execute_many(targets(r))))
+            if args.error_rate:
+                state.error_rate = args.error_rate
+                results.append(
+                    run_scenario(
+                        "concurrent_with_errors",
+                        lambda: flaky.execute_many(targets("errors")),
+                    )
+                )
+                state.error_rate = 0.0
+    return results
+
+
+def main() -> None:
+    """CLI entry point for the fetch benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark the fetch layer offline")
+    parser.add_argument("--files", type=int, default=32, help="Number of files to serve")
+    parser.add_argument("--size-kb", type=int, default=512, help="Size of each file in KiB")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Server latency per request")
+    parser.add_argument(
+        "--bandwidth-mbps", type=float, default=0.0, help="Per-response bandwidth cap (0 = none)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.1, help="Share of requests answered with 500"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent fetches")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetitions of each scenario")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    if args.json:
+        for result in results:
+            print(json.dumps(asdict(result)))
+        return
+
+    header = (
+        f"{'scenario':<24}{'reqs':>6}{'errs':>6}"
+        f"{'req/s':>10}{'MB/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.scenario:<24}{r.requests:>6}{r.errors:>6}{r.requests_per_second:>10}"
+            f"{r.mb_per_second:>10}{r.p50_ms:>10}{r.p99_ms:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Normalization benchmarks on a synthetic daily series.
+
+Compares per-row dateutil parsing with the vectorized date column parser,
+per-row float() of Argentine-formatted values ("1.234,5") with the
+vectorized number coercion, and times MappingNormalizer end to end, reporting rows per second and
+the speedup over the baseline. The wide run normalizes the columns of a
+wide table (series sharing one monthly date axis) with one normalizer,
+so repeated date and value strings are served by its memo.
+
+Usage:
+    PYTHONPATH=src:. python benchmarks/bench_normalize.py [--rows 200000] [--format dmy] [--series 500]
+"""
+
+import argparse
+import json
+from datetime import date, timedelta
+
+import pyarrow as pa
+from dateutil import parser as date_parser
+
+from benchmarks.bench_parse import time_run
+from radar_data.infrastructure.normalize.dates import parse_date_column
+from radar_data.infrastructure.normalize.mapping import MappingNormalizer
+from radar_data.infrastructure.normalize.numbers import (
+    ARGENTINE,
+    DEFAULT_NULL_TOKENS,
+    coerce_numbers,
+)
+
+FORMATS = {"iso": "%Y-%m-%d", "dmy": "%d/%m/%Y", "excel": "%Y-%m-%dT%H:%M:%S"}
+CONFIG = {
+    "name": "Serie diaria",
+    "provider": "BCRA",
+    "normalize": {"internal_series_code": "BENCH", "unit": "USD", "frequency": "daily"},
+}
+
+
+def daily_records(rows: int, fmt: str) -> list[dict[str, str | float]]:
+    """Build raw records of a daily series with formatted dates."""
+    start = date(1800, 1, 1)
+    return [
+        {"date": (start + timedelta(days=n)).strftime(fmt), "value": f"{n}.5"} for n in range(rows)
+    ]
+
+
+def argentine_values(rows: int) -> list[str]:
+    """Build values formatted as "1.234.567,89", with some "s/d" placeholders."""
+    return [
+        "s/d" if n % 97 == 0 else f"{n * 1013.25:,.2f}".translate(str.maketrans(",.", ".,"))
+        for n in range(rows)
+    ]
+
+
+def float_per_row(values: list[str]) -> list[float | None]:
+    """Baseline: coerce Argentine-formatted values one by one, same rules."""
+    result: list[float | None] = []
+    for text in values:
+        text = text.strip()
+        if text.lower() in DEFAULT_NULL_TOKENS:
+            result.append(None)
+        else:
+            result.append(float(text.replace(" ", "").replace(".", "").replace(",", ".")))
+    return result
+
+
+def wide_table(series: int, months: int = 400) -> list[list[dict[str, str | float]]]:
+    """Build the records of series sharing one monthly date axis."""
+    periods = [f"{1900 + n // 12}-{n % 12 + 1:02d}" for n in range(months)]
+    return [
+        [{"date": period, "value": f"{(n * 7 + s) % 1000}.5"} for n, period in enumerate(periods)]
+        for s in range(series)
+    ]
+
+
+def normalize_wide(normalizer: MappingNormalizer, table: list[list[dict[str, str | float]]]) -> int:
+    """Normalize every series of a wide table, returning the observation count."""
+    return sum(len(normalizer.normalize(records, CONFIG)[1]) for records in table)
+
+
+def main() -> None:
+    """CLI entry point for the normalization benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark normalization offline")
+    parser.add_argument("--rows", type=int, default=200_000, help="Records in the series")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="dmy", help="Date format")
+    parser.add_argument("--series", type=int, default=500, help="Series of the wide run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per step (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    records = daily_records(args.rows, FORMATS[args.format])
+    dates = [record["date"] for record in records]
+    values = argentine_values(args.rows)
+    value_column = pa.array(values, pa.string())  # as read by CsvReader.read_table
+    table = wide_table(args.series)
+    normalizers: list[MappingNormalizer] = []
+
+    def fresh_normalizer() -> MappingNormalizer:
+        normalizers.append(MappingNormalizer())
+        return normalizers[-1]
+
+    runs = {
+        "dateutil_per_row": lambda: len(
+            [date_parser.parse(str(text), dayfirst=True) for text in dates]
+        ),
+        "date_column": lambda: len(parse_date_column(dates)),
+        "float_per_row": lambda: len(float_per_row(values)),
+        "value_column": lambda: len(coerce_numbers(values, ARGENTINE)),
+        "value_column_arrow": lambda: len(coerce_numbers(value_column, ARGENTINE)),
+        "normalize": lambda: len(MappingNormalizer().normalize(records, CONFIG)[1]),
+        "normalize_wide": lambda: normalize_wide(fresh_normalizer(), table),
+    }
+    results = {name: time_run(fn, args.repeat) for name, fn in runs.items()}
+
+    baseline = results["dateutil_per_row"][0] / len(dates)
+    for name, (seconds, rows) in results.items():
+        summary = {
+            "step": name,
+            "rows": rows,
+            "seconds": round(seconds, 4),
+            "rows_per_second": round(rows / seconds),
+            "speedup": round(baseline * rows / seconds, 1),
+        }
+        if args.json:
+            print(json.dumps(summary))
+        else:
+            print(
+                f"{name:<22}{rows:>10}{summary['seconds']:>10}s"
+                f"{summary['rows_per_second']:>14} rows/s{summary['speedup']:>8}x"
+            )
+
+    stats = normalizers[-1].memo.stats
+    memo = {"memo_hits": stats.hits, "memo_misses": stats.misses, "hit_rate": stats.hit_rate}
+    if args.json:
+        print(json.dumps(memo))
+    else:
+        print(f"memo (wide run): {stats.hits} hits, {stats.misses} misses, {stats.hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""CSV parse benchmarks on a synthetic wide provider file.
+
+Compares a row-by-row csv.DictReader baseline with CsvReader's record
+path, its memory-mapped record path, its Arrow columnar path and its
+byte-range parallel path, reporting rows per second and the speedup over
+the baseline.
+
+Usage:
+    PYTHONPATH=src:. python benchmarks/bench_parse.py [--rows 200000] [--columns 40] [--workers N]
+"""
+
+import argparse
+import csv
+import json
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from radar_data.infrastructure.parse.csv_reader import CsvReader
+
+CONFIG = {"source": {"columns": {"date": "fecha", "value": "valor"}}}
+
+
+def write_wide_csv(path: Path, rows: int, columns: int, seed: int = 0) -> None:
+    """Write a CSV with a date column, a value column and filler columns."""
+    rng = random.Random(seed)
+    fillers = [f"serie_{n}" for n in range(columns - 2)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["fecha", *fillers[: len(fillers) // 2], "valor", *fillers[len(fillers) // 2 :]]
+        )
+        for n in range(rows):
+            values = [f"{rng.uniform(0, 1000):.2f}" for _ in fillers]
+            half = len(values) // 2
+            writer.writerow([f"2024-01-{n % 28 + 1:02d}", *values[:half], f"{n}.5", *values[half:]])
+
+
+def dict_reader_baseline(path: Path) -> int:
+    """Parse the file row by row with csv.DictReader, as a baseline."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        records = [{"date": row["fecha"], "value": row["valor"]} for row in csv.DictReader(f)]
+    return len(records)
+
+
+def time_run(fn: Callable[[], int], repeat: int) -> tuple[float, int]:
+    """Return the best wall-clock time over repeat runs and the row count."""
+    best, rows = float("inf"), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, rows
+
+
+def main() -> None:
+    """CLI entry point for the parse benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark CSV parsing offline")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in the file")
+    parser.add_argument("--columns", type=int, default=40, help="Columns in the file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser (best is kept)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processes of the parallel path (default: CPUs)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "wide.csv"
+        write_wide_csv(path, args.rows, args.columns)
+        reader = CsvReader()
+        mapped = CsvReader(memory_map=True)
+        runs = {
+            "dict_reader": lambda: dict_reader_baseline(path),
+            "csv_reader_records": lambda: len(reader.parse(str(path), CONFIG)),
+            "csv_reader_mmap": lambda: len(mapped.parse(str(path), CONFIG)),
+            "csv_reader_arrow": lambda: reader.read_table(str(path), CONFIG).num_rows,
+            "csv_reader_parallel": lambda: (
+                reader.read_table_parallel(str(path), CONFIG, max_workers=args.workers).num_rows
+            ),
+        }
+        results = {name: time_run(fn, args.repeat) for name, fn in runs.items()}
+
+    baseline = results["dict_reader"][0]
+    for name, (seconds, rows) in results.items():
+        summary = {
+            "parser": name,
+            "rows": rows,
+            "seconds": round(seconds, 4),
+            "rows_per_second": round(rows / seconds),
+            "speedup": round(baseline / seconds, 1),
+        }
+        if args.json:
+            print(json.dumps(summary))
+        else:
+            print(
+                f"{name:<22}{rows:>10}{summary['seconds']:>10}s"
+                f"{summary['rows_per_second']:>14} rows/s{summary['speedup']:>8}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
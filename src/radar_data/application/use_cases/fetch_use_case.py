@@ -1,6 +1,10 @@
 """Use case for fetching files from remote sources."""
 
-from radar_data.domain.interfaces import FetcherPort
+import time
+from collections.abc import Iterator
+
+from radar_data.domain.entities import FetchResult
+from radar_data.domain.interfaces import BatchFetcherPort, FetcherPort
 
 
 class FetchUseCase:
@@ -8,22 +12,31 @@ class FetchUseCase:
 
     This use case coordinates the fetching of files from various sources
     using the FetcherPort interface. It handles configuration, error handling,
-    and result formatting.
+    and result formatting. Batches of sources are fetched concurrently when
+    a BatchFetcherPort is provided.
+
+    Conditional requests (ETag/Last-Modified) are handled by the fetcher
+    adapter, so unchanged sources return their previously fetched file.
 
     TODO:
-        - Implement fetch logic using FetcherPort.
-        - Add caching support (ETag/Last-Modified).
         - Add retry logic for failed downloads.
-        - Add support for batch fetching multiple datasets.
     """
 
-    def __init__(self, fetcher: FetcherPort) -> None:
+    def __init__(
+        self,
+        fetcher: FetcherPort,
+        batch_fetcher: BatchFetcherPort | None = None,
+    ) -> None:
         """Initialize the fetch use case.
 
         Args:
             fetcher: Implementation of FetcherPort to use for fetching.
+            batch_fetcher: Optional implementation of BatchFetcherPort used
+                by execute_many(). If None, batches are fetched serially
+                with fetcher.
         """
         self.fetcher = fetcher
+        self.batch_fetcher = batch_fetcher
 
     def execute(
         self,
@@ -46,14 +59,46 @@ class FetchUseCase:
             FileNotFoundError: If source_url cannot be accessed.
             PermissionError: If destination_path cannot be written to.
         """
-        # TODO: Implement fetch logic
-        # if use_metadata:
-        #     file_path, metadata = self.fetcher.fetch_with_metadata(
-        #         source_url, destination_path
-        #     )
-        #     return file_path, metadata
-        # else:
-        #     file_path = self.fetcher.fetch(source_url, destination_path)
-        #     return file_path, None
-        pass
+        if use_metadata:
+            file_path, metadata = self.fetcher.fetch_with_metadata(
+                source_url, destination_path
+            )
+            return file_path, metadata
+        return self.fetcher.fetch(source_url, destination_path), None
+
+    def execute_many(self, targets: list[tuple[str, str]]) -> Iterator[FetchResult]:
+        """Fetch a batch of sources, yielding results as each one finishes.
+
+        Args:
+            targets: List of (source_url, destination_path) pairs, typically
+                built from each dataset's source.url.
+
+        Returns:
+            Iterator of FetchResult, one per target. Failures are reported
+            through FetchResult.error so the rest of the batch continues.
+        """
+        if self.batch_fetcher is not None:
+            yield from self.batch_fetcher.fetch_many(targets)
+            return
 
+        for source_url, destination_path in targets:
+            started = time.perf_counter()
+            try:
+                file_path, metadata = self.fetcher.fetch_with_metadata(
+                    source_url, destination_path
+                )
+            except Exception as exc:  # reported per target, not raised
+                yield FetchResult(
+                    source_url=source_url,
+                    destination_path=destination_path,
+                    error=f"{type(exc).__name__}: {exc}",
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+                continue
+            yield FetchResult(
+                source_url=source_url,
+                destination_path=destination_path,
+                file_path=file_path,
+                metadata=metadata,
+                elapsed_seconds=time.perf_counter() - started,
+            )
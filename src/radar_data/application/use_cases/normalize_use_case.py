@@ -1,6 +1,7 @@
 """Use case for normalizing raw parsed data into domain entities."""
 
-from radar_data.domain.entities import Observation, Series
+from radar_data.domain.batch import ObservationData
+from radar_data.domain.entities import Series
 from radar_data.domain.interfaces import NormalizerPort
 
 
@@ -30,7 +31,7 @@ class NormalizeUseCase:
         self,
         raw_records: list[dict[str, str | float]],
         dataset_config: dict,
-    ) -> tuple[Series, list[Observation]]:
+    ) -> tuple[Series, ObservationData]:
         """Execute the normalization operation.
 
         Args:
@@ -39,7 +40,8 @@ class NormalizeUseCase:
                 (internal_series_code, unit, frequency).
 
         Returns:
-            Tuple of (Series, list[Observations]) representing the normalized data.
+            Tuple of (Series, observations) representing the normalized data;
+            observations are a list[Observation] or an ObservationBatch.
 
         Raises:
             ValueError: If normalization fails (e.g., missing required fields).
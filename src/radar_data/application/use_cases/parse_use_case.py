@@ -1,6 +1,14 @@
 """Use case for parsing raw files into structured data."""
 
-from radar_data.domain.interfaces import ParserPort
+import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any
+
+from radar_data import __version__
+from radar_data.domain.interfaces import ParseCachePort, ParserPort, StreamingParserPort
 
 
 class ParseUseCase:
@@ -8,22 +16,33 @@ class ParseUseCase:
 
     This use case coordinates the parsing of files into structured data
     using the ParserPort interface. It handles format detection, parser
-    selection, and result formatting.
+    selection, and result formatting. Parsers that also implement
+    StreamingParserPort can be consumed batch by batch, keeping memory
+    bounded by the batch size. Releases split across several files or
+    sheets can be parsed in a process pool with execute_parallel().
+
+    Format detection and plugin parsers are provided by passing a
+    ParserRegistry as the parser. With a ParseCachePort, results are
+    reused while the raw file, the parser and the source config block
+    are unchanged, so reruns skip parsing. When the parser delegates
+    (it has a parser_for() method, like ParserRegistry), the cache key
+    uses the identity of the parser selected for each file.
 
     TODO:
-        - Implement parse logic using ParserPort.
-        - Add parser registry/discovery for plugin parsers.
-        - Add format detection (CSV, Excel, ZIP).
         - Add validation of parsed records against schema.
     """
 
-    def __init__(self, parser: ParserPort) -> None:
+    def __init__(self, parser: ParserPort, cache: ParseCachePort | None = None) -> None:
         """Initialize the parse use case.
 
         Args:
             parser: Implementation of ParserPort to use for parsing.
+            cache: Optional cache of parsed records, used by execute()
+                and execute_parallel(), and by execute_batches() on hits.
         """
         self.parser = parser
+        self.cache = cache
+        self.parser_id = parser_identity(parser)
 
     def execute(self, file_path: str, dataset_config: dict) -> list[dict[str, str | float]]:
         """Execute the file parsing operation.
@@ -40,9 +59,181 @@ class ParseUseCase:
             ValueError: If file format is not supported or config is invalid.
             FileNotFoundError: If file_path does not exist.
         """
-        # TODO: Implement parse logic
-        # if not self.parser.supports(file_path):
-        #     raise ValueError(f"Parser does not support file: {file_path}")
-        # return self.parser.parse(file_path, dataset_config)
-        pass
+        if not self.parser.supports(file_path):
+            raise ValueError(f"Parser does not support file: {file_path}")
+        if self.cache is None:
+            return self.parser.parse(file_path, dataset_config)
+        source_config = dataset_config.get("source", {})
+        parser_id = self.parser_id_for(file_path, dataset_config)
+        records = self.cache.get(file_path, parser_id, source_config)
+        if records is None:
+            records = self.parser.parse(file_path, dataset_config)
+            self.cache.put(file_path, parser_id, source_config, records)
+        return records
+
+    def execute_batches(
+        self,
+        file_path: str,
+        dataset_config: dict,
+        batch_size: int = 10_000,
+    ) -> Iterator[list[dict[str, str | float]]]:
+        """Parse a file lazily, yielding batches of raw records.
+
+        Streaming parsers read the file incrementally. Other parsers
+        parse the whole file first and the result is split into batches,
+        so callers can use the same code path for every parser.
+
+        Args:
+            file_path: Path to the file to parse.
+            dataset_config: Configuration dict specifying sheet, columns,
+                start_cell, etc.
+            batch_size: Maximum number of records per batch.
+
+        Returns:
+            Iterator of record lists with at most batch_size records each.
+
+        Raises:
+            ValueError: If file format is not supported or config is invalid.
+            FileNotFoundError: If file_path does not exist.
+        """
+        if not self.parser.supports(file_path):
+            raise ValueError(f"Parser does not support file: {file_path}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.cache is not None:
+            source_config = dataset_config.get("source", {})
+            parser_id = self.parser_id_for(file_path, dataset_config)
+            cached = self.cache.get(file_path, parser_id, source_config)
+            if cached is not None:
+                return _chunked(cached, batch_size)
+        if isinstance(self.parser, StreamingParserPort):
+            return self.parser.iter_batches(file_path, dataset_config, batch_size)
+        return _chunked(self.parser.parse(file_path, dataset_config), batch_size)
+
+    def execute_parallel(
+        self,
+        units: list[tuple[str, str | None]],
+        dataset_config: dict,
+        max_workers: int | None = None,
+    ) -> list[dict[str, str | float]]:
+        """Parse several (file, sheet) units in worker processes.
+
+        Each unit is parsed with a copy of dataset_config whose
+        source.sheet is replaced by the unit's sheet (None keeps the
+        configured one). Records are concatenated in the order of units,
+        independent of which worker finishes first. The parser is pickled
+        into each worker, so it must be a plain picklable object. Units
+        found in the cache are not sent to the pool.
+
+        Args:
+            units: List of (file_path, sheet) pairs to parse.
+            dataset_config: Configuration dict shared by every unit.
+            max_workers: Maximum number of worker processes. Defaults to
+                the number of CPUs, capped at the number of units; with
+                one worker the units are parsed in this process.
+
+        Returns:
+            Records of all units, in unit order.
+
+        Raises:
+            ValueError: If a file format is not supported or config is invalid.
+            FileNotFoundError: If a file does not exist.
+        """
+        for file_path, _ in units:
+            if not self.parser.supports(file_path):
+                raise ValueError(f"Parser does not support file: {file_path}")
+        paths = [file_path for file_path, _ in units]
+        configs = [_unit_config(dataset_config, sheet) for _, sheet in units]
+        results: list[list[dict[str, str | float]] | None] = [None] * len(units)
+        parser_ids: list[str] = []
+        if self.cache is not None:
+            parser_ids = list(map(self.parser_id_for, paths, configs))
+            for index, (path, config) in enumerate(zip(paths, configs, strict=True)):
+                source_config = config.get("source", {})
+                results[index] = self.cache.get(path, parser_ids[index], source_config)
+        pending = [index for index, records in enumerate(results) if records is None]
+        pending_paths = [paths[index] for index in pending]
+        pending_configs = [configs[index] for index in pending]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            parsed = list(map(_parse_unit, repeat(self.parser), pending_paths, pending_configs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map() yields results in submission order.
+                parsed = list(
+                    executor.map(_parse_unit, repeat(self.parser), pending_paths, pending_configs)
+                )
+        for index, records in zip(pending, parsed, strict=True):
+            results[index] = records
+            if self.cache is not None:
+                source_config = configs[index].get("source", {})
+                self.cache.put(paths[index], parser_ids[index], source_config, records)
+        return [record for records in results for record in records or ()]
+
+    def parser_id_for(self, file_path: str, dataset_config: dict) -> str:
+        """Return the cache identity of the parser that will parse a file.
+
+        For a delegating parser such as ParserRegistry this is the
+        identity of the parser it selects, so upgrading a plugin or
+        changing its settings invalidates the cached results.
+
+        Args:
+            file_path: Path to the file to parse.
+            dataset_config: Configuration dict of the dataset.
+
+        Returns:
+            Identity string of the parser, see parser_identity().
+        """
+        parser_for = getattr(self.parser, "parser_for", None)
+        if parser_for is None:
+            return self.parser_id
+        return parser_identity(parser_for(file_path, dataset_config))
+
+
+def parser_identity(parser: ParserPort) -> str:
+    """Describe a parser's class, version and settings for cache keys.
+
+    The version is the parser's version attribute, if it has one, or the
+    package version. Settings are what the parser's cache_identity()
+    method returns, if it has one: only the settings that change the
+    parsed output (such as the delimiter or encoding), so that tuning
+    threads, block sizes or memory mapping keeps cached parses valid.
+
+    Args:
+        parser: Parser instance.
+
+    Returns:
+        Stable identity string.
+    """
+    cls = type(parser)
+    version = getattr(parser, "version", None) or __version__
+    cache_identity = getattr(parser, "cache_identity", None)
+    settings = cache_identity() if cache_identity is not None else {}
+    return f"{cls.__module__}.{cls.__qualname__}@{version} {json.dumps(settings, sort_keys=True)}"
+
+
+def _unit_config(dataset_config: dict, sheet: str | None) -> dict:
+    """Return dataset_config with source.sheet set to sheet, if given."""
+    if sheet is None:
+        return dataset_config
+    source = {**dataset_config.get("source", {}), "sheet": sheet}
+    return {**dataset_config, "source": source}
+
+
+def _parse_unit(
+    parser: ParserPort,
+    file_path: str,
+    dataset_config: dict[str, Any],
+) -> list[dict[str, str | float]]:
+    """Parse one unit; module level so it can run in a worker process."""
+    return parser.parse(file_path, dataset_config)
+
 
+def _chunked(
+    records: list[dict[str, str | float]],
+    batch_size: int,
+) -> Iterator[list[dict[str, str | float]]]:
+    """Split a list of records into consecutive batches."""
+    for start in range(0, len(records), batch_size):
+        yield records[start : start + batch_size]
@@ -1,6 +1,6 @@
 """Use case for data quality checks and cleaning."""
 
-from radar_data.domain.entities import Observation
+from radar_data.domain.batch import ObservationData
 from radar_data.domain.interfaces import CleanerPort
 
 
@@ -28,13 +28,13 @@ class QualityUseCase:
 
     def execute(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         quality_profile: dict,
-    ) -> tuple[list[Observation], dict[str, int]]:
+    ) -> tuple[ObservationData, dict[str, int]]:
         """Execute the quality check and cleaning operation.
 
         Args:
-            observations: List of observations to clean.
+            observations: Observations to clean, as a list or an ObservationBatch.
             quality_profile: Configuration dict specifying which checks
                 to run (continuity, outliers, range, etc.).
 
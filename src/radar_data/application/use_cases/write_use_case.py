@@ -1,6 +1,6 @@
 """Use case for writing normalized data to output formats."""
 
-from radar_data.domain.entities import Observation
+from radar_data.domain.batch import ObservationData
 from radar_data.domain.interfaces import SinkPort
 
 
@@ -28,7 +28,7 @@ class WriteUseCase:
 
     def execute(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
         format: str = "parquet",
         partition_by: str | None = None,
@@ -36,7 +36,7 @@ class WriteUseCase:
         """Execute the write operation.
 
         Args:
-            observations: List of observations to write.
+            observations: Observations to write, as a list or an ObservationBatch.
             output_path: Path where the file should be written.
             format: Output format ("parquet" or "csv").
             partition_by: Optional partition column (e.g., "series_code").
@@ -1,28 +1,38 @@
 """Domain layer: entities, value objects, and interfaces."""
 
-from radar_data.domain.entities import Observation, Provenance, Series
+from radar_data.domain.batch import ObservationBatch, ObservationData
+from radar_data.domain.entities import FetchResult, Observation, Provenance, Series
 from radar_data.domain.errors import (
     DomainError,
     InvalidObservationError,
     InvalidSeriesError,
 )
 from radar_data.domain.interfaces import (
+    BatchFetcherPort,
     CleanerPort,
     FetcherPort,
     NormalizerPort,
+    ParseCachePort,
     ParserPort,
     SinkPort,
+    StreamingParserPort,
 )
 
 __all__ = [
     "Series",
     "Observation",
+    "ObservationBatch",
+    "ObservationData",
     "Provenance",
+    "FetchResult",
     "DomainError",
     "InvalidSeriesError",
     "InvalidObservationError",
     "FetcherPort",
+    "BatchFetcherPort",
     "ParserPort",
+    "StreamingParserPort",
+    "ParseCachePort",
     "NormalizerPort",
     "CleanerPort",
     "SinkPort",
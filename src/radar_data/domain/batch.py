@@ -0,0 +1,199 @@
+"""Columnar batch of observations.
+
+An ObservationBatch holds observations as three aligned Arrow arrays
+instead of one Observation object per point: dictionary-encoded series
+codes, int64 timestamps (microseconds since the Unix epoch, naive like
+Observation.timestamp) and float64 values. Provenance is attached once
+per batch. A row costs about 20 bytes instead of the few hundred bytes of
+an Observation with its datetime and float objects.
+
+Ports that take observations accept either a list[Observation] or an
+ObservationBatch (ObservationData); iterating a batch yields Observation
+objects, so list-based code keeps working.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Union
+
+import pyarrow as pa
+
+from radar_data.domain.entities import Observation, Provenance
+from radar_data.domain.errors import InvalidObservationError
+
+TIMESTAMP_TYPE = pa.timestamp("us")
+SERIES_CODE_TYPE = pa.dictionary(pa.int32(), pa.string())
+SCHEMA = pa.schema(
+    [
+        ("series_code", SERIES_CODE_TYPE),
+        ("timestamp", TIMESTAMP_TYPE),
+        ("value", pa.float64()),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class ObservationBatch:
+    """Observations stored column-wise, sharing one Provenance.
+
+    Attributes:
+        series_codes: Dictionary-encoded series code of each observation.
+        timestamps: Timestamps as int64 microseconds since the Unix epoch.
+        values: Numeric values.
+        provenance: Optional provenance metadata shared by the batch.
+    """
+
+    series_codes: pa.DictionaryArray
+    timestamps: pa.Int64Array
+    values: pa.DoubleArray
+    provenance: Optional[Provenance] = None
+
+    def __post_init__(self) -> None:
+        """Check the column types, lengths and nulls.
+
+        Raises:
+            InvalidObservationError: If the columns are inconsistent.
+        """
+        if self.series_codes.type != SERIES_CODE_TYPE:
+            raise InvalidObservationError(f"series_codes must be {SERIES_CODE_TYPE}")
+        if self.timestamps.type != pa.int64() or self.values.type != pa.float64():
+            raise InvalidObservationError("timestamps must be int64 and values float64")
+        if not len(self.series_codes) == len(self.timestamps) == len(self.values):
+            raise InvalidObservationError("series_codes, timestamps and values differ in length")
+        for column in (self.series_codes, self.timestamps, self.values):
+            if column.null_count:
+                raise InvalidObservationError(
+                    "Observation batch columns cannot hold nulls",
+                    observation_index=column.is_null().index(True).as_py(),
+                )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        series_codes: Union[str, Sequence[str], pa.Array],
+        timestamps: Union[Sequence[datetime], pa.Array],
+        values: Union[Sequence[float], pa.Array],
+        provenance: Optional[Provenance] = None,
+    ) -> "ObservationBatch":
+        """Build a batch from columns.
+
+        Args:
+            series_codes: One code for the whole batch, or one per row.
+            timestamps: datetimes, an Arrow timestamp array, or int64
+                microseconds since the Unix epoch.
+            values: Numeric values.
+            provenance: Optional provenance metadata shared by the batch.
+
+        Returns:
+            ObservationBatch over the given columns.
+
+        Raises:
+            InvalidObservationError: If the columns are inconsistent.
+        """
+        if not isinstance(timestamps, pa.Array):
+            timestamps = pa.array(timestamps, type=TIMESTAMP_TYPE)
+        if pa.types.is_timestamp(timestamps.type):
+            timestamps = timestamps.cast(TIMESTAMP_TYPE)
+        timestamps = timestamps.cast(pa.int64())
+        values = (
+            values.cast(pa.float64())
+            if isinstance(values, pa.Array)
+            else pa.array(values, type=pa.float64())
+        )
+        if isinstance(series_codes, str):
+            indices = pa.nulls(len(timestamps), pa.int32()).fill_null(0)
+            codes = pa.DictionaryArray.from_arrays(indices, pa.array([series_codes]))
+        elif isinstance(series_codes, pa.DictionaryArray):
+            codes = series_codes.cast(SERIES_CODE_TYPE)
+        else:
+            if not isinstance(series_codes, pa.Array):
+                series_codes = pa.array(series_codes, type=pa.string())
+            codes = series_codes.cast(pa.string()).dictionary_encode()
+        return cls(codes, timestamps, values, provenance)
+
+    @classmethod
+    def from_observations(
+        cls,
+        observations: Sequence[Observation],
+        provenance: Optional[Provenance] = None,
+    ) -> "ObservationBatch":
+        """Build a batch from Observation objects.
+
+        Args:
+            observations: Observations to store.
+            provenance: Provenance of the batch; defaults to the one
+                shared by the observations.
+
+        Returns:
+            ObservationBatch holding the observations.
+
+        Raises:
+            InvalidObservationError: If no provenance is given and the
+                observations carry different ones.
+        """
+        if provenance is None:
+            provenances = {obs.provenance for obs in observations}
+            if len(provenances) > 1:
+                raise InvalidObservationError("Observations carry different provenances")
+            provenance = provenances.pop() if provenances else None
+        return cls.from_arrays(
+            [obs.series_code for obs in observations],
+            [obs.timestamp for obs in observations],
+            [obs.value for obs in observations],
+            provenance,
+        )
+
+    @classmethod
+    def from_table(
+        cls, table: pa.Table, provenance: Optional[Provenance] = None
+    ) -> "ObservationBatch":
+        """Build a batch from a table with series_code, timestamp and value columns."""
+        return cls.from_arrays(
+            table.column("series_code").combine_chunks(),
+            table.column("timestamp").combine_chunks(),
+            table.column("value").combine_chunks(),
+            provenance,
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Observation]:
+        """Yield the observations as Observation objects."""
+        timestamps = self.timestamps.view(TIMESTAMP_TYPE).to_pylist()
+        for code, timestamp, value in zip(
+            self.series_codes.to_pylist(), timestamps, self.values.to_pylist(), strict=True
+        ):
+            yield Observation(code, timestamp, value, self.provenance)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers."""
+        nbytes: int = self.series_codes.nbytes + self.timestamps.nbytes + self.values.nbytes
+        return nbytes
+
+    def to_observations(self) -> list[Observation]:
+        """Convert the batch to Observation objects."""
+        return list(self)
+
+    def to_table(self) -> pa.Table:
+        """Return the batch as a table with series_code, timestamp and value columns."""
+        return pa.Table.from_arrays(
+            [self.series_codes, self.timestamps.view(TIMESTAMP_TYPE), self.values],
+            schema=SCHEMA,
+        )
+
+    def filter(self, mask: Union[pa.BooleanArray, Sequence[bool]]) -> "ObservationBatch":
+        """Return the observations selected by mask, keeping the provenance."""
+        mask = mask if isinstance(mask, pa.Array) else pa.array(mask, type=pa.bool_())
+        return ObservationBatch(
+            self.series_codes.filter(mask),
+            self.timestamps.filter(mask),
+            self.values.filter(mask),
+            self.provenance,
+        )
+
+
+# Observations as accepted by the ports: the list form or the columnar form.
+ObservationData = Union[list[Observation], ObservationBatch]
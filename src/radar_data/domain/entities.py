@@ -88,3 +88,56 @@ class Provenance:
         """TODO: Add domain validation logic."""
         pass
 
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of fetching a single source as part of a batch.
+
+    Attributes:
+        source_url: URL or path that was requested.
+        destination_path: Local path requested for the download.
+        file_path: Path of the fetched file, or None if the fetch failed.
+        metadata: Optional response metadata (ETag, Last-Modified, etc.).
+        error: Error message if the fetch failed, None otherwise.
+        elapsed_seconds: Wall-clock time spent on this fetch.
+    """
+
+    source_url: str
+    destination_path: str
+    file_path: Optional[str] = None
+    metadata: Optional[dict[str, str]] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fetch completed successfully."""
+        return self.error is None and self.file_path is not None
+
+    @property
+    def file_hash(self) -> Optional[str]:
+        """Content hash of the fetched file, if reported by the fetcher."""
+        if not self.metadata:
+            return None
+        return self.metadata.get("Content-Hash") or None
+
+    def to_provenance(
+        self,
+        dataset_id: str,
+        fetched_at: Optional[datetime] = None,
+    ) -> Provenance:
+        """Build the Provenance record for this fetch.
+
+        Args:
+            dataset_id: Identifier of the dataset configuration used.
+            fetched_at: Fetch timestamp; defaults to the current time.
+
+        Returns:
+            Provenance with source_url and file_hash filled in.
+        """
+        return Provenance(
+            source_url=self.source_url,
+            fetched_at=fetched_at or datetime.now(),
+            dataset_id=dataset_id,
+            file_hash=self.file_hash,
+        )
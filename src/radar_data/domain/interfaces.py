@@ -5,9 +5,11 @@ must implement. They follow Clean Architecture principles where
 the domain layer defines interfaces, and infrastructure implements them.
 """
 
-from typing import Optional, Protocol, runtime_checkable
+from collections.abc import Iterator
+from typing import IO, Optional, Protocol, runtime_checkable
 
-from radar_data.domain.entities import Observation, Series
+from radar_data.domain.batch import ObservationData
+from radar_data.domain.entities import FetchResult, Observation, Series
 
 
 @runtime_checkable
@@ -53,6 +55,29 @@ class FetcherPort(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchFetcherPort(Protocol):
+    """Port for fetching many files concurrently.
+
+    Implementations should download independent sources in parallel and
+    yield results in completion order, so callers can start processing
+    the first files while slower sources are still downloading.
+    """
+
+    def fetch_many(self, targets: list[tuple[str, str]]) -> Iterator[FetchResult]:
+        """Fetch a batch of files, yielding each result as it completes.
+
+        Args:
+            targets: List of (source_url, destination_path) pairs.
+
+        Returns:
+            Iterator of FetchResult, one per target, in completion order.
+            Failed fetches are reported through FetchResult.error rather
+            than raised, so one bad source does not abort the batch.
+        """
+        ...
+
+
 @runtime_checkable
 class ParserPort(Protocol):
     """Port for parsing raw files into structured data.
@@ -95,20 +120,132 @@ class ParserPort(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingParserPort(Protocol):
+    """Port for parsing raw files into bounded batches of records.
+
+    Implementations read the file incrementally and yield records in
+    fixed-size batches, so memory use is bounded by the batch size
+    rather than the file size. They also parse binary streams that are
+    not files on disk, such as archive members.
+    """
+
+    def iter_batches(
+        self,
+        file_path: str,
+        dataset_config: dict,
+        batch_size: int = 10_000,
+    ) -> Iterator[list[dict[str, str | float]]]:
+        """Parse a file lazily into batches of raw records.
+
+        Args:
+            file_path: Path to the file to parse.
+            dataset_config: Configuration dict specifying sheet, columns,
+                start_cell, etc.
+            batch_size: Maximum number of records per batch.
+
+        Returns:
+            Iterator of record lists with at most batch_size records each,
+            in file order. Records have the same shape as ParserPort.parse.
+
+        Raises:
+            ValueError: If file format is not supported or config is invalid.
+            FileNotFoundError: If file_path does not exist.
+        """
+        ...
+
+    def parse_stream(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict,
+    ) -> list[dict[str, str | float]]:
+        """Parse the content of a binary stream into raw records.
+
+        Args:
+            stream: Readable binary stream positioned at the start of the content.
+            dataset_config: Configuration dict specifying sheet, columns,
+                start_cell, etc.
+
+        Returns:
+            List of dictionaries, with the same shape as ParserPort.parse.
+
+        Raises:
+            ValueError: If config is invalid or the content cannot be parsed.
+        """
+        ...
+
+    def supports(self, file_path: str) -> bool:
+        """Check if this parser supports the given file type.
+
+        Args:
+            file_path: Path to the file to check.
+
+        Returns:
+            True if this parser can handle the file, False otherwise.
+        """
+        ...
+
+
+@runtime_checkable
+class ParseCachePort(Protocol):
+    """Port for caching parsed records across runs.
+
+    Entries are keyed by the content of the raw file, the identity and
+    version of the parser, and the dataset's source configuration, so a
+    cached result is reused only when all three are unchanged.
+    """
+
+    def get(
+        self,
+        file_path: str,
+        parser_id: str,
+        source_config: dict,
+    ) -> Optional[list[dict[str, str | float]]]:
+        """Look up the parsed records of a file.
+
+        Args:
+            file_path: Path to the raw file.
+            parser_id: Identity and version of the parser.
+            source_config: The dataset's source configuration block.
+
+        Returns:
+            The cached records, or None if there is no entry.
+        """
+        ...
+
+    def put(
+        self,
+        file_path: str,
+        parser_id: str,
+        source_config: dict,
+        records: list[dict[str, str | float]],
+    ) -> None:
+        """Store the parsed records of a file.
+
+        Args:
+            file_path: Path to the raw file.
+            parser_id: Identity and version of the parser.
+            source_config: The dataset's source configuration block.
+            records: Records returned by the parser.
+        """
+        ...
+
+
 @runtime_checkable
 class NormalizerPort(Protocol):
     """Port for normalizing raw parsed data into domain entities.
 
     Implementations should map external column names to internal schema,
     handle unit conversions, date parsing, and create Series/Observation
-    entities.
+    entities. Observations may be returned as a list or as a columnar
+    ObservationBatch.
     """
 
     def normalize(
         self,
         raw_records: list[dict[str, str | float]],
         dataset_config: dict,
-    ) -> tuple[Series, list[Observation]]:
+    ) -> tuple[Series, ObservationData]:
         """Normalize raw records into domain entities.
 
         Args:
@@ -117,7 +254,8 @@ class NormalizerPort(Protocol):
                 (internal_series_code, unit, frequency).
 
         Returns:
-            Tuple of (Series, list[Observations]) representing the normalized data.
+            Tuple of (Series, observations) representing the normalized data;
+            observations are a list[Observation] or an ObservationBatch.
 
         Raises:
             ValueError: If normalization fails (e.g., missing required fields).
@@ -130,18 +268,19 @@ class CleanerPort(Protocol):
     """Port for data quality checks and cleaning.
 
     Implementations should perform continuity checks, outlier detection,
-    range validation, and other quality rules.
+    range validation, and other quality rules. clean() accepts a list
+    of observations or an ObservationBatch and returns the same form.
     """
 
     def clean(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         quality_profile: dict,
-    ) -> tuple[list[Observation], dict[str, int]]:
+    ) -> tuple[ObservationData, dict[str, int]]:
         """Apply quality checks and cleaning rules to observations.
 
         Args:
-            observations: List of observations to clean.
+            observations: Observations to clean, as a list or an ObservationBatch.
             quality_profile: Configuration dict specifying which checks
                 to run (continuity, outliers, range, etc.).
 
@@ -189,18 +328,20 @@ class SinkPort(Protocol):
     """Port for writing normalized data to output formats.
 
     Implementations should handle Parquet, CSV, and potentially other formats.
+    Observations are given as a list or as an ObservationBatch, whose
+    to_table() maps directly onto the output schema.
     """
 
     def write_parquet(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
         partition_by: Optional[str] = None,
     ) -> str:
         """Write observations to a Parquet file.
 
         Args:
-            observations: List of observations to write.
+            observations: Observations to write, as a list or an ObservationBatch.
             output_path: Path where the Parquet file should be written.
             partition_by: Optional partition column (e.g., "series_code").
 
@@ -211,13 +352,13 @@ class SinkPort(Protocol):
 
     def write_csv(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
     ) -> str:
         """Write observations to a CSV file.
 
         Args:
-            observations: List of observations to write.
+            observations: Observations to write, as a list or an ObservationBatch.
             output_path: Path where the CSV file should be written.
 
         Returns:
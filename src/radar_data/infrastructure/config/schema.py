@@ -18,6 +18,9 @@ class SourceConfig(BaseModel):
         sheet: Optional sheet name for Excel files.
         start_cell: Optional starting cell (e.g., "A2").
         columns: Column mapping for date and value fields.
+        member: Optional glob selecting members of a ZIP/GZIP archive.
+        parser: Optional name of a registered parser (e.g., a plugin)
+            used instead of format detection.
     """
 
     type: str = Field(..., description="Source type (e.g., 'static_url')")
@@ -25,6 +28,8 @@ class SourceConfig(BaseModel):
     sheet: Optional[str] = Field(None, description="Sheet name for Excel files")
     start_cell: Optional[str] = Field(None, description="Starting cell (e.g., 'A2')")
     columns: dict[str, str] = Field(..., description="Column mapping for date and value")
+    member: Optional[str] = Field(None, description="Glob selecting archive members")
+    parser: Optional[str] = Field(None, description="Registered parser name")
 
 
 class NormalizeConfig(BaseModel):
@@ -34,11 +39,25 @@ class NormalizeConfig(BaseModel):
         internal_series_code: Internal identifier for the series.
         unit: Unit of measurement (e.g., "USD", "index_base_100").
         frequency: Data frequency ("daily", "monthly", etc.).
+        date_format: Optional strptime format of the date column; inferred
+            from the data when omitted.
+        decimal_separator: Optional decimal separator of the values ("," for
+            "1.234,5"); inferred from the data when omitted.
+        thousands_separator: Optional thousands separator ("" for none);
+            implied by decimal_separator when omitted.
+        null_tokens: Optional placeholders read as missing values, replacing
+            the defaults ("-", "s/d", "///", ...).
     """
 
     internal_series_code: str = Field(..., description="Internal series identifier")
     unit: str = Field(..., description="Unit of measurement")
     frequency: str = Field(..., description="Data frequency")
+    date_format: Optional[str] = Field(None, description="strptime format of the dates")
+    decimal_separator: Optional[str] = Field(None, description="Decimal separator of the values")
+    thousands_separator: Optional[str] = Field(
+        None, description="Thousands separator of the values"
+    )
+    null_tokens: Optional[list[str]] = Field(None, description="Placeholders for missing values")
 
 
 class DatasetConfig(BaseModel):
@@ -0,0 +1,191 @@
+"""Content-addressed store for fetched raw files.
+
+Files are stored once per SHA-256 digest, so identical payloads that
+are republished under different URLs or names share a single blob.
+An optional byte budget evicts the least recently used blobs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+INDEX_FILENAME = "index.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    """A file held in the content store.
+
+    Attributes:
+        digest: SHA-256 hex digest of the file content.
+        path: Local path of the blob.
+        size: Size of the blob in bytes.
+    """
+
+    digest: str
+    path: str
+    size: int
+
+
+def hash_file(path: str | Path) -> str:
+    """Compute the SHA-256 hex digest of a file in fixed-size chunks.
+
+    Args:
+        path: Path of the file to hash.
+
+    Returns:
+        Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """Content-addressed blob store with size-bounded LRU eviction.
+
+    Blobs live at root_dir/objects/<digest[:2]>/<digest><suffix>, keeping
+    the file suffix of the first payload stored so extension-based parser
+    selection keeps working. An index at root_dir/index.json records blob
+    sizes in least-to-most recently used order.
+    """
+
+    def __init__(self, root_dir: str | Path, max_bytes: int | None = None) -> None:
+        """Initialize the content store.
+
+        Args:
+            root_dir: Directory holding the blobs and the index.
+            max_bytes: Optional byte budget. When the stored blobs exceed
+                it, least recently used blobs are evicted.
+        """
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.index_path = self.root_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._blobs: OrderedDict[str, StoredBlob] = self._load()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all stored blobs in bytes."""
+        with self._lock:
+            return sum(blob.size for blob in self._blobs.values())
+
+    def put_file(self, path: str | Path, digest: str | None = None) -> StoredBlob:
+        """Move a file into the store, deduplicating by content.
+
+        If a blob with the same digest already exists, the file is
+        removed and the existing blob is returned.
+
+        Args:
+            path: Path of the file to store. It is moved, not copied.
+            digest: Optional precomputed SHA-256 hex digest of the file.
+
+        Returns:
+            StoredBlob describing the stored content.
+        """
+        source = Path(path)
+        digest = digest or hash_file(source)
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is not None and Path(blob.path).exists():
+                source.unlink()
+                self._blobs.move_to_end(digest)
+            else:
+                blob_path = self._blob_path(digest, source.suffix)
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, blob_path)
+                blob = StoredBlob(digest=digest, path=str(blob_path), size=blob_path.stat().st_size)
+                self._blobs[digest] = blob
+            self._evict(keep=digest)
+            self._save()
+        return blob
+
+    def contains(self, digest: str) -> bool:
+        """Check whether content is stored, without marking it as used.
+
+        Args:
+            digest: SHA-256 hex digest of the content.
+
+        Returns:
+            True if a blob with this digest exists on disk.
+        """
+        with self._lock:
+            blob = self._blobs.get(digest)
+            return blob is not None and Path(blob.path).exists()
+
+    def get(self, digest: str) -> StoredBlob | None:
+        """Look up a blob by digest and mark it as recently used.
+
+        Args:
+            digest: SHA-256 hex digest of the content.
+
+        Returns:
+            StoredBlob, or None if the digest is not stored.
+        """
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is None:
+                return None
+            if not Path(blob.path).exists():
+                del self._blobs[digest]
+                self._save()
+                return None
+            self._blobs.move_to_end(digest)
+            self._save()
+            return blob
+
+    def _blob_path(self, digest: str, suffix: str) -> Path:
+        """Return the path where a blob with this digest is stored."""
+        return self.root_dir / "objects" / digest[:2] / f"{digest}{suffix.lower()}"
+
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used blobs until within budget.
+
+        The blob identified by keep is never evicted, so a single blob
+        larger than the budget can still be stored. Caller must hold the lock.
+        """
+        if self.max_bytes is None:
+            return
+        total = sum(blob.size for blob in self._blobs.values())
+        for digest in list(self._blobs):
+            if total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            blob = self._blobs.pop(digest)
+            Path(blob.path).unlink(missing_ok=True)
+            total -= blob.size
+
+    def _load(self) -> OrderedDict[str, StoredBlob]:
+        """Load the index from disk, returning an empty index if missing."""
+        if not self.index_path.exists():
+            return OrderedDict()
+        with open(self.index_path, encoding="utf-8") as f:
+            raw = json.load(f)
+        return OrderedDict((entry["digest"], StoredBlob(**entry)) for entry in raw["blobs"])
+
+    def _save(self) -> None:
+        """Atomically rewrite the index. Caller must hold the lock."""
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "blobs": [
+                {"digest": blob.digest, "path": blob.path, "size": blob.size}
+                for blob in self._blobs.values()
+            ]
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
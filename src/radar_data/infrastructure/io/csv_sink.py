@@ -4,7 +4,7 @@ from csv import DictWriter
 from pathlib import Path
 from typing import Optional
 
-from radar_data.domain.entities import Observation
+from radar_data.domain.batch import ObservationData
 from radar_data.domain.interfaces import SinkPort
 
 
@@ -34,13 +34,13 @@ class CsvSink(SinkPort):
 
     def write_csv(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
     ) -> str:
         """Write observations to a CSV file.
 
         Args:
-            observations: List of observations to write.
+            observations: Observations to write, as a list or an ObservationBatch.
             output_path: Path where the CSV file should be written.
 
         Returns:
@@ -51,7 +51,8 @@ class CsvSink(SinkPort):
             ValueError: If observations list is empty.
 
         TODO:
-            - Convert observations to CSV rows.
+            - Convert observations to CSV rows (iterate ObservationBatch rows or
+              write its to_table() with pyarrow.csv).
             - Write with proper formatting (dates, numbers).
             - Include header row if include_header is True.
         """
@@ -80,7 +81,7 @@ class CsvSink(SinkPort):
 
     def write_parquet(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
         partition_by: Optional[str] = None,
     ) -> str:
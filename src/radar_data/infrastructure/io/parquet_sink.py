@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from radar_data.domain.entities import Observation
+from radar_data.domain.batch import ObservationData
 from radar_data.domain.interfaces import SinkPort
 
 
@@ -30,14 +30,14 @@ class ParquetSink(SinkPort):
 
     def write_parquet(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
         partition_by: Optional[str] = None,
     ) -> str:
         """Write observations to a Parquet file.
 
         Args:
-            observations: List of observations to write.
+            observations: Observations to write, as a list or an ObservationBatch.
             output_path: Path where the Parquet file should be written.
             partition_by: Optional partition column (e.g., "series_code").
 
@@ -49,7 +49,8 @@ class ParquetSink(SinkPort):
             ValueError: If observations list is empty.
 
         TODO:
-            - Convert observations to PyArrow table.
+            - Convert observations to PyArrow table (ObservationBatch.to_table()
+              for batches, without per-row conversion).
             - Define schema (series_code: string, timestamp: timestamp, value: float).
             - Write to Parquet with specified compression.
             - Handle partitioning if partition_by is specified.
@@ -86,7 +87,7 @@ class ParquetSink(SinkPort):
 
     def write_csv(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         output_path: str,
     ) -> str:
         """Write observations to a CSV file (not implemented for Parquet sink).
@@ -0,0 +1,212 @@
+"""Arrow IPC cache of parsed records.
+
+Each entry is an Arrow IPC file named by the SHA-256 of the raw file's
+content digest, the parser identity and the source configuration block.
+Unchanged files are therefore loaded instead of parsed again, while a
+new file version, a parser upgrade or an edit to the source block all
+miss. Edits to other parts of a dataset config (normalize, quality) do
+not affect the key.
+
+Entries are read back through a memory map. Hits refresh an entry's
+modification time, and an optional byte budget evicts the least recently
+used entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pyarrow as pa
+
+from radar_data.domain.interfaces import ParseCachePort
+from radar_data.infrastructure.io.content_store import hash_file
+
+CACHE_SUFFIX = ".arrow"
+# Suffix of the float64 column holding numeric values of a record key.
+_NUMERIC = ":num"
+
+
+class ArrowParseCache(ParseCachePort):
+    """Size-bounded on-disk cache of parsed records in Arrow IPC files."""
+
+    def __init__(self, root_dir: str | Path, max_bytes: int | None = None) -> None:
+        """Initialize the parse cache.
+
+        Args:
+            root_dir: Directory holding the cache entries.
+            max_bytes: Optional byte budget. When the entries exceed it,
+                least recently used entries are evicted.
+        """
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def key(self, file_path: str, parser_id: str, source_config: dict) -> str:
+        """Compute the cache key of a parse.
+
+        Args:
+            file_path: Path to the raw file.
+            parser_id: Identity and version of the parser.
+            source_config: The dataset's source configuration block.
+
+        Returns:
+            SHA-256 hex digest identifying the parse.
+
+        Raises:
+            FileNotFoundError: If file_path does not exist.
+        """
+        payload = json.dumps(
+            {
+                "content": self._content_digest(file_path),
+                "parser": parser_id,
+                "source": source_config,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        file_path: str,
+        parser_id: str,
+        source_config: dict,
+    ) -> list[dict[str, str | float]] | None:
+        """Load cached records of a file, if present.
+
+        Args:
+            file_path: Path to the raw file.
+            parser_id: Identity and version of the parser.
+            source_config: The dataset's source configuration block.
+
+        Returns:
+            The cached records, or None on a miss.
+        """
+        path = self._entry_path(self.key(file_path, parser_id, source_config))
+        try:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return _table_to_records(table)
+
+    def put(
+        self,
+        file_path: str,
+        parser_id: str,
+        source_config: dict,
+        records: list[dict[str, str | float]],
+    ) -> None:
+        """Store the records of a file, then evict entries over budget.
+
+        Args:
+            file_path: Path to the raw file.
+            parser_id: Identity and version of the parser.
+            source_config: The dataset's source configuration block.
+            records: Records returned by the parser.
+        """
+        path = self._entry_path(self.key(file_path, parser_id, source_config))
+        table = _records_to_table(records)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._evict(keep=path)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root_dir / f"{key}{CACHE_SUFFIX}"
+
+    def _content_digest(self, file_path: str) -> str:
+        """Return the content digest of a file, rehashing only when it changed."""
+        stat = Path(file_path).stat()
+        key = (str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            digest = hash_file(file_path)
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """List (path, size, mtime) of the cache entries."""
+        entries = []
+        for path in self.root_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used entries until the budget is met."""
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _records_to_table(records: list[dict[str, str | float]]) -> pa.Table:
+    """Encode records as a table with a string and a float64 column per key.
+
+    Values may be strings or numbers within the same key (e.g. Excel
+    cells), so each key keeps its text values in one column and its
+    numeric values in another; the other column is null for that row.
+    """
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    columns: dict[str, pa.Array] = {}
+    for key in keys:
+        values = [record.get(key) for record in records]
+        columns[key] = pa.array(
+            [value if isinstance(value, str) else None for value in values], pa.string()
+        )
+        columns[key + _NUMERIC] = pa.array(
+            [None if value is None or isinstance(value, str) else value for value in values],
+            pa.float64(),
+        )
+    return pa.table(columns)
+
+
+def _table_to_records(table: pa.Table) -> list[dict[str, str | float]]:
+    """Decode a table written by _records_to_table."""
+    keys = [name for name in table.column_names if not name.endswith(_NUMERIC)]
+    columns = [
+        (key, table.column(key).to_pylist(), table.column(key + _NUMERIC).to_pylist())
+        for key in keys
+    ]
+    records: list[dict[str, str | float]] = []
+    for row in range(table.num_rows):
+        record: dict[str, str | float] = {}
+        for key, texts, numbers in columns:
+            if numbers[row] is not None:
+                record[key] = numbers[row]
+            elif texts[row] is not None:
+                record[key] = texts[row]
+        records.append(record)
+    return records
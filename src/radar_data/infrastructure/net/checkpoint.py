@@ -0,0 +1,133 @@
+"""Partial-download checkpoints for resumable HTTP transfers.
+
+A checkpoint records which byte ranges of a download have already been
+written to the partial file, together with the validator identifying
+the representation being downloaded, so an interrupted transfer can be
+resumed with Range/If-Range requests instead of restarting from zero.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class Segment:
+    """A byte range of a download and how much of it has been written.
+
+    Attributes:
+        start: Offset of the first byte of the range.
+        end: Offset one past the last byte, or None if the size is unknown.
+        written: Number of bytes of the range already written.
+    """
+
+    start: int
+    end: int | None = None
+    written: int = 0
+
+    @property
+    def offset(self) -> int:
+        """Absolute offset of the next byte to write."""
+        return self.start + self.written
+
+    @property
+    def done(self) -> bool:
+        """Whether every byte of the range has been written."""
+        return self.end is not None and self.offset >= self.end
+
+    def range_header(self) -> str:
+        """Build the Range header value requesting the remaining bytes."""
+        if self.end is None:
+            return f"bytes={self.offset}-"
+        return f"bytes={self.offset}-{self.end - 1}"
+
+
+@dataclass
+class DownloadCheckpoint:
+    """Progress of a download written to a partial file.
+
+    Attributes:
+        source_url: URL being downloaded.
+        validator: Strong ETag or Last-Modified value used as If-Range, so
+            a resumed request fails over to a full download if the
+            representation changed in the meantime.
+        total_size: Total size in bytes, or None if unknown.
+        segments: Byte ranges making up the download.
+    """
+
+    source_url: str
+    validator: str
+    total_size: int | None
+    segments: list[Segment] = field(default_factory=list)
+
+    @classmethod
+    def create(
+        cls,
+        source_url: str,
+        validator: str,
+        total_size: int | None,
+        num_segments: int = 1,
+    ) -> "DownloadCheckpoint":
+        """Create a checkpoint splitting the download into equal segments.
+
+        Args:
+            source_url: URL being downloaded.
+            validator: If-Range validator of the representation.
+            total_size: Total size in bytes, or None if unknown.
+            num_segments: Number of segments; forced to 1 if size is unknown.
+
+        Returns:
+            New DownloadCheckpoint with no bytes written.
+        """
+        if total_size is None or num_segments <= 1:
+            return cls(source_url, validator, total_size, [Segment(0, total_size)])
+        step = -(-total_size // num_segments)
+        segments = [
+            Segment(start, min(start + step, total_size)) for start in range(0, total_size, step)
+        ]
+        return cls(source_url, validator, total_size, segments)
+
+    @property
+    def written(self) -> int:
+        """Total number of bytes written across all segments."""
+        return sum(segment.written for segment in self.segments)
+
+    def pending(self) -> list[Segment]:
+        """Return the segments that still have bytes to download."""
+        return [segment for segment in self.segments if not segment.done]
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DownloadCheckpoint | None":
+        """Load a checkpoint from disk.
+
+        Args:
+            path: Path of the checkpoint file.
+
+        Returns:
+            DownloadCheckpoint, or None if missing or unreadable.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+            raw["segments"] = [Segment(**segment) for segment in raw["segments"]]
+            return cls(**raw)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the checkpoint to disk.
+
+        Args:
+            path: Path of the checkpoint file.
+        """
+        target = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(self), f)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,166 @@
+"""Concurrent fetch engine implementing BatchFetcherPort.
+
+Drives many blocking FetcherPort calls from an asyncio event loop,
+capping the total number of in-flight requests and the number of
+requests per host, and yields results as each download finishes.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from radar_data.domain.entities import FetchResult
+from radar_data.domain.interfaces import BatchFetcherPort, FetcherPort
+from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+
+
+class ConcurrentFetcher(BatchFetcherPort):
+    """Adapter for fetching many sources concurrently.
+
+    Each download runs the wrapped FetcherPort in a worker thread while
+    an asyncio event loop schedules them. A global semaphore bounds the
+    total number of in-flight requests and a per-host semaphore keeps
+    any single provider from receiving more than max_per_host requests
+    at a time. The wall-clock time of a batch is therefore bounded by
+    its slowest sources rather than the sum of all of them.
+    """
+
+    def __init__(
+        self,
+        fetcher: FetcherPort | None = None,
+        max_concurrency: int = 16,
+        max_per_host: int = 4,
+        use_metadata: bool = True,
+    ) -> None:
+        """Initialize the concurrent fetcher.
+
+        Args:
+            fetcher: FetcherPort used for each individual download.
+                Defaults to an HttpFetcher with default settings.
+            max_concurrency: Maximum number of requests in flight overall.
+            max_per_host: Maximum number of requests in flight per host.
+            use_metadata: If True, use fetch_with_metadata and attach the
+                metadata (including the content hash) to each FetchResult.
+
+        Raises:
+            ValueError: If max_concurrency or max_per_host is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1")
+        self.fetcher = fetcher if fetcher is not None else HttpFetcher()
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.use_metadata = use_metadata
+
+    def fetch_many(self, targets: list[tuple[str, str]]) -> Iterator[FetchResult]:
+        """Fetch a batch of files, yielding each result as it completes.
+
+        Drives iter_completed() on a private event loop, so it can be
+        called from synchronous code. Downloads keep progressing in
+        worker threads while the caller handles each yielded result.
+
+        Args:
+            targets: List of (source_url, destination_path) pairs.
+
+        Returns:
+            Iterator of FetchResult in completion order.
+        """
+        loop = asyncio.new_event_loop()
+        results = self.iter_completed(targets)
+        try:
+            while True:
+                try:
+                    result = loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield result
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+
+    async def iter_completed(
+        self,
+        targets: list[tuple[str, str]],
+    ) -> AsyncGenerator[FetchResult, None]:
+        """Fetch a batch of files from a running event loop.
+
+        Args:
+            targets: List of (source_url, destination_path) pairs.
+
+        Yields:
+            FetchResult for each target, in completion order.
+        """
+        if not targets:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(targets)),
+            thread_name_prefix="radar-fetch",
+        )
+        in_flight = asyncio.Semaphore(self.max_concurrency)
+        per_host: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.max_per_host)
+        )
+
+        async def run(source_url: str, destination_path: str) -> FetchResult:
+            # Take the host slot first so a task waiting on a busy host
+            # does not hold one of the global slots.
+            async with per_host[_host_key(source_url)], in_flight:
+                started = time.perf_counter()
+                try:
+                    file_path, metadata = await loop.run_in_executor(
+                        executor, self._fetch_one, source_url, destination_path
+                    )
+                except Exception as exc:  # reported per target, not raised
+                    return FetchResult(
+                        source_url=source_url,
+                        destination_path=destination_path,
+                        error=f"{type(exc).__name__}: {exc}",
+                        elapsed_seconds=time.perf_counter() - started,
+                    )
+                return FetchResult(
+                    source_url=source_url,
+                    destination_path=destination_path,
+                    file_path=file_path,
+                    metadata=metadata,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+
+        tasks = [asyncio.create_task(run(url, dest)) for url, dest in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_one(
+        self,
+        source_url: str,
+        destination_path: str,
+    ) -> tuple[str, dict[str, str] | None]:
+        """Run a single blocking fetch in a worker thread."""
+        if self.use_metadata:
+            return self.fetcher.fetch_with_metadata(source_url, destination_path)
+        return self.fetcher.fetch(source_url, destination_path), None
+
+
+def _host_key(source_url: str) -> str:
+    """Return the key used for per-host concurrency limits.
+
+    Args:
+        source_url: URL or local path of the source.
+
+    Returns:
+        Lower-cased network location, or an empty string for local paths.
+    """
+    return urlsplit(source_url).netloc.lower()
@@ -1,11 +1,345 @@
-"""Simple HTML link discovery for finding download URLs.
+"""HTML link discovery for finding download URLs.
 
 This module provides functionality to discover downloadable files
 from HTML pages by parsing links. Useful for sources that don't
 provide direct file URLs.
+
+Index pages are fetched concurrently and parsed incrementally as they
+stream in, following links recursively up to a bounded depth. Each
+page's ETag/Last-Modified and content fingerprint are cached between
+runs, so unchanged index pages are answered from the cache without
+being parsed again. A page that fails is reported in its PageResult and
+does not stop the discovery of the others.
 """
 
-from typing import Any
+import codecs
+import hashlib
+import json
+import mimetypes
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path, PurePosixPath
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import requests
+
+from radar_data.infrastructure.net.session_pool import SessionPool
+
+INDEX_FILENAME = ".discovery.json"
+
+# Suffixes of pages that may list further links and can be followed.
+PAGE_SUFFIXES = ("", ".html", ".htm", ".php", ".asp", ".aspx")
+
+# Bodies of cached pages are buffered in memory up to this size while
+# their fingerprint is checked, and spill to a temporary file beyond it.
+_SPOOL_SIZE = 1024 * 1024
+
+
+@dataclass
+class CachedPage:
+    """Cached state of a previously parsed index page.
+
+    Attributes:
+        links: Absolute URLs of every anchor found on the page.
+        anchor_types: Anchor type attributes, keyed by link URL.
+        etag: ETag header of the page, if any.
+        last_modified: Last-Modified header of the page, if any.
+        fingerprint: SHA-256 hex digest of the page body.
+    """
+
+    links: list[str]
+    anchor_types: dict[str, str] = field(default_factory=dict)
+    etag: str = ""
+    last_modified: str = ""
+    fingerprint: str = ""
+
+
+class DiscoveryCache:
+    """JSON-backed cache of parsed index pages keyed by page URL."""
+
+    def __init__(self, root_dir: str | Path) -> None:
+        """Initialize the discovery cache.
+
+        Args:
+            root_dir: Directory where the index (.discovery.json) is kept.
+        """
+        self.index_path = Path(root_dir) / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._pages: dict[str, CachedPage] = {}
+        if self.index_path.exists():
+            with open(self.index_path, encoding="utf-8") as f:
+                self._pages = {url: CachedPage(**page) for url, page in json.load(f).items()}
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached state of a page, if any."""
+        with self._lock:
+            return self._pages.get(url)
+
+    def put(self, url: str, page: CachedPage) -> None:
+        """Record the parsed state of a page."""
+        with self._lock:
+            self._pages[url] = page
+
+    def save(self) -> None:
+        """Atomically write the cache to disk."""
+        with self._lock:
+            payload = {url: asdict(page) for url, page in self._pages.items()}
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class _AnchorCollector(HTMLParser):
+    """Incremental HTML parser collecting <a href> targets."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: list[str] = []
+        self.anchor_types: dict[str, str] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "base":
+            href = dict(attrs).get("href")
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+            return
+        if tag != "a":
+            return
+        attributes = dict(attrs)
+        href = (attributes.get("href") or "").strip()
+        if not href or href.startswith(("mailto:", "javascript:", "#")):
+            return
+        url = urldefrag(urljoin(self.base_url, href)).url
+        self.links.append(url)
+        if attributes.get("type"):
+            self.anchor_types[url] = attributes["type"] or ""
+
+
+@dataclass
+class PageResult:
+    """Outcome of visiting one index page.
+
+    Attributes:
+        url: URL of the page.
+        page: Parsed links and validators of the page.
+        status: "fetched", "not_modified" (304), "unchanged" (same
+            fingerprint) or "error".
+        error: Error message if the page could not be visited, None otherwise.
+    """
+
+    url: str
+    page: CachedPage
+    status: str
+    error: str | None = None
+
+
+class LinkDiscoverer:
+    """Concurrent, cached and recursive download link discovery.
+
+    Pages of each depth level are fetched in parallel through a shared
+    SessionPool. Bodies are hashed and parsed chunk by chunk as they
+    arrive, so no page is held in memory as a whole. The body of a page
+    with a cached fingerprint is hashed before it is parsed, and the
+    cached links are reused if the fingerprint matches. Links on the
+    same host that look like HTML pages are followed up to max_depth
+    levels. Pages that fail are recorded in last_visits with status
+    "error" and the other pages are still visited.
+    """
+
+    def __init__(
+        self,
+        session_pool: SessionPool | None = None,
+        cache: DiscoveryCache | None = None,
+        max_workers: int = 8,
+        max_depth: int = 0,
+        timeout: int = 30,
+        user_agent: str = "radar-data-pipeline/0.1.0",
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """Initialize the link discoverer.
+
+        Args:
+            session_pool: Pool of keep-alive sessions and rate limiters.
+            cache: Optional cache of page validators and fingerprints.
+            max_workers: Maximum number of pages fetched concurrently.
+            max_depth: How many levels of page links to follow; 0 only
+                parses the start pages.
+            timeout: Request timeout in seconds.
+            user_agent: User-Agent string for requests.
+            chunk_size: Size in bytes of each chunk fed to the parser.
+        """
+        self.session_pool = session_pool if session_pool is not None else SessionPool()
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.chunk_size = chunk_size
+        self.last_visits: list[PageResult] = []
+
+    def discover(
+        self,
+        start_urls: list[str],
+        pattern: str | None = None,
+        content_type: str | None = None,
+    ) -> list[str]:
+        """Discover download links reachable from the start pages.
+
+        Args:
+            start_urls: URLs of the index pages to start from.
+            pattern: Optional pattern to match in URLs (e.g., ".csv").
+            content_type: Optional content type filter, matched against
+                the anchor type attribute or the type guessed from the URL.
+
+        Returns:
+            Discovered download URLs in discovery order, without duplicates.
+        """
+        visited: set[str] = set()
+        found: dict[str, None] = {}
+        visits: list[PageResult] = []
+        level = list(dict.fromkeys(start_urls))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for depth in range(self.max_depth + 1):
+                visited.update(level)
+                futures = {executor.submit(self._visit, url): url for url in level}
+                visited_pages: dict[str, PageResult] = {}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        visited_pages[url] = future.result()
+                    except Exception as exc:  # reported per page, not raised
+                        visited_pages[url] = PageResult(
+                            url, CachedPage(links=[]), "error", f"{type(exc).__name__}: {exc}"
+                        )
+                results = [visited_pages[url] for url in level]
+                visits.extend(results)
+                next_level: dict[str, None] = {}
+                for result in results:
+                    for link in result.page.links:
+                        if _matches(
+                            link, result.page.anchor_types.get(link), pattern, content_type
+                        ):
+                            found.setdefault(link)
+                        elif (
+                            depth < self.max_depth
+                            and link not in visited
+                            and _is_followable(result.url, link)
+                        ):
+                            next_level.setdefault(link)
+                level = list(next_level)
+                if not level:
+                    break
+
+        if self.cache is not None:
+            self.cache.save()
+        self.last_visits = visits
+        return list(found)
+
+    def _visit(self, url: str) -> PageResult:
+        """Fetch and parse one page, using the cache when possible."""
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = {"User-Agent": self.user_agent}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.session_pool.get(url, headers=headers, timeout=self.timeout, stream=True)
+        with response:
+            if response.status_code == 304 and cached is not None:
+                return PageResult(url, cached, "not_modified")
+            response.raise_for_status()
+            etag = response.headers.get("ETag", "")
+            last_modified = response.headers.get("Last-Modified", "")
+            base_url = response.url or url
+            encoding = response.encoding or "utf-8"
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+            if cached is None or not cached.fingerprint:
+                page = _read_page(base_url, chunks, encoding)
+            else:
+                with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as body:
+                    fingerprint = hashlib.sha256()
+                    for chunk in chunks:
+                        fingerprint.update(chunk)
+                        body.write(chunk)
+                    if fingerprint.hexdigest() == cached.fingerprint:
+                        page = replace(cached, etag=etag, last_modified=last_modified)
+                        if self.cache is not None:
+                            self.cache.put(url, page)
+                        return PageResult(url, page, "unchanged")
+                    body.seek(0)
+                    page = _read_page(
+                        base_url, iter(partial(body.read, self.chunk_size), b""), encoding
+                    )
+
+        page.etag, page.last_modified = etag, last_modified
+        if self.cache is not None:
+            self.cache.put(url, page)
+        return PageResult(url, page, "fetched")
+
+
+def _read_page(base_url: str, chunks: Iterable[bytes], encoding: str) -> CachedPage:
+    """Hash and parse a page body chunk by chunk."""
+    collector = _AnchorCollector(base_url)
+    fingerprint = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in chunks:
+        fingerprint.update(chunk)
+        collector.feed(decoder.decode(chunk))
+    collector.feed(decoder.decode(b"", final=True))
+    collector.close()
+    return CachedPage(
+        links=list(dict.fromkeys(collector.links)),
+        anchor_types=collector.anchor_types,
+        fingerprint=fingerprint.hexdigest(),
+    )
+
+
+def _matches(
+    url: str,
+    anchor_type: str | None,
+    pattern: str | None,
+    content_type: str | None,
+) -> bool:
+    """Check whether a link is a download matching the filters."""
+    if pattern is None and content_type is None:
+        return not _looks_like_page(url)
+    if pattern is not None and pattern not in url:
+        return False
+    if content_type is not None:
+        guessed = anchor_type or mimetypes.guess_type(urlsplit(url).path)[0]
+        if guessed != content_type:
+            return False
+    return True
+
+
+def _looks_like_page(url: str) -> bool:
+    """Check whether a URL looks like an HTML page rather than a file."""
+    return PurePosixPath(urlsplit(url).path).suffix.lower() in PAGE_SUFFIXES
+
+
+def _is_followable(page_url: str, link: str) -> bool:
+    """Check whether a link should be followed during recursive discovery."""
+    page, target = urlsplit(page_url), urlsplit(link)
+    return (
+        target.scheme in ("http", "https")
+        and target.netloc == page.netloc
+        and _looks_like_page(link)
+    )
 
 
 def discover_download_links(
@@ -29,13 +363,6 @@ def discover_download_links(
     Raises:
         requests.RequestException: If HTTP request fails.
 
-    TODO:
-        - Implement HTML parsing using BeautifulSoup or lxml.
-        - Extract all <a> tags with href attributes.
-        - Filter by pattern or content type.
-        - Resolve relative URLs to absolute URLs.
-        - Add support for recursive discovery.
-
     Example:
         >>> links = discover_download_links(
         ...     "https://example.com/data",
@@ -43,26 +370,9 @@ def discover_download_links(
         ... )
         >>> # Returns: ["https://example.com/data/file1.csv", ...]
     """
-    # TODO: Implement link discovery
-    # import requests
-    # from bs4 import BeautifulSoup
-    #
-    # response = requests.get(base_url)
-    # response.raise_for_status()
-    # soup = BeautifulSoup(response.text, "html.parser")
-    #
-    # links = []
-    # for anchor in soup.find_all("a", href=True):
-    #     url = anchor["href"]
-    #     # Resolve relative URLs
-    #     if not url.startswith("http"):
-    #         from urllib.parse import urljoin
-    #         url = urljoin(base_url, url)
-    #     # Apply filters
-    #     if pattern and pattern not in url:
-    #         continue
-    #     links.append(url)
-    #
-    # return links
-    pass
-
+    discoverer = LinkDiscoverer()
+    links = discoverer.discover([base_url], pattern=pattern, content_type=content_type)
+    errors = [visit.error for visit in discoverer.last_visits if visit.error]
+    if errors:
+        raise requests.RequestException(errors[0])
+    return links
@@ -4,12 +4,37 @@ Uses the requests library to fetch files from HTTP/HTTPS URLs
 with support for ETag/Last-Modified headers for caching.
 """
 
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
 from radar_data.domain.interfaces import FetcherPort
+from radar_data.infrastructure.io.content_store import HASH_CHUNK_SIZE, ContentStore, hash_file
+from radar_data.infrastructure.net.checkpoint import DownloadCheckpoint, Segment
+from radar_data.infrastructure.net.metrics import FetchMetrics, MetricsSink, reset_timings
+from radar_data.infrastructure.net.session_pool import RETRY_STATUSES, SessionPool, backoff_delay
+from radar_data.infrastructure.net.validator_store import CachedSource, ValidatorStore
+
+
+class StaleCheckpointError(requests.RequestException):
+    """Raised when a partial download no longer matches the remote file."""
+
+
+# Errors after which a download is retried, resuming from its checkpoint.
+# HTTPError is only retried for the statuses in RETRY_STATUSES.
+RETRYABLE_ERRORS = (
+    requests.HTTPError,
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    StaleCheckpointError,
+)
 
 
 class HttpFetcher(FetcherPort):
@@ -17,14 +42,34 @@ class HttpFetcher(FetcherPort):
 
     Implements the FetcherPort interface for HTTP-based sources.
     Supports conditional requests using ETag and Last-Modified headers
-    to avoid re-downloading unchanged files.
+    to avoid re-downloading unchanged files: when a ValidatorStore is
+    configured, a 304 response returns the previously fetched file.
+    With a ContentStore, downloads are deduplicated by content hash and
+    the returned path points at the stored blob.
+
+    Response bodies are streamed to a partial file in fixed-size chunks
+    and hashed on the fly, then atomically renamed into place, so memory
+    use does not grow with file size and a failed download never leaves
+    a truncated file at the destination.
+
+    Progress of the partial file is checkpointed next to it. Failed
+    transfers are retried up to `retries` times, and both retries and
+    later runs resume with Range/If-Range requests instead of starting
+    from byte zero. When the server accepts byte ranges, large files can
+    also be split into `segments` ranges downloaded in parallel.
+
+    Requests go through a SessionPool, which keeps connections alive per
+    host and applies per-provider token-bucket rate limits. Retries after
+    connection errors, throttling (429) and 5xx responses wait with
+    exponential backoff and jitter, honouring Retry-After.
+
+    With a MetricsSink, every fetch emits a FetchMetrics record with its
+    connect time, time to first byte, transfer time, bytes, cache outcome
+    and retry count. Ranged requests of segmented downloads contribute
+    their bytes but not their connect times.
 
     TODO:
-        - Implement actual HTTP fetching using requests.
-        - Add ETag/Last-Modified header handling.
-        - Add retry logic for failed requests.
         - Add progress reporting for large files.
-        - Add timeout configuration.
         - Add authentication support (API keys, etc.).
         - Add support for redirects.
     """
@@ -34,6 +79,16 @@ class HttpFetcher(FetcherPort):
         timeout: int = 30,
         retries: int = 3,
         user_agent: str = "radar-data-pipeline/0.1.0",
+        validator_store: ValidatorStore | None = None,
+        content_store: ContentStore | None = None,
+        chunk_size: int = 1024 * 1024,
+        segments: int = 1,
+        segment_min_bytes: int = 32 * 1024 * 1024,
+        checkpoint_interval: int = 8 * 1024 * 1024,
+        session_pool: SessionPool | None = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        metrics: MetricsSink | None = None,
     ) -> None:
         """Initialize the HTTP fetcher.
 
@@ -41,10 +96,37 @@ class HttpFetcher(FetcherPort):
             timeout: Request timeout in seconds.
             retries: Number of retry attempts for failed requests.
             user_agent: User-Agent string for requests.
+            validator_store: Optional store of ETag/Last-Modified validators.
+                When set, requests are made conditional and unchanged
+                sources are served from the previously fetched file.
+            content_store: Optional content-addressed store. When set,
+                fetched files are moved into it and deduplicated by hash.
+            chunk_size: Size in bytes of each chunk read from the response.
+            segments: Number of parallel byte ranges used for large files
+                when the server advertises Accept-Ranges.
+            segment_min_bytes: Minimum file size for a segmented download.
+            checkpoint_interval: Number of bytes written by a segment
+                between two checkpoint saves.
+            session_pool: Pool of keep-alive sessions and rate limiters.
+                Share one pool between fetchers hitting the same providers.
+                Defaults to a private pool without rate limits.
+            backoff_base: Delay scale in seconds for the first retry.
+            backoff_max: Maximum delay in seconds between retries.
+            metrics: Optional sink receiving one FetchMetrics per fetch.
         """
         self.timeout = timeout
         self.retries = retries
         self.user_agent = user_agent
+        self.validator_store = validator_store
+        self.content_store = content_store
+        self.chunk_size = chunk_size
+        self.segments = segments
+        self.segment_min_bytes = segment_min_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.session_pool = session_pool if session_pool is not None else SessionPool()
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics = metrics
 
     def fetch(self, source_url: str, destination_path: str) -> str:
         """Fetch a file from source_url and save to destination_path.
@@ -54,31 +136,16 @@ class HttpFetcher(FetcherPort):
             destination_path: Local path where the file should be saved.
 
         Returns:
-            Path to the downloaded file.
+            Path to the downloaded file, which is a content store blob
+            when a content store is configured.
 
         Raises:
             FileNotFoundError: If source_url cannot be accessed.
             PermissionError: If destination_path cannot be written to.
             requests.RequestException: If HTTP request fails.
-
-        TODO:
-            - Make HTTP GET request.
-            - Save response content to file.
-            - Handle errors appropriately.
         """
-        # TODO: Implement HTTP fetching
-        # headers = {"User-Agent": self.user_agent}
-        # response = requests.get(source_url, headers=headers, timeout=self.timeout)
-        # response.raise_for_status()
-        #
-        # dest_path = Path(destination_path)
-        # dest_path.parent.mkdir(parents=True, exist_ok=True)
-        #
-        # with open(dest_path, "wb") as f:
-        #     f.write(response.content)
-        #
-        # return str(dest_path)
-        pass
+        file_path, _ = self.fetch_with_metadata(source_url, destination_path)
+        return file_path
 
     def fetch_with_metadata(
         self,
@@ -87,39 +154,365 @@ class HttpFetcher(FetcherPort):
     ) -> tuple[str, dict[str, str]]:
         """Fetch a file and return metadata (ETag, Last-Modified, etc.).
 
+        Metadata is taken from the headers of the GET response itself,
+        so no extra HEAD round trip is made. If a validator store is
+        configured and the server answers 304 Not Modified, no body is
+        transferred and the previously fetched file path is returned.
+
         Args:
             source_url: URL of the source file.
             destination_path: Local path where the file should be saved.
 
         Returns:
             Tuple of (file_path, metadata_dict) where metadata contains
-            HTTP headers like ETag, Last-Modified, Content-Type, etc.
+            HTTP headers like ETag, Last-Modified, Content-Type, etc., plus
+            "Status" with the HTTP status code ("200", "206" when resumed,
+            or "304") and "Content-Hash" with the SHA-256 hex digest of
+            the file.
 
         Raises:
             FileNotFoundError: If source_url cannot be accessed.
             PermissionError: If destination_path cannot be written to.
             requests.RequestException: If HTTP request fails.
+        """
+        dest_path = Path(destination_path)
+        record = FetchMetrics(url=source_url, host=urlsplit(source_url).netloc)
+        started = time.perf_counter()
+        try:
+            while True:
+                try:
+                    return self._fetch_once(source_url, dest_path, record)
+                except RETRYABLE_ERRORS as exc:
+                    retry_after = None
+                    if isinstance(exc, requests.HTTPError):
+                        if exc.response is None or exc.response.status_code not in RETRY_STATUSES:
+                            raise
+                        retry_after = exc.response.headers.get("Retry-After")
+                    if record.retries >= self.retries:
+                        raise
+                    time.sleep(
+                        backoff_delay(
+                            record.retries, self.backoff_base, self.backoff_max, retry_after
+                        )
+                    )
+                    record.retries += 1
+        except BaseException as exc:
+            record.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record.total_seconds = time.perf_counter() - started
+            if self.metrics is not None:
+                self.metrics.emit(record)
+
+    def _fetch_once(
+        self,
+        source_url: str,
+        dest_path: Path,
+        record: FetchMetrics,
+    ) -> tuple[str, dict[str, str]]:
+        """Make one fetch attempt, resuming from a checkpoint if present."""
+        part_path = _part_path(dest_path)
+        checkpoint_path = _checkpoint_path(part_path)
+        checkpoint = _load_checkpoint(source_url, part_path, checkpoint_path)
+
+        headers = {"User-Agent": self.user_agent}
+        cached = None
+        if checkpoint is not None:
+            headers.update(_range_headers(checkpoint.pending()[0], checkpoint.validator))
+        elif self.validator_store is not None:
+            cached = self.validator_store.get(source_url)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        timings = reset_timings()
+        response = self.session_pool.get(
+            source_url, headers=headers, timeout=self.timeout, stream=True
+        )
+        record.status = response.status_code
+        record.connect_seconds += timings.connect_seconds
+        record.throttle_seconds += timings.throttle_seconds
+        record.ttfb_seconds += response.elapsed.total_seconds()
+        with response:
+            if response.status_code == 304 and cached is not None:
+                record.not_modified = record.cache_hit = True
+                return self._not_modified(response, cached)
+            if response.status_code in (404, 410):
+                raise FileNotFoundError(f"Source not found: {source_url}")
+            response.raise_for_status()
+
+            metadata = _extract_metadata(response)
+            if checkpoint is None or response.status_code != 206:
+                # Fresh download, or the file changed since the checkpoint
+                # and the server ignored If-Range and sent it in full.
+                checkpoint = self._start_download(source_url, response, part_path)
+            resumed_from = checkpoint.written
+            transfer_started = time.perf_counter()
+            try:
+                digest = self._download(response, checkpoint, part_path, checkpoint_path)
+            finally:
+                record.transfer_seconds += time.perf_counter() - transfer_started
+                record.bytes_received += checkpoint.written - resumed_from
+
+        if checkpoint.total_size is not None:
+            metadata["Content-Length"] = str(checkpoint.total_size)
+        metadata["Content-Hash"] = digest
+        os.replace(part_path, dest_path)
+        checkpoint_path.unlink(missing_ok=True)
+
+        file_path = str(dest_path)
+        if self.content_store is not None:
+            record.cache_hit = self.content_store.contains(digest)
+            file_path = self.content_store.put_file(dest_path, digest).path
+        if self.validator_store is not None:
+            self.validator_store.put(source_url, file_path, metadata)
+        return file_path, metadata
+
+    def _not_modified(
+        self,
+        response: requests.Response,
+        cached: CachedSource,
+    ) -> tuple[str, dict[str, str]]:
+        """Serve a 304 response from the previously fetched file."""
+        # A 304 may omit headers; keep the stored values for those.
+        metadata = dict(cached.metadata)
+        metadata.update({k: v for k, v in _extract_metadata(response).items() if v})
+        if self.content_store is not None and metadata.get("Content-Hash"):
+            self.content_store.get(metadata["Content-Hash"])
+        return cached.file_path, metadata
+
+    def _start_download(
+        self,
+        source_url: str,
+        response: requests.Response,
+        part_path: Path,
+    ) -> DownloadCheckpoint:
+        """Create the partial file and checkpoint for a full GET response."""
+        validator = _range_validator(response)
+        total_size = None
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and not response.headers.get("Content-Encoding"):
+            total_size = int(content_length)
+
+        num_segments = 1
+        if (
+            self.segments > 1
+            and validator
+            and total_size is not None
+            and total_size >= self.segment_min_bytes
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        ):
+            num_segments = self.segments
+
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(part_path, "wb") as f:
+            if num_segments > 1 and total_size is not None:
+                f.truncate(total_size)
+        return DownloadCheckpoint.create(source_url, validator, total_size, num_segments)
+
+    def _download(
+        self,
+        response: requests.Response,
+        checkpoint: DownloadCheckpoint,
+        part_path: Path,
+        checkpoint_path: Path,
+    ) -> str:
+        """Download every pending segment of a checkpoint into the partial file.
+
+        The first pending segment is read from the already open response;
+        the remaining ones are requested in parallel with ranged GETs.
 
-        TODO:
-            - Make HTTP GET request with headers.
-            - Extract metadata from response headers.
-            - Save file and return metadata.
+        Returns:
+            SHA-256 hex digest of the completed file.
         """
-        # TODO: Implement HTTP fetching with metadata
-        # file_path = self.fetch(source_url, destination_path)
-        #
-        # # Make HEAD request to get metadata without re-downloading
-        # headers = {"User-Agent": self.user_agent}
-        # response = requests.head(source_url, headers=headers, timeout=self.timeout)
-        # response.raise_for_status()
-        #
-        # metadata = {
-        #     "ETag": response.headers.get("ETag", ""),
-        #     "Last-Modified": response.headers.get("Last-Modified", ""),
-        #     "Content-Type": response.headers.get("Content-Type", ""),
-        #     "Content-Length": response.headers.get("Content-Length", ""),
-        # }
-        #
-        # return file_path, metadata
-        pass
+        first, *rest = checkpoint.pending()
+        # Hash in flight when a single stream writes the file front to back.
+        digest = _hash_prefix(part_path, first.offset) if not rest else None
+        lock = threading.Lock()
+        try:
+            if rest:
+                with ThreadPoolExecutor(max_workers=len(rest)) as executor:
+                    futures = [
+                        executor.submit(
+                            self._fetch_segment,
+                            checkpoint,
+                            segment,
+                            part_path,
+                            checkpoint_path,
+                            lock,
+                        )
+                        for segment in rest
+                    ]
+                    try:
+                        self._write_segment(
+                            response, checkpoint, first, part_path, checkpoint_path, lock, digest
+                        )
+                    finally:
+                        errors = [future.exception() for future in futures]
+                    for error in errors:
+                        if error is not None:
+                            raise error
+            else:
+                self._write_segment(
+                    response, checkpoint, first, part_path, checkpoint_path, lock, digest
+                )
+            if checkpoint.pending() and checkpoint.total_size is not None:
+                raise requests.ConnectionError(
+                    f"Transfer of {checkpoint.source_url} ended early "
+                    f"({checkpoint.written} of {checkpoint.total_size} bytes)"
+                )
+        except StaleCheckpointError:
+            _discard(part_path, checkpoint_path)
+            raise
+        except BaseException:
+            if checkpoint.validator:
+                checkpoint.save(checkpoint_path)
+            else:
+                _discard(part_path, checkpoint_path)
+            raise
+
+        return digest.hexdigest() if digest is not None else hash_file(part_path)
+
+    def _fetch_segment(
+        self,
+        checkpoint: DownloadCheckpoint,
+        segment: Segment,
+        part_path: Path,
+        checkpoint_path: Path,
+        lock: threading.Lock,
+    ) -> None:
+        """Download one segment with a ranged GET request."""
+        headers = {"User-Agent": self.user_agent}
+        headers.update(_range_headers(segment, checkpoint.validator))
+        response = self.session_pool.get(
+            checkpoint.source_url, headers=headers, timeout=self.timeout, stream=True
+        )
+        with response:
+            if response.status_code in (200, 412, 416):
+                raise StaleCheckpointError(f"{checkpoint.source_url} changed during download")
+            response.raise_for_status()
+            self._write_segment(response, checkpoint, segment, part_path, checkpoint_path, lock)
+
+    def _write_segment(
+        self,
+        response: requests.Response,
+        checkpoint: DownloadCheckpoint,
+        segment: Segment,
+        part_path: Path,
+        checkpoint_path: Path,
+        lock: threading.Lock,
+        digest: "hashlib._Hash | None" = None,
+    ) -> None:
+        """Stream a response body into its segment of the partial file.
+
+        Reading stops at the end of the segment, so the first segment can
+        be served from a full (non-ranged) response. The checkpoint is
+        saved every checkpoint_interval bytes, after flushing the data it
+        records, so it never claims bytes that are not on disk.
+        """
+        unsaved = 0
+        with open(part_path, "r+b") as f:
+            f.seek(segment.offset)
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if segment.end is not None:
+                    chunk = chunk[: segment.end - segment.offset]
+                f.write(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+                segment.written += len(chunk)
+                unsaved += len(chunk)
+                if segment.done:
+                    break
+                if checkpoint.validator and unsaved >= self.checkpoint_interval:
+                    f.flush()
+                    with lock:
+                        checkpoint.save(checkpoint_path)
+                    unsaved = 0
+
+
+def _part_path(dest_path: Path) -> Path:
+    """Return the partial file path used while downloading dest_path."""
+    return dest_path.with_name(f".{dest_path.name}.part")
+
+
+def _checkpoint_path(part_path: Path) -> Path:
+    """Return the checkpoint path of a partial file."""
+    return part_path.with_name(f"{part_path.name}.json")
+
 
+def _discard(part_path: Path, checkpoint_path: Path) -> None:
+    """Remove a partial file and its checkpoint."""
+    part_path.unlink(missing_ok=True)
+    checkpoint_path.unlink(missing_ok=True)
+
+
+def _load_checkpoint(
+    source_url: str,
+    part_path: Path,
+    checkpoint_path: Path,
+) -> DownloadCheckpoint | None:
+    """Load a resumable checkpoint, discarding unusable leftovers."""
+    checkpoint = DownloadCheckpoint.load(checkpoint_path) if part_path.exists() else None
+    if (
+        checkpoint is not None
+        and checkpoint.source_url == source_url
+        and checkpoint.validator
+        and checkpoint.pending()
+    ):
+        return checkpoint
+    _discard(part_path, checkpoint_path)
+    return None
+
+
+def _range_validator(response: requests.Response) -> str:
+    """Return the If-Range validator of a response, or "" if not resumable.
+
+    Only strong ETags and Last-Modified dates are valid If-Range values,
+    and encoded bodies are not resumable because byte offsets refer to
+    the encoded representation.
+    """
+    if response.headers.get("Content-Encoding"):
+        return ""
+    etag = response.headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified", "")
+
+
+def _range_headers(segment: Segment, validator: str) -> dict[str, str]:
+    """Build the headers requesting the remaining bytes of a segment."""
+    return {
+        "Range": segment.range_header(),
+        "If-Range": validator,
+        "Accept-Encoding": "identity",
+    }
+
+
+def _hash_prefix(path: Path, length: int) -> "hashlib._Hash":
+    """Start a SHA-256 digest over the first length bytes of a file."""
+    digest = hashlib.sha256()
+    if length:
+        with open(path, "rb") as f:
+            remaining = length
+            while remaining and (chunk := f.read(min(HASH_CHUNK_SIZE, remaining))):
+                digest.update(chunk)
+                remaining -= len(chunk)
+    return digest
+
+
+def _extract_metadata(response: requests.Response) -> dict[str, str]:
+    """Extract caching-related headers from a response.
+
+    Args:
+        response: HTTP response to read headers from.
+
+    Returns:
+        Dictionary with Status, ETag, Last-Modified, Content-Type and
+        Content-Length.
+    """
+    return {
+        "Status": str(response.status_code),
+        "ETag": response.headers.get("ETag", ""),
+        "Last-Modified": response.headers.get("Last-Modified", ""),
+        "Content-Type": response.headers.get("Content-Type", ""),
+        "Content-Length": response.headers.get("Content-Length", ""),
+    }
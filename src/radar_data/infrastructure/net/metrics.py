@@ -0,0 +1,288 @@
+"""Structured transfer metrics for HTTP fetches.
+
+Each fetch produces one FetchMetrics record with its connect time, time
+to first byte, transfer time, bytes received, cache outcome and retry
+count. Records are written as JSON lines by a MetricsSink and can be
+aggregated per dataset and host with summarize(), so a slow run can be
+attributed to the network (connect, TTFB, throughput) or to local work.
+"""
+
+import json
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass
+class FetchMetrics:
+    """Metrics of one fetch, including all of its retries.
+
+    Attributes:
+        url: URL that was fetched.
+        host: Host of the URL.
+        dataset_id: Dataset the URL belongs to, if registered with the sink.
+        started_at: UTC timestamp (ISO 8601) of the start of the fetch.
+        status: HTTP status of the last response, or 0 if none arrived.
+        connect_seconds: Time spent on DNS resolution, TCP connect and TLS
+            handshakes; 0 when a kept-alive connection was reused.
+        throttle_seconds: Time spent waiting for the provider rate limiter.
+        ttfb_seconds: Time from sending the request to receiving response
+            headers, including connect time.
+        transfer_seconds: Time spent reading and writing the body.
+        total_seconds: Wall-clock time of the whole fetch, including
+            backoff between retries and local processing.
+        bytes_received: Body bytes downloaded.
+        not_modified: Whether the server answered 304 Not Modified.
+        cache_hit: Whether the content was already held locally (a 304,
+            or a download deduplicated by the content store).
+        retries: Number of retries made after failed attempts.
+        error: Error of a failed fetch, "" on success.
+    """
+
+    url: str
+    host: str = ""
+    dataset_id: str = ""
+    started_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    status: int = 0
+    connect_seconds: float = 0.0
+    throttle_seconds: float = 0.0
+    ttfb_seconds: float = 0.0
+    transfer_seconds: float = 0.0
+    total_seconds: float = 0.0
+    bytes_received: int = 0
+    not_modified: bool = False
+    cache_hit: bool = False
+    retries: int = 0
+    error: str = ""
+
+    @property
+    def network_seconds(self) -> float:
+        """Time spent waiting on the network (TTFB plus body transfer)."""
+        return self.ttfb_seconds + self.transfer_seconds
+
+
+class MetricsSink:
+    """Thread-safe collector writing FetchMetrics records as JSON lines."""
+
+    def __init__(self, path: str | Path | None = None, stream: IO[str] | None = None) -> None:
+        """Initialize the metrics sink.
+
+        Args:
+            path: Optional file that records are appended to.
+            stream: Optional text stream that records are written to.
+        """
+        self.path = Path(path) if path is not None else None
+        self.stream = stream
+        self.records: list[FetchMetrics] = []
+        self._datasets: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def register(self, source_url: str, dataset_id: str) -> None:
+        """Attribute future records of a URL to a dataset.
+
+        Args:
+            source_url: URL of the dataset source.
+            dataset_id: Dataset identifier.
+        """
+        with self._lock:
+            self._datasets[source_url] = dataset_id
+
+    def emit(self, record: FetchMetrics) -> None:
+        """Record a fetch and write it out as one JSON line.
+
+        Args:
+            record: Metrics of a completed or failed fetch.
+        """
+        with self._lock:
+            if not record.dataset_id:
+                record.dataset_id = self._datasets.get(record.url, "")
+            self.records.append(record)
+            line = json.dumps(asdict(record), sort_keys=True) + "\n"
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            if self.stream is not None:
+                self.stream.write(line)
+                self.stream.flush()
+
+
+def load_metrics(path: str | Path) -> list[FetchMetrics]:
+    """Read FetchMetrics records from a JSON-lines file.
+
+    Args:
+        path: File written by a MetricsSink.
+
+    Returns:
+        Records in file order; unknown keys are ignored.
+    """
+    names = {f.name for f in fields(FetchMetrics)}
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                raw = json.loads(line)
+                records.append(FetchMetrics(**{k: v for k, v in raw.items() if k in names}))
+    return records
+
+
+@dataclass
+class MetricsSummary:
+    """Aggregated metrics of a group of fetches.
+
+    Attributes:
+        key: Group values, e.g. (dataset_id, host).
+        requests: Number of fetches.
+        errors: Number of failed fetches.
+        retries: Total number of retries.
+        not_modified: Number of 304 responses.
+        cache_hits: Number of fetches served from local content.
+        bytes_received: Total body bytes downloaded.
+        connect_seconds: Total connect time.
+        ttfb_p50: Median time to first byte in seconds.
+        ttfb_p95: 95th percentile time to first byte in seconds.
+        transfer_seconds: Total body transfer time.
+        total_seconds: Total wall-clock time of the fetches.
+        throughput_mbps: Megabits per second while transferring bodies.
+    """
+
+    key: tuple[str, ...]
+    requests: int
+    errors: int
+    retries: int
+    not_modified: int
+    cache_hits: int
+    bytes_received: int
+    connect_seconds: float
+    ttfb_p50: float
+    ttfb_p95: float
+    transfer_seconds: float
+    total_seconds: float
+    throughput_mbps: float
+
+
+def summarize(
+    records: list[FetchMetrics],
+    by: tuple[str, ...] = ("dataset_id", "host"),
+) -> list[MetricsSummary]:
+    """Aggregate fetch metrics by the given record fields.
+
+    Args:
+        records: Records to aggregate.
+        by: Names of the FetchMetrics fields to group by.
+
+    Returns:
+        One MetricsSummary per group, sorted by key.
+    """
+    groups: dict[tuple[str, ...], list[FetchMetrics]] = {}
+    for record in records:
+        key = tuple(str(getattr(record, name)) for name in by)
+        groups.setdefault(key, []).append(record)
+
+    summaries = []
+    for key, group in sorted(groups.items()):
+        ttfbs = sorted(record.ttfb_seconds for record in group if record.status)
+        transfer = sum(record.transfer_seconds for record in group)
+        received = sum(record.bytes_received for record in group)
+        summaries.append(
+            MetricsSummary(
+                key=key,
+                requests=len(group),
+                errors=sum(bool(record.error) for record in group),
+                retries=sum(record.retries for record in group),
+                not_modified=sum(record.not_modified for record in group),
+                cache_hits=sum(record.cache_hit for record in group),
+                bytes_received=received,
+                connect_seconds=sum(record.connect_seconds for record in group),
+                ttfb_p50=_percentile(ttfbs, 50),
+                ttfb_p95=_percentile(ttfbs, 95),
+                transfer_seconds=transfer,
+                total_seconds=sum(record.total_seconds for record in group),
+                throughput_mbps=received * 8 / 1e6 / transfer if transfer else 0.0,
+            )
+        )
+    return summaries
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of sorted values (0.0 if empty)."""
+    if not ordered:
+        return 0.0
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+@dataclass
+class RequestTimings:
+    """Timings of the request currently made by this thread.
+
+    Attributes:
+        connect_seconds: Time spent opening connections.
+        throttle_seconds: Time spent waiting for a rate limiter.
+    """
+
+    connect_seconds: float = 0.0
+    throttle_seconds: float = 0.0
+
+
+_local = threading.local()
+
+
+def current_timings() -> RequestTimings:
+    """Return the request timings collected by the calling thread."""
+    timings: RequestTimings | None = getattr(_local, "timings", None)
+    if timings is None:
+        timings = _local.timings = RequestTimings()
+    return timings
+
+
+def reset_timings() -> RequestTimings:
+    """Start collecting request timings afresh for the calling thread."""
+    timings = RequestTimings()
+    _local.timings = timings
+    return timings
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            current_timings().connect_seconds += time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            current_timings().connect_seconds += time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter recording connection setup time in current_timings()."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with connection-timing pool classes."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
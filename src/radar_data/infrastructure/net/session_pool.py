@@ -0,0 +1,206 @@
+"""Pooled HTTP sessions, per-provider rate limiting and retry backoff.
+
+Provides one keep-alive requests.Session per host, token buckets that
+keep each provider under its rate limit, and the exponential backoff
+with jitter used between retries.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from radar_data.infrastructure.net.metrics import TimedHTTPAdapter, current_timings
+
+# HTTP statuses that signal throttling or a transient server failure.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are refilled continuously at `rate` per second up to
+    `capacity`; each request consumes one token and waits when the
+    bucket is empty. Capacity sets how large a burst is allowed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second).
+            capacity: Maximum number of tokens (burst size).
+            clock: Monotonic clock function, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance reserves a future token for this caller.
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class SessionPool:
+    """Keep-alive sessions and rate limiters shared across fetches.
+
+    One requests.Session is kept per host, so TLS connections are reused
+    between downloads. Rate limits are keyed by domain: a limit for
+    "bcra.gob.ar" applies to that host and all of its subdomains, so a
+    single bucket covers every host of a provider.
+
+    Connection setup and rate-limit waits are recorded in the calling
+    thread's metrics.current_timings().
+    """
+
+    def __init__(
+        self,
+        rate_limits: dict[str, tuple[float, float]] | None = None,
+        pool_maxsize: int = 10,
+    ) -> None:
+        """Initialize the session pool.
+
+        Args:
+            rate_limits: Optional mapping of domain to (requests_per_second,
+                burst) for the provider serving it.
+            pool_maxsize: Maximum number of kept-alive connections per host.
+        """
+        self.pool_maxsize = pool_maxsize
+        self._buckets = {
+            domain.lower(): TokenBucket(rate, burst)
+            for domain, (rate, burst) in (rate_limits or {}).items()
+        }
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the shared session for the host of url.
+
+        Args:
+            url: URL that will be requested.
+
+        Returns:
+            requests.Session with a keep-alive connection pool.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def bucket_for(self, url: str) -> TokenBucket | None:
+        """Return the rate limiter of the provider serving url, if any.
+
+        Args:
+            url: URL that will be requested.
+
+        Returns:
+            TokenBucket of the most specific matching domain, or None.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        labels = host.split(".")
+        for i in range(len(labels)):
+            bucket = self._buckets.get(".".join(labels[i:]))
+            if bucket is not None:
+                return bucket
+        return None
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Issue a GET through the pooled session, honouring rate limits.
+
+        Args:
+            url: URL to request.
+            **kwargs: Keyword arguments passed to requests.Session.get.
+
+        Returns:
+            The HTTP response.
+        """
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            current_timings().throttle_seconds += bucket.acquire()
+        return self.session_for(url).get(url, **kwargs)
+
+    def close(self) -> None:
+        """Close every pooled session and its connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    retry_after: str | None = None,
+) -> float:
+    """Compute the delay before a retry.
+
+    Uses exponential backoff with full jitter, so concurrent clients do
+    not retry in lockstep. A server-provided Retry-After value takes
+    precedence, bounded by cap.
+
+    Args:
+        attempt: Zero-based index of the retry.
+        base: Delay scale in seconds for the first retry.
+        cap: Maximum delay in seconds.
+        retry_after: Optional Retry-After header value (seconds or HTTP date).
+
+    Returns:
+        Delay in seconds.
+    """
+    if retry_after:
+        seconds = _parse_retry_after(retry_after)
+        if seconds is not None:
+            return min(cap, seconds)
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header into seconds from now."""
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
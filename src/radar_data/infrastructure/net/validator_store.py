@@ -0,0 +1,130 @@
+"""Persistent store of HTTP cache validators.
+
+Keeps the ETag/Last-Modified validators of every fetched source in a
+JSON index under the raw data directory, so later runs can issue
+conditional GET requests and skip unchanged downloads.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+INDEX_FILENAME = ".validators.json"
+
+
+@dataclass(frozen=True)
+class CachedSource:
+    """Validators and local file recorded for a previously fetched source.
+
+    Attributes:
+        file_path: Local path of the last successfully fetched file.
+        etag: ETag header of the last 200 response, if any.
+        last_modified: Last-Modified header of the last 200 response, if any.
+        metadata: Full metadata dict returned for the last 200 response.
+    """
+
+    file_path: str
+    etag: str = ""
+    last_modified: str = ""
+    metadata: dict[str, str] = field(default_factory=dict)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the conditional request headers for this source.
+
+        Returns:
+            Dictionary with If-None-Match and/or If-Modified-Since.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """JSON-backed index of cache validators keyed by source URL.
+
+    The index is loaded once and rewritten atomically on every update.
+    Access is guarded by a lock so a single store can be shared by
+    concurrent fetches.
+    """
+
+    def __init__(self, root_dir: str | Path) -> None:
+        """Initialize the validator store.
+
+        Args:
+            root_dir: Raw data directory; the index is kept at
+                root_dir/.validators.json.
+        """
+        self.index_path = Path(root_dir) / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, CachedSource] = self._load()
+
+    def get(self, source_url: str) -> CachedSource | None:
+        """Return the validators recorded for source_url.
+
+        Entries whose local file no longer exists are ignored, since a
+        304 response could not be served from them.
+
+        Args:
+            source_url: URL of the source.
+
+        Returns:
+            CachedSource, or None if the source is unknown or its file is gone.
+        """
+        with self._lock:
+            entry = self._entries.get(source_url)
+        if entry is None or not Path(entry.file_path).exists():
+            return None
+        return entry
+
+    def put(self, source_url: str, file_path: str, metadata: dict[str, str]) -> None:
+        """Record the validators of a successful fetch.
+
+        Sources without an ETag or Last-Modified header are not stored,
+        since no conditional request could be made for them.
+
+        Args:
+            source_url: URL of the source.
+            file_path: Local path where the file was saved.
+            metadata: Metadata dict of the response (ETag, Last-Modified, ...).
+        """
+        etag = metadata.get("ETag", "")
+        last_modified = metadata.get("Last-Modified", "")
+        with self._lock:
+            if not etag and not last_modified:
+                if self._entries.pop(source_url, None) is not None:
+                    self._save()
+                return
+            self._entries[source_url] = CachedSource(
+                file_path=file_path,
+                etag=etag,
+                last_modified=last_modified,
+                metadata=dict(metadata),
+            )
+            self._save()
+
+    def _load(self) -> dict[str, CachedSource]:
+        """Load the index from disk, returning an empty index if missing."""
+        if not self.index_path.exists():
+            return {}
+        with open(self.index_path, encoding="utf-8") as f:
+            raw = json.load(f)
+        return {url: CachedSource(**entry) for url, entry in raw.items()}
+
+    def _save(self) -> None:
+        """Atomically rewrite the index. Caller must hold the lock."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {url: asdict(entry) for url, entry in self._entries.items()}
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
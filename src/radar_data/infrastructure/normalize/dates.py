@@ -0,0 +1,261 @@
+"""Vectorized date parsing with per-column format inference.
+
+A date column is parsed in one pass with pyarrow.compute instead of
+calling dateutil on every row. The format is inferred once per column
+from a sample of distinct values. Candidates are ISO dates and
+timestamps, day-first dates (dd/mm/yyyy), month-year periods and years.
+Spanish month names ("Ene-24", "marzo 2024", "01-sept-2023") are first
+rewritten to month numbers with one regex pass per month. Excel date
+serials are converted arithmetically, whether they arrive as numbers or
+as numeric text.
+
+Single-digit fields are zero-padded first ("5/3/2024" becomes
+"05/03/2024"), so unpadded dates take the vectorized path too.
+pyarrow's strptime rolls invalid days over to the next month, so each
+parsed value is formatted back and compared with its input. Rows that
+fail to parse or to round-trip fall back to dateutil one at a time.
+"""
+
+import re
+from collections.abc import Sequence
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from dateutil import parser as date_parser
+
+from radar_data.infrastructure.parse.xlsx import serials_to_timestamps
+
+# Pseudo-format of columns holding Excel 1900-system date serials.
+EXCEL_SERIAL = "excel-serial"
+
+# Formats tried when inferring a column's format; ties go to the first.
+CANDIDATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%d/%m/%y",
+    "%d-%m-%y",
+    "%Y-%m",
+    "%Y/%m",
+    "%m/%Y",
+    "%m-%Y",
+    "%m %Y",
+    "%m/%y",
+    "%m-%y",
+    "%m %y",
+    "%Y%m%d",
+    "%Y",
+)
+SAMPLE_SIZE = 200
+
+# Spanish month names and abbreviations (including "set"/"setiembre").
+SPANISH_MONTHS = (
+    ("enero", "ene"),
+    ("febrero", "feb"),
+    ("marzo", "mar"),
+    ("abril", "abr"),
+    ("mayo", "may"),
+    ("junio", "jun"),
+    ("julio", "jul"),
+    ("agosto", "ago"),
+    ("septiembre", "setiembre", "sept", "sep", "set"),
+    ("octubre", "oct"),
+    ("noviembre", "nov"),
+    ("diciembre", "dic"),
+)
+_MONTH_PATTERNS = tuple(
+    (rf"(?i)\b(?:{'|'.join(names)})\b\.?", f"{number:02d}")
+    for number, names in enumerate(SPANISH_MONTHS, start=1)
+)
+_MONTH_NAME = re.compile(
+    r"\b(?:" + "|".join(name for names in SPANISH_MONTHS for name in names) + r")\b",
+    re.IGNORECASE,
+)
+_SERIAL = re.compile(r"\d{5}(?:\.\d+)?")
+_YEAR_FIRST = re.compile(r"\d{4}[-/]")
+# A single-digit field, padded by pad_date_fields().
+_UNPADDED = re.compile(r"(?<!\d)\d(?!\d)")
+_UNPADDED_FIELD = r"(^|\D)(\d)(\D|$)"
+# Fills the fields a fallback date omits ("09 2023" is 2023-09-01).
+_DEFAULT_DATE = datetime(2000, 1, 1)
+
+TIMESTAMP_TYPE = pa.timestamp("us")
+
+
+def parse_date_column(
+    values: Sequence[str | float] | pa.Array,
+    date_format: str | None = None,
+) -> pa.TimestampArray:
+    """Parse a column of raw dates into timestamps.
+
+    Args:
+        values: Raw date cells: text, or numbers holding Excel serials;
+            or an Arrow string array.
+        date_format: strptime format (or EXCEL_SERIAL) of the text
+            cells; inferred from a sample when None.
+
+    Returns:
+        Timestamp array (microseconds, naive) in the order of values.
+
+    Raises:
+        ValueError: If a value cannot be parsed as a date.
+    """
+    if isinstance(values, pa.Array):
+        return _parse_text(values.cast(pa.string()), date_format)
+    try:
+        column = pa.array(values, type=pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _parse_mixed(values, date_format)
+    return _parse_text(column, date_format)
+
+
+def infer_date_format(sample: Sequence[str]) -> str | None:
+    """Infer the format of a sample of date strings.
+
+    Spanish month names must already be rewritten to month numbers
+    (see replace_month_names()).
+
+    Args:
+        sample: Distinct, non-empty date strings of a column.
+
+    Returns:
+        The candidate format parsing the most of the sample, EXCEL_SERIAL
+        if the sample is all serials, or None if no candidate parses any.
+    """
+    if not sample:
+        return None
+    if all(_SERIAL.fullmatch(text) for text in sample):
+        return EXCEL_SERIAL
+    column = pa.array(sample, type=pa.string())
+    best, best_count = None, 0
+    for fmt in CANDIDATE_FORMATS:
+        count = pc.sum(_round_trips(column, fmt)).as_py() or 0
+        if count > best_count:
+            best, best_count = fmt, count
+            if count == len(sample):
+                break
+    return best
+
+
+def replace_month_names(column: pa.StringArray) -> pa.StringArray:
+    """Rewrite Spanish month names and abbreviations to two-digit numbers."""
+    for pattern, number in _MONTH_PATTERNS:
+        column = pc.replace_substring_regex(column, pattern=pattern, replacement=number)
+    return column
+
+
+def pad_date_fields(column: pa.StringArray) -> pa.StringArray:
+    """Zero-pad single-digit date and time fields ("5/3/2024" to "05/03/2024").
+
+    Excel serials ("45292.5") are left unchanged.
+    """
+    padded = column
+    # Adjacent fields share their separator, so a second pass pads the
+    # fields the first one skipped ("1-2-3").
+    for _ in range(2):
+        # RE2 group references are single digits: "\10" is group 1, then "0".
+        padded = pc.replace_substring_regex(padded, pattern=_UNPADDED_FIELD, replacement=r"\10\2\3")
+    serial = pc.match_substring_regex(column, pattern=r"^\d{5}(?:\.\d+)?$")
+    return pc.if_else(pc.fill_null(serial, False), column, padded)
+
+
+def _parse_text(column: pa.StringArray, date_format: str | None) -> pa.TimestampArray:
+    """Parse a string column, falling back to dateutil for rows that fail."""
+    if len(column) == 0:
+        return pa.array([], type=TIMESTAMP_TYPE)
+    column = pc.utf8_trim_whitespace(column)
+    sample = _sample(column)
+    if any(_MONTH_NAME.search(text) for text in sample):
+        column = replace_month_names(column)
+        sample = _sample(column)
+    if date_format != EXCEL_SERIAL and any(
+        _UNPADDED.search(text) and not _SERIAL.fullmatch(text) for text in sample
+    ):
+        column = pad_date_fields(column)
+        sample = _sample(column)
+    fmt = date_format or infer_date_format(sample)
+
+    if fmt is None:
+        parsed = pa.nulls(len(column), TIMESTAMP_TYPE)
+        ok = pa.array([False] * len(column))
+    elif fmt == EXCEL_SERIAL:
+        numeric = pc.match_substring_regex(column, pattern=r"^\d+(?:\.\d+)?$")
+        parsed = serials_to_timestamps(pc.if_else(numeric, column, None))
+        ok = pc.is_valid(parsed)
+    else:
+        parsed = pc.strptime(column, format=fmt, unit="s", error_is_null=True)
+        ok = _round_trips(column, fmt, parsed)
+        parsed = parsed.cast(TIMESTAMP_TYPE)
+    if pc.all(ok).as_py() is not False:
+        return parsed
+
+    result = parsed.to_pylist()
+    texts = column.to_pylist()
+    for index, good in enumerate(ok.to_pylist()):
+        if not good:
+            result[index] = _fallback(texts[index])
+    return pa.array(result, type=TIMESTAMP_TYPE)
+
+
+def _parse_mixed(
+    values: Sequence[str | float],
+    date_format: str | None,
+) -> pa.TimestampArray:
+    """Parse a column mixing text and numeric serial cells."""
+    text_rows = [index for index, value in enumerate(values) if isinstance(value, str)]
+    number_rows = [index for index, value in enumerate(values) if not isinstance(value, str)]
+    result: list[datetime | None] = [None] * len(values)
+    if text_rows:
+        texts = _parse_text(pa.array([values[i] for i in text_rows], pa.string()), date_format)
+        for index, timestamp in zip(text_rows, texts.to_pylist(), strict=True):
+            result[index] = timestamp
+    if number_rows:
+        numbers = pa.array([values[i] for i in number_rows], pa.float64())
+        for index, timestamp in zip(
+            number_rows, serials_to_timestamps(numbers).to_pylist(), strict=True
+        ):
+            result[index] = timestamp
+    return pa.array(result, type=TIMESTAMP_TYPE)
+
+
+def _round_trips(
+    column: pa.StringArray,
+    fmt: str,
+    parsed: pa.TimestampArray | None = None,
+) -> pa.BooleanArray:
+    """Mark values that parse with fmt and format back to the same text.
+
+    parsed must have second resolution; finer units format fractional
+    seconds.
+    """
+    if parsed is None:
+        parsed = pc.strptime(column, format=fmt, unit="s", error_is_null=True)
+    formatted = pc.strftime(parsed, format=fmt)
+    return pc.fill_null(pc.equal(formatted, column), False)
+
+
+def _sample(column: pa.StringArray) -> list[str]:
+    """Return up to SAMPLE_SIZE distinct non-empty values of a column."""
+    head = column.slice(0, SAMPLE_SIZE * 10)
+    return [text for text in pc.unique(head).to_pylist() if text][:SAMPLE_SIZE]
+
+
+def _fallback(text: str | None) -> datetime:
+    """Parse one serial, or one date with dateutil reading non-ISO dates day first."""
+    if not text:
+        raise ValueError(f"Failed to parse date: {text!r}")
+    parsed: datetime
+    if _SERIAL.fullmatch(text):
+        parsed = serials_to_timestamps(pa.array([float(text)])).to_pylist()[0]
+        return parsed
+    try:
+        dayfirst = not _YEAR_FIRST.match(text)
+        parsed = date_parser.parse(text, dayfirst=dayfirst, default=_DEFAULT_DATE)
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"Failed to parse date: {text!r}") from e
+    return parsed
@@ -1,12 +1,21 @@
 """External to internal mapping adapter implementing NormalizerPort."""
 
-from datetime import datetime
 from typing import Any
 
-from dateutil import parser as date_parser
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from radar_data.domain.batch import ObservationBatch
 from radar_data.domain.entities import Observation, Provenance, Series
 from radar_data.domain.interfaces import NormalizerPort
+from radar_data.infrastructure.normalize.dates import TIMESTAMP_TYPE, parse_date_column
+from radar_data.infrastructure.normalize.memo import ParseMemo
+from radar_data.infrastructure.normalize.numbers import (
+    NumberFormat,
+    coerce_numbers,
+    number_format_from_config,
+    resolve_number_format,
+)
 
 
 class MappingNormalizer(NormalizerPort):
@@ -16,15 +25,39 @@ class MappingNormalizer(NormalizerPort):
     to internal domain entities. Handles column mapping, date parsing,
     and entity creation.
 
+    Dates are parsed column-wise: the format is inferred once from a
+    sample (or taken from normalize.date_format) and the whole column is
+    converted in one vectorized pass, with dateutil only for rows that
+    do not match (see radar_data.infrastructure.normalize.dates).
+
+    Values are coerced the same way: formatted strings such as
+    "1.234.567,89" are converted in bulk with the separators of
+    normalize.decimal_separator / thousands_separator, or inferred per
+    column, and rows holding a null token ("-", "s/d", "///", or
+    normalize.null_tokens) are dropped (see
+    radar_data.infrastructure.normalize.numbers).
+
+    Date and value strings go through a ParseMemo shared by every call
+    of the normalizer, so strings repeated across series and columns
+    are parsed once per run; memo.stats reports hits and misses.
+
+    normalize_batch() returns the observations as a columnar
+    ObservationBatch, skipping the per-row Observation objects.
+
     TODO:
-        - Implement actual normalization logic.
-        - Add column mapping from config.
-        - Add date parsing with error handling.
         - Add unit conversion support.
-        - Add Series and Observation creation.
         - Add provenance tracking.
     """
 
+    def __init__(self, memo: ParseMemo | None = None) -> None:
+        """Initialize the normalizer.
+
+        Args:
+            memo: Memo of parsed strings, e.g. shared by several
+                normalizers. Defaults to a new ParseMemo.
+        """
+        self.memo = memo if memo is not None else ParseMemo()
+
     def normalize(
         self,
         raw_records: list[dict[str, str | float]],
@@ -32,6 +65,9 @@ class MappingNormalizer(NormalizerPort):
     ) -> tuple[Series, list[Observation]]:
         """Normalize raw records into domain entities.
 
+        Records are read under the parsers' "date" and "value" keys, or
+        under the configured source column names.
+
         Args:
             raw_records: List of raw dictionaries from parser.
             dataset_config: Configuration dict with normalize section.
@@ -41,59 +77,122 @@ class MappingNormalizer(NormalizerPort):
 
         Raises:
             ValueError: If normalization fails (e.g., missing required fields).
+        """
+        series, timestamps, values = self._normalize_columns(raw_records, dataset_config)
+        observations = [
+            Observation(series_code=series.code, timestamp=timestamp, value=value)
+            for timestamp, value in zip(timestamps.to_pylist(), values.to_pylist(), strict=True)
+            if value is not None
+        ]
+        return series, observations
+
+    def normalize_batch(
+        self,
+        raw_records: list[dict[str, str | float]],
+        dataset_config: dict[str, Any],
+        provenance: Provenance | None = None,
+    ) -> tuple[Series, ObservationBatch]:
+        """Normalize raw records into a columnar ObservationBatch.
+
+        Same as normalize(), but the parsed columns are kept as Arrow
+        arrays instead of being converted to one Observation per row.
+
+        Args:
+            raw_records: List of raw dictionaries from parser.
+            dataset_config: Configuration dict with normalize section.
+            provenance: Optional provenance attached to the batch.
+
+        Returns:
+            Tuple of (Series, ObservationBatch).
+
+        Raises:
+            ValueError: If normalization fails (e.g., missing required fields).
+        """
+        series, timestamps, values = self._normalize_columns(raw_records, dataset_config)
+        if values.null_count:
+            present = pc.is_valid(values)
+            timestamps, values = timestamps.filter(present), values.filter(present)
+        return series, ObservationBatch.from_arrays(series.code, timestamps, values, provenance)
+
+    def _normalize_columns(
+        self,
+        raw_records: list[dict[str, str | float]],
+        dataset_config: dict[str, Any],
+    ) -> tuple[Series, pa.Array, pa.Array]:
+        """Build the Series and parse the date and value columns.
 
-        TODO:
-            - Extract normalize config (internal_series_code, unit, frequency).
-            - Create Series entity.
-            - Map raw records to Observations:
-              - Parse dates using dateutil.
-              - Extract values (handle string/number conversion).
-              - Create Observation entities.
-            - Add provenance metadata if available.
+        Returns:
+            Tuple of (Series, timestamps, values); values are null where
+            the raw value is a null token.
         """
-        # TODO: Implement normalization
-        # normalize_config = dataset_config.get("normalize", {})
-        # source_config = dataset_config.get("source", {})
-        #
-        # # Create Series
-        # series = Series(
-        #     code=normalize_config.get("internal_series_code"),
-        #     name=dataset_config.get("name", ""),
-        #     unit=normalize_config.get("unit", ""),
-        #     frequency=normalize_config.get("frequency", ""),
-        #     provider=dataset_config.get("provider", ""),
-        # )
-        #
-        # # Map raw records to Observations
-        # observations = []
-        # columns = source_config.get("columns", {})
-        # date_col = columns.get("date", "date")
-        # value_col = columns.get("value", "value")
-        #
-        # for record in raw_records:
-        #     date_str = str(record.get(date_col, ""))
-        #     value_str = str(record.get(value_col, ""))
-        #
-        #     # Parse date
-        #     try:
-        #         timestamp = date_parser.parse(date_str)
-        #     except (ValueError, TypeError) as e:
-        #         raise ValueError(f"Failed to parse date: {date_str}") from e
-        #
-        #     # Parse value
-        #     try:
-        #         value = float(value_str)
-        #     except (ValueError, TypeError) as e:
-        #         raise ValueError(f"Failed to parse value: {value_str}") from e
-        #
-        #     # Create Observation
-        #     obs = Observation(
-        #         series_code=series.code,
-        #         timestamp=timestamp,
-        #         value=value,
-        #     )
-        #     observations.append(obs)
-        #
-        # return series, observations
-        pass
+        normalize_config = dataset_config.get("normalize", {})
+        code = normalize_config.get("internal_series_code")
+        if not code:
+            raise ValueError("normalize.internal_series_code is required")
+        series = Series(
+            code=code,
+            name=dataset_config.get("name", ""),
+            unit=normalize_config.get("unit", ""),
+            frequency=normalize_config.get("frequency", ""),
+            provider=dataset_config.get("provider", ""),
+        )
+
+        columns = dataset_config.get("source", {}).get("columns", {})
+        dates = _column(raw_records, "date", columns.get("date", "date"))
+        raw_values = _column(raw_records, "value", columns.get("value", "value"))
+        date_format = normalize_config.get("date_format")
+        number_format = number_format_from_config(normalize_config)
+        timestamps = self._parse_dates(dates, date_format)
+        values = self._parse_values(raw_values, number_format)
+        return series, timestamps, values
 
+    def _parse_dates(self, dates: list[str | float], date_format: str | None) -> pa.Array:
+        """Parse a date column, through the memo when it is all text."""
+        try:
+            column = pa.array(dates, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Text mixed with numeric Excel serials.
+            return parse_date_column(dates, date_format)
+        return self.memo.map_unique(
+            ("date", date_format),
+            column,
+            lambda distinct: parse_date_column(distinct, date_format),
+            TIMESTAMP_TYPE,
+        )
+
+    def _parse_values(self, values: list[str | float], number_format: NumberFormat) -> pa.Array:
+        """Coerce a value column; numbers pass through, text goes through the memo."""
+        try:
+            return pa.array(values, type=pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        try:
+            column = pa.array(values, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Text mixed with numeric Excel cells.
+            return coerce_numbers(values, number_format)
+        # Resolve the separators on the whole column so that every distinct
+        # string is memoized under the format it was parsed with.
+        number_format = resolve_number_format(column, number_format)
+        return self.memo.map_unique(
+            ("value", number_format),
+            column,
+            lambda distinct: coerce_numbers(distinct, number_format),
+            pa.float64(),
+        )
+
+
+def _column(
+    raw_records: list[dict[str, str | float]],
+    key: str,
+    column_name: str,
+) -> list[str | float]:
+    """Extract one field of every record, by record key or source column name."""
+    try:
+        return [record[key] for record in raw_records]
+    except KeyError:
+        pass
+    try:
+        return [record[key] if key in record else record[column_name] for record in raw_records]
+    except KeyError as e:
+        raise ValueError(f"Record has no {key!r} or {column_name!r} field") from e
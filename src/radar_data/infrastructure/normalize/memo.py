@@ -0,0 +1,192 @@
+"""Bounded LRU memo of parsed date and number strings.
+
+Provider files repeat the same strings across columns and series: every
+column of a wide INDEC table shares one date axis, and formatted values
+recur. A ParseMemo shared by the date and value coercion of a normalizer
+keeps the parsed result of each distinct string for the run, so repeated
+strings are parsed once.
+
+map_unique() works on whole columns. It dictionary-encodes the column,
+looks up each distinct string, parses only the unseen ones in a single
+batch call (so the column parsers stay vectorized), and expands the
+results back to the rows with one take(). Columns with more distinct
+values than the memo holds bypass it.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+DEFAULT_MAXSIZE = 100_000
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class MemoStats:
+    """Counters of a ParseMemo.
+
+    Attributes:
+        hits: Lookups answered from the memo.
+        misses: Lookups that had to be parsed.
+        evictions: Entries dropped to stay within maxsize.
+        size: Entries currently held.
+        maxsize: Maximum number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the memo (0.0 without lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ParseMemo:
+    """Thread-safe least recently used memo of parsed strings."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize the memo.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> MemoStats:
+        """Current hit, miss and eviction counters."""
+        with self._lock:
+            return MemoStats(
+                self._hits, self._misses, self._evictions, len(self._entries), self.maxsize
+            )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the memoized value of key, counting a hit or a miss.
+
+        Args:
+            key: Memo key, e.g. ("date", format, text).
+            default: Returned on a miss.
+
+        Returns:
+            The memoized value, or default.
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Memoize a value, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def map_unique(
+        self,
+        namespace: Hashable,
+        column: pa.Array,
+        parse: Callable[[pa.Array], pa.Array],
+        type: pa.DataType,
+    ) -> pa.Array:
+        """Parse a column through the memo, one lookup per distinct value.
+
+        Args:
+            namespace: Part of the key separating kinds of parses, e.g.
+                ("date", date_format) or "value".
+            column: Column of strings to parse.
+            parse: Vectorized parser called once with the distinct values
+                missing from the memo; returns one result per value.
+            type: Arrow type of the parsed column.
+
+        Returns:
+            Parsed column, aligned with column; nulls stay null.
+
+        Raises:
+            ValueError: If parse rejects a value.
+        """
+        encoded = pc.dictionary_encode(column)
+        dictionary = encoded.dictionary
+        if len(dictionary) > self.maxsize:
+            # More distinct values than the memo holds: it would only churn.
+            return parse(dictionary).take(encoded.indices)
+        # Temporal values are memoized as integers, which convert to and
+        # from Python much faster than datetime objects.
+        storage = pa.int64() if pa.types.is_temporal(type) else type
+        keys = list(zip(repeat(namespace), dictionary.to_pylist()))
+        results, missing = self._get_many(keys)
+        if len(missing) == len(keys):
+            parsed = parse(dictionary)
+            self._put_many(zip(keys, parsed.cast(storage).to_pylist(), strict=True))
+            return parsed.take(encoded.indices)
+        if missing:
+            parsed = parse(dictionary.take(pa.array(missing, pa.int64())))
+            for index, value in zip(missing, parsed.cast(storage).to_pylist(), strict=True):
+                results[index] = value
+            self._put_many((keys[index], results[index]) for index in missing)
+        return pa.array(results, type=storage).cast(type).take(encoded.indices)
+
+    def _get_many(self, keys: Sequence[Hashable]) -> tuple[list[Any], list[int]]:
+        """Look up several keys under one lock.
+
+        Returns:
+            Values (_MISSING on a miss) and the indices of the misses.
+        """
+        with self._lock:
+            entries = self._entries
+            results = list(map(entries.get, keys, repeat(_MISSING)))
+            missing = [index for index, value in enumerate(results) if value is _MISSING]
+            if len(missing) < len(keys):
+                skipped = set(missing)
+                for index, key in enumerate(keys):
+                    if index not in skipped:
+                        entries.move_to_end(key)
+            self._hits += len(keys) - len(missing)
+            self._misses += len(missing)
+        return results, missing
+
+    def _put_many(self, items: Iterable[tuple[Hashable, Any]]) -> None:
+        """Memoize several values under one lock."""
+        with self._lock:
+            # Keys were just missed, so update() appends them as most recent.
+            self._entries.update(items)
+            overflow = len(self._entries) - self.maxsize
+            for _ in range(max(overflow, 0)):
+                self._entries.popitem(last=False)
+            self._evictions += max(overflow, 0)
@@ -0,0 +1,238 @@
+"""Vectorized coercion of formatted number strings to float64.
+
+BCRA and INDEC publish values such as "1.234.567,89", "-3,2%" and
+placeholders such as "-", "s/d" and "///". coerce_numbers() converts a
+whole string column with pyarrow.compute, with no per-cell Python code.
+It trims whitespace, maps null tokens to null, removes the thousands
+separator, turns the decimal separator into a point and casts the
+column. Regexes run only when that cast fails: one strips currency and
+percent signs and inner spaces before a retry, the other finds the
+offending value to report.
+
+Separators left unset in a NumberFormat are inferred per column from a
+sample (infer_separators). If a value has both "," and ".", the last one
+is the decimal separator. Otherwise the column is read in the Argentine
+convention unless a value rules it out: "1,234" is 1.234 and
+"1.234.567" and "12.345" are integers, while "100.5" makes "." the
+decimal separator.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Placeholders for missing data, compared case-insensitively after trimming.
+DEFAULT_NULL_TOKENS = frozenset(
+    {"", "-", "--", "---", "s/d", "s.d.", "sd", "n/d", "nd", "///", "...", "x", "na", "nan"}
+)
+SAMPLE_SIZE = 200
+
+# Currency and percent signs, spaces and non-breaking spaces, dropped when
+# the plain cast fails.
+_NOISE = r"[\s\x{00a0}$%]"
+_NUMBER = r"^[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$"
+# A value whose "." can be a thousands separator ("12.345", "$ 1.000").
+_THOUSANDS = re.compile(r"^\D*\d{1,3}(?:\.\d{3})+\D*$")
+
+
+@dataclass(frozen=True)
+class NumberFormat:
+    """Separators and null tokens of a number column.
+
+    Attributes:
+        decimal: Decimal separator, or None to infer it.
+        thousands: Thousands separator ("" for none), or None to infer it.
+        null_tokens: Lowercase placeholders read as missing values.
+    """
+
+    decimal: str | None = None
+    thousands: str | None = None
+    null_tokens: frozenset[str] = field(default=DEFAULT_NULL_TOKENS)
+
+    def __post_init__(self) -> None:
+        decimal, thousands = self.decimal, self.thousands
+        if decimal is not None and len(decimal) != 1:
+            raise ValueError(f"Invalid decimal separator: {decimal!r}")
+        if thousands is not None and (len(thousands) > 1 or thousands == decimal):
+            raise ValueError(f"Invalid thousands separator: {thousands!r}")
+
+    @property
+    def resolved(self) -> bool:
+        """Whether both separators are set."""
+        return self.decimal is not None and self.thousands is not None
+
+
+ARGENTINE = NumberFormat(decimal=",", thousands=".")
+
+
+def number_format_from_config(normalize_config: dict[str, Any]) -> NumberFormat:
+    """Build the NumberFormat of a dataset's normalize section.
+
+    A single configured separator implies the other one ("," and "."),
+    e.g. decimal_separator "," means thousands_separator ".".
+
+    Args:
+        normalize_config: Normalize section, with optional
+            decimal_separator, thousands_separator and null_tokens.
+
+    Returns:
+        NumberFormat; separators not configured are left to inference.
+
+    Raises:
+        ValueError: If the separators are invalid.
+    """
+    decimal = normalize_config.get("decimal_separator")
+    thousands = normalize_config.get("thousands_separator")
+    if decimal is None and thousands in (".", ","):
+        decimal = "," if thousands == "." else "."
+    if thousands is None and decimal in (".", ","):
+        thousands = "." if decimal == "," else ","
+    tokens = normalize_config.get("null_tokens")
+    null_tokens = (
+        frozenset(token.strip().lower() for token in tokens)
+        if tokens is not None
+        else DEFAULT_NULL_TOKENS
+    )
+    return NumberFormat(decimal=decimal, thousands=thousands, null_tokens=null_tokens)
+
+
+def infer_separators(sample: Iterable[str]) -> tuple[str, str]:
+    """Infer the decimal and thousands separators of a column.
+
+    A value holding both "," and "." decides on its own: the last one is
+    the decimal separator. Otherwise "." is the decimal separator only if
+    a value has a single "." that cannot be a thousands separator
+    ("100.5") and no value has several; "," is the thousands separator
+    only if a value has several. Columns left ambiguous, such as
+    "1.234" or "999", get the Argentine format.
+
+    Args:
+        sample: Values of the column.
+
+    Returns:
+        Tuple of (decimal, thousands) separators.
+    """
+    point_decimal = point_thousands = comma_thousands = False
+    for text in sample:
+        comma, point = text.rfind(","), text.rfind(".")
+        if comma >= 0 and point >= 0:
+            return (",", ".") if comma > point else (".", ",")
+        if text.count(".") > 1:
+            point_thousands = True
+        elif point >= 0 and not _THOUSANDS.match(text):
+            point_decimal = True
+        if text.count(",") > 1:
+            comma_thousands = True
+    if (point_decimal or comma_thousands) and not point_thousands:
+        return (".", ",")
+    return (",", ".")
+
+
+def resolve_number_format(
+    column: pa.StringArray, number_format: NumberFormat | None = None
+) -> NumberFormat:
+    """Fill the unset separators of number_format from a sample of column.
+
+    Args:
+        column: Column of formatted numbers.
+        number_format: Partially or fully set format; defaults to NumberFormat().
+
+    Returns:
+        NumberFormat with both separators set.
+    """
+    number_format = number_format if number_format is not None else NumberFormat()
+    if number_format.resolved:
+        return number_format
+    sample = pc.unique(column.slice(0, SAMPLE_SIZE * 10)).drop_null().to_pylist()[:SAMPLE_SIZE]
+    decimal, thousands = infer_separators(sample)
+    if number_format.decimal is not None:
+        decimal = number_format.decimal
+        thousands = "" if thousands == decimal else thousands
+    elif number_format.thousands is not None:
+        thousands = number_format.thousands
+        decimal = "." if decimal == thousands else decimal
+    return replace(number_format, decimal=decimal, thousands=thousands)
+
+
+def coerce_numbers(
+    values: Sequence[str | float] | pa.Array,
+    number_format: NumberFormat | None = None,
+) -> pa.DoubleArray:
+    """Convert a column of formatted numbers to float64.
+
+    Args:
+        values: Raw values; numbers pass through unchanged.
+        number_format: Separators and null tokens; unset separators are
+            inferred from a sample of the text values.
+
+    Returns:
+        float64 array aligned with values; null tokens become null.
+
+    Raises:
+        ValueError: If a value is neither a number nor a null token.
+    """
+    if isinstance(values, pa.Array):
+        if pa.types.is_floating(values.type) or pa.types.is_integer(values.type):
+            return values.cast(pa.float64())
+        return _coerce_text(values.cast(pa.string()), number_format)
+    try:
+        return pa.array(values, type=pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    try:
+        return _coerce_text(pa.array(values, type=pa.string()), number_format)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    # Numeric cells mixed with text cells, as in Excel columns.
+    text_rows = [index for index, value in enumerate(values) if isinstance(value, str)]
+    texts = _coerce_text(pa.array([values[i] for i in text_rows], pa.string()), number_format)
+    result = [None if isinstance(value, str) else value for value in values]
+    for index, number in zip(text_rows, texts.to_pylist(), strict=True):
+        result[index] = number
+    return pa.array(result, type=pa.float64())
+
+
+def _coerce_text(column: pa.StringArray, number_format: NumberFormat | None) -> pa.DoubleArray:
+    """Convert a string column; see coerce_numbers()."""
+    fmt = resolve_number_format(column, number_format)
+    column = pc.utf8_trim_whitespace(column)
+    tokens = pa.array(sorted(fmt.null_tokens), pa.string())
+    column = pc.if_else(pc.is_in(pc.utf8_lower(column), value_set=tokens), None, column)
+
+    numbers = _cast(_to_point_decimal(column, fmt))
+    if numbers is not None:
+        return numbers
+    # Slow path: strip signs and inner spaces with a regex, then retry.
+    cleaned = pc.replace_substring_regex(column, pattern=_NOISE, replacement="")
+    cleaned = _to_point_decimal(cleaned, fmt)
+    numbers = _cast(cleaned)
+    if numbers is not None:
+        return numbers
+    invalid = pc.invert(pc.fill_null(pc.match_substring_regex(cleaned, pattern=_NUMBER), True))
+    bad = pc.indices_nonzero(invalid)[0].as_py()
+    raise ValueError(f"Failed to parse value: {column[bad].as_py()!r}")
+
+
+def _to_point_decimal(column: pa.StringArray, fmt: NumberFormat) -> pa.StringArray:
+    """Drop the thousands separator and turn the decimal separator into a point."""
+    if fmt.thousands:
+        column = pc.replace_substring(column, pattern=fmt.thousands, replacement="")
+    if fmt.decimal != ".":
+        column = pc.replace_substring(column, pattern=fmt.decimal, replacement=".")
+    return column
+
+
+def _cast(column: pa.StringArray) -> pa.DoubleArray | None:
+    """Cast to float64, or None if a value is not a finite number."""
+    try:
+        numbers = pc.cast(column, pa.float64())
+    except pa.ArrowInvalid:
+        return None
+    # cast() also accepts "inf" and "nan", which are not data.
+    if pc.any(pc.invert(pc.is_finite(numbers))).as_py():
+        return None
+    return numbers
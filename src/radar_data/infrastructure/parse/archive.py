@@ -0,0 +1,144 @@
+"""Archive reader adapter implementing ParserPort.
+
+Parses CSV and Excel files packed in ZIP or GZIP archives without
+extracting them to disk. Members are decompressed on the fly and
+streamed straight into the parser registered for their file type.
+"""
+
+import gzip
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, cast
+
+from radar_data.domain.interfaces import ParserPort, StreamingParserPort
+from radar_data.infrastructure.parse.csv_reader import CsvReader
+from radar_data.infrastructure.parse.excel_reader import ExcelReader
+
+
+class ArchiveReader(ParserPort):
+    """Adapter for parsing files inside ZIP and GZIP archives.
+
+    Members are selected by the source.member glob (e.g., "*.csv" or
+    "series/ipc_*.xlsx", matched against the end of the member path) and
+    handed as decompressing streams to the first inner parser that
+    supports them. Independent members are parsed in parallel threads;
+    zlib releases the GIL while inflating, so decompression overlaps.
+    Records are returned in archive member order.
+
+    Inner parsers must implement StreamingParserPort, whose
+    parse_stream(stream, dataset_config) reads each member.
+    """
+
+    def __init__(
+        self,
+        parsers: list[ParserPort] | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize the archive reader.
+
+        Args:
+            parsers: Parsers for archive members; defaults to
+                [CsvReader(), ExcelReader()].
+            max_workers: Maximum number of members parsed concurrently.
+        """
+        self.parsers = parsers if parsers is not None else [CsvReader(), ExcelReader()]
+        self.max_workers = max_workers
+
+    def parse(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+    ) -> list[dict[str, str | float]]:
+        """Parse the selected members of an archive into raw records.
+
+        Args:
+            file_path: Path to the ZIP or GZIP archive.
+            dataset_config: Configuration dict; source.member selects members.
+
+        Returns:
+            Records of every selected member, concatenated in member order.
+
+        Raises:
+            ValueError: If no member matches or a member has no parser.
+            FileNotFoundError: If file_path does not exist.
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Archive not found: {file_path}")
+
+        pattern = dataset_config.get("source", {}).get("member") or "*"
+        names = [name for name in self.members(file_path) if PurePosixPath(name).match(pattern)]
+        if not names:
+            raise ValueError(f"No member of {file_path} matches {pattern!r}")
+        parsers = [self._parser_for(name) for name in names]
+
+        def parse_member(index: int) -> list[dict[str, str | float]]:
+            with self.open_member(file_path, names[index]) as stream:
+                return parsers[index].parse_stream(stream, dataset_config)
+
+        if len(names) == 1:
+            return parse_member(0)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+            results = executor.map(parse_member, range(len(names)))
+            return [record for records in results for record in records]
+
+    def members(self, file_path: str) -> list[str]:
+        """List the file members of an archive.
+
+        Args:
+            file_path: Path to the ZIP or GZIP archive.
+
+        Returns:
+            Member names in archive order; a GZIP file has a single member
+            named after the file without its .gz suffix.
+        """
+        if _is_gzip(file_path):
+            return [Path(file_path).stem]
+        with zipfile.ZipFile(file_path) as archive:
+            return [info.filename for info in archive.infolist() if not info.is_dir()]
+
+    @contextmanager
+    def open_member(self, file_path: str, name: str) -> Iterator[IO[bytes]]:
+        """Open an archive member as a decompressing binary stream.
+
+        Each call opens its own handle on the archive, so members can be
+        read from several threads at once.
+
+        Args:
+            file_path: Path to the ZIP or GZIP archive.
+            name: Member name, as returned by members().
+
+        Yields:
+            Readable binary stream of the decompressed member.
+        """
+        if _is_gzip(file_path):
+            with gzip.open(file_path, "rb") as stream:
+                yield cast(IO[bytes], stream)
+            return
+        with zipfile.ZipFile(file_path) as archive, archive.open(name) as stream:
+            yield stream
+
+    def supports(self, file_path: str) -> bool:
+        """Check if this parser supports the given file type.
+
+        Args:
+            file_path: Path to the file to check.
+
+        Returns:
+            True if file is a ZIP or GZIP archive, False otherwise.
+        """
+        return file_path.lower().endswith((".zip", ".gz"))
+
+    def _parser_for(self, name: str) -> StreamingParserPort:
+        """Return the first inner parser able to stream the given member."""
+        for parser in self.parsers:
+            if isinstance(parser, StreamingParserPort) and parser.supports(name):
+                return parser
+        raise ValueError(f"No streaming parser supports archive member: {name}")
+
+
+def _is_gzip(file_path: str) -> bool:
+    """Check whether a path names a GZIP-compressed file."""
+    return file_path.lower().endswith(".gz")
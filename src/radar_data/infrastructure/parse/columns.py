@@ -0,0 +1,97 @@
+"""Helpers for resolving configured columns and cell references.
+
+Dataset configs refer to columns by header name, by 0-based index
+(e.g., "2") or by spreadsheet letter (e.g., "B"), and to the first row
+of a table by a cell reference such as "A3".
+"""
+
+import re
+
+_CELL_REF = re.compile(r"^([A-Za-z]+)(\d+)$")
+
+
+def column_letter_to_index(letters: str) -> int:
+    """Convert a spreadsheet column letter to a 0-based index.
+
+    Args:
+        letters: Column letters (e.g., "A", "AB").
+
+    Returns:
+        0-based column index ("A" -> 0, "AB" -> 27).
+    """
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
+
+
+def parse_cell_ref(cell: str | None) -> tuple[int, int]:
+    """Parse a cell reference into 1-based row and 0-based column.
+
+    Args:
+        cell: Cell reference such as "B3", or None/"" for the first cell.
+
+    Returns:
+        Tuple of (row, column) where row is 1-based and column 0-based.
+
+    Raises:
+        ValueError: If the reference is malformed.
+    """
+    if not cell:
+        return 1, 0
+    match = _CELL_REF.match(cell.strip())
+    if match is None:
+        raise ValueError(f"Invalid cell reference: {cell!r}")
+    return int(match.group(2)), column_letter_to_index(match.group(1))
+
+
+def resolve_column(header: list[str], spec: str, offset: int = 0) -> int:
+    """Resolve a configured column to an index in a header row.
+
+    Header names take precedence; otherwise digits are read as a 0-based
+    index and upper-case letters (up to "XFD") as a spreadsheet column,
+    both relative to the sheet rather than to offset.
+
+    Args:
+        header: Header row values, starting at column offset.
+        spec: Column name, 0-based index or spreadsheet letter.
+        offset: Absolute column index of header[0].
+
+    Returns:
+        Index into rows aligned with header.
+
+    Raises:
+        ValueError: If the column cannot be resolved.
+    """
+    stripped = [str(name).strip() for name in header]
+    if spec in stripped:
+        return stripped.index(spec)
+    if spec.isdigit():
+        return int(spec) - offset
+    if spec.isalpha() and spec.isupper() and len(spec) <= 3:
+        return column_letter_to_index(spec) - offset
+    raise ValueError(f"Column {spec!r} not found in header: {stripped}")
+
+
+def resolve_date_value_columns(
+    header: list[str],
+    columns: dict[str, str],
+    offset: int = 0,
+) -> tuple[int, int]:
+    """Resolve the configured date and value columns of a table.
+
+    Args:
+        header: Header row values, starting at column offset.
+        columns: Column mapping from the source config ("date", "value").
+        offset: Absolute column index of header[0].
+
+    Returns:
+        Tuple of (date_index, value_index) into rows aligned with header.
+
+    Raises:
+        ValueError: If a column cannot be resolved.
+    """
+    return (
+        resolve_column(header, columns.get("date") or "date", offset),
+        resolve_column(header, columns.get("value") or "value", offset),
+    )
@@ -0,0 +1,96 @@
+"""Split CSV files into byte ranges that start and end on record boundaries.
+
+A newline only ends a record when it lies outside a quoted field. With
+RFC 4180 quoting (embedded quotes are doubled) a position is inside a
+quoted field exactly when an odd number of quote characters precede it,
+so boundaries are found by tracking quote parity. Quotes are counted
+block by block with bytes.count(), so the scan runs at memory speed and
+only the few lines around each nominal split point are inspected in
+Python.
+"""
+
+from pathlib import Path
+from typing import BinaryIO
+
+# Bytes read per step of the quote-parity scan.
+_SCAN_BLOCK = 1 << 22
+
+
+class _QuoteScanner:
+    """Walk a binary file forward while tracking quote parity."""
+
+    def __init__(self, f: BinaryIO, quotechar: bytes) -> None:
+        self.f = f
+        self.quotechar = quotechar
+        self.pos = 0
+        self.in_quotes = False
+
+    def advance_to(self, offset: int) -> None:
+        """Move to offset, updating the parity with the quotes passed over."""
+        while self.pos < offset:
+            data = self.f.read(min(_SCAN_BLOCK, offset - self.pos))
+            if not data:
+                return
+            if data.count(self.quotechar) % 2:
+                self.in_quotes = not self.in_quotes
+            self.pos += len(data)
+
+    def next_record_start(self) -> int:
+        """Move past the next newline outside quotes and return the position.
+
+        Returns the end of the file if no such newline follows.
+        """
+        while data := self.f.read(_SCAN_BLOCK):
+            start = 0
+            while (newline := data.find(b"\n", start)) >= 0:
+                if data.count(self.quotechar, start, newline) % 2:
+                    self.in_quotes = not self.in_quotes
+                if not self.in_quotes:
+                    self.pos += newline + 1
+                    self.f.seek(self.pos)
+                    return self.pos
+                start = newline + 1
+            if data.count(self.quotechar, start) % 2:
+                self.in_quotes = not self.in_quotes
+            self.pos += len(data)
+        return self.pos
+
+
+def record_ranges(
+    path: str | Path,
+    chunk_size: int,
+    skip_records: int = 0,
+    quotechar: str = '"',
+) -> list[tuple[int, int]]:
+    """Split a CSV file into byte ranges aligned to record boundaries.
+
+    Args:
+        path: Path to the CSV file.
+        chunk_size: Target number of bytes per range.
+        skip_records: Records at the start of the file (title and header
+            rows) excluded from the ranges.
+        quotechar: Quote character of the CSV dialect.
+
+    Returns:
+        Consecutive, non-empty (start, end) byte ranges covering the data
+        records; each range starts at the beginning of a record and ends
+        just after a record's newline (or at the end of the file).
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    size = Path(path).stat().st_size
+    with open(path, "rb") as f:
+        scanner = _QuoteScanner(f, quotechar.encode("ascii"))
+        start = 0
+        for _ in range(skip_records):
+            start = scanner.next_record_start()
+        ranges = []
+        while start < size:
+            scanner.advance_to(start + chunk_size)
+            end = size if scanner.pos >= size else scanner.next_record_start()
+            ranges.append((start, end))
+            start = end
+    return ranges
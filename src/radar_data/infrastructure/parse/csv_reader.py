@@ -1,25 +1,98 @@
 """CSV reader adapter implementing ParserPort."""
 
-from typing import Any
+import csv
+import io
+import math
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from pathlib import Path
+from typing import IO, Any
 
-from radar_data.domain.interfaces import ParserPort
+import pyarrow as pa
+from pyarrow import csv as pacsv
 
+from radar_data.domain.interfaces import ParserPort, StreamingParserPort
+from radar_data.infrastructure.parse.columns import parse_cell_ref, resolve_date_value_columns
+from radar_data.infrastructure.parse.csv_chunks import record_ranges
+from radar_data.infrastructure.parse.mmap_csv import iter_mapped_rows
+from radar_data.infrastructure.parse.quarantine import (
+    DECODE_ERROR,
+    MALFORMED_ROW,
+    SHORT_ROW,
+    QuarantineWriter,
+    is_decodable,
+    row_reason,
+)
 
-class CsvReader(ParserPort):
+
+class CsvReader(ParserPort, StreamingParserPort):
     """Adapter for parsing CSV files.
 
-    Implements the ParserPort interface for CSV format.
-    Uses Python's built-in csv module for reading.
+    Implements the ParserPort and StreamingParserPort interfaces for CSV
+    format. Uses Python's built-in csv module for reading; iter_batches()
+    reads the file incrementally, holding one batch of records at a time.
+    With memory_map=True, parse() and iter_batches() instead tokenize a
+    read-only memory mapping of the file in place and decode only the
+    mapped date/value fields, so rows are never copied into the heap.
+
+    The header row is the row of source.start_cell (default "A1"), and
+    each record holds the configured date and value columns under the
+    keys "date" and "value". Columns can be given by header name, by
+    0-based index or by spreadsheet letter.
+
+    read_table() and iter_record_batches() are a columnar fast path built
+    on pyarrow.csv: only the mapped date/value columns are converted,
+    with explicit column types, and blocks are parsed on multiple threads.
+    They return Arrow data with "date" and "value" columns. Quoted fields
+    may span lines; rows with a wrong number of fields raise instead of
+    being dropped.
+    iter_record_batches_parallel() and read_table_parallel() split very
+    large files into byte ranges aligned to record boundaries and parse
+    each range in a worker process.
+
+    parse_tolerant() keeps going past bad rows: rows that fail coercion
+    are streamed to a quarantine file and counted by reason.
 
     TODO:
-        - Implement actual CSV parsing.
-        - Add support for different delimiters.
-        - Add support for header rows.
-        - Add support for column selection based on config.
-        - Add support for skipping rows.
         - Add encoding detection.
     """
 
+    def __init__(
+        self,
+        delimiter: str = ",",
+        encoding: str = "utf-8-sig",
+        use_threads: bool = True,
+        block_size: int = 1 << 20,
+        memory_map: bool = False,
+    ) -> None:
+        """Initialize the CSV reader.
+
+        Args:
+            delimiter: CSV delimiter character.
+            encoding: Text encoding of the files.
+            use_threads: Whether the columnar path parses blocks in parallel.
+            block_size: Bytes per block of the columnar path; each block
+                becomes one record batch in iter_record_batches().
+            memory_map: Whether parse() and iter_batches() read files
+                through a memory mapping; the encoding must then be
+                ASCII-compatible.
+        """
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.use_threads = use_threads
+        self.block_size = block_size
+        self.memory_map = memory_map
+
+    def cache_identity(self) -> dict[str, str]:
+        """Return the settings that change the parsed records.
+
+        Used in parse cache keys; use_threads, block_size and
+        memory_map only affect speed and are left out.
+        """
+        return {"delimiter": self.delimiter, "encoding": self.encoding}
+
     def parse(
         self,
         file_path: str,
@@ -29,7 +102,7 @@ class CsvReader(ParserPort):
 
         Args:
             file_path: Path to the CSV file.
-            dataset_config: Configuration dict specifying columns, start_row, etc.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
 
         Returns:
             List of dictionaries, each representing a raw record.
@@ -37,39 +110,425 @@ class CsvReader(ParserPort):
         Raises:
             ValueError: If config is invalid or file cannot be parsed.
             FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+        if self.memory_map:
+            return list(self._iter_mapped_records(path, dataset_config))
+        with open(path, "rb") as f:
+            return self.parse_stream(f, dataset_config)
+
+    def parse_tolerant(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        quarantine_path: str | Path,
+    ) -> tuple[list[dict[str, str | float]], dict[str, int]]:
+        """Parse a CSV file, quarantining rows that fail coercion.
+
+        Malformed rows, rows missing the mapped columns, undecodable
+        fields, and dates or values that do not coerce are appended to
+        quarantine_path with their line number and reason instead of
+        aborting the parse (see the quarantine module). The file is
+        always read as a stream, even with memory_map=True.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            quarantine_path: Gzip-compressed CSV receiving the bad rows.
+
+        Returns:
+            Tuple of (records of the good rows, count of quarantined rows
+            per reason).
+
+        Raises:
+            ValueError: If config is invalid or the columns are not found.
+            FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+        with QuarantineWriter(quarantine_path) as quarantine, open(path, "rb") as f:
+            records = list(self._iter_tolerant_records(f, dataset_config, quarantine, str(path)))
+        return records, dict(quarantine.counts)
+
+    def iter_batches(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        batch_size: int = 10_000,
+    ) -> Iterator[list[dict[str, str | float]]]:
+        """Parse a CSV file lazily into batches of raw records.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            batch_size: Maximum number of records per batch.
+
+        Returns:
+            Iterator of record lists, in file order.
+
+        Raises:
+            ValueError: If config is invalid or the columns are not found.
+            FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+
+        def batches() -> Iterator[list[dict[str, str | float]]]:
+            if self.memory_map:
+                if batch_size < 1:
+                    raise ValueError("batch_size must be at least 1")
+                records = self._iter_mapped_records(path, dataset_config)
+                while batch := list(islice(records, batch_size)):
+                    yield batch
+                return
+            with open(path, "rb") as f:
+                yield from self.iter_stream_batches(f, dataset_config, batch_size)
+
+        return batches()
+
+    def read_table(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> pa.Table:
+        """Parse the mapped columns of a CSV file into an Arrow table.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            column_types: Optional Arrow types for "date" and/or "value";
+                both are read as strings by default.
+
+        Returns:
+            Table with "date" and "value" columns.
+
+        Raises:
+            ValueError: If config is invalid, the columns are not found or
+                a row's number of fields does not match the header (use
+                parse_tolerant() to quarantine such rows).
+            FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+        table = pacsv.read_csv(path, **self._arrow_options(path, dataset_config, column_types))
+        return table.rename_columns(["date", "value"])
+
+    def iter_record_batches(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the mapped columns of a CSV file as Arrow record batches.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            column_types: Optional Arrow types for "date" and/or "value".
+
+        Returns:
+            Iterator of record batches with "date" and "value" columns,
+            one per block_size bytes of input.
+
+        Raises:
+            ValueError: If config is invalid, the columns are not found or
+                a row's number of fields does not match the header.
+            FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+        options = self._arrow_options(path, dataset_config, column_types)
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            with pacsv.open_csv(path, **options) as reader:
+                for batch in reader:
+                    yield pa.RecordBatch.from_arrays(batch.columns, names=["date", "value"])
+
+        return batches()
+
+    def iter_record_batches_parallel(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        column_types: dict[str, pa.DataType] | None = None,
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Parse byte ranges of a CSV file in worker processes.
+
+        The data rows are split into ranges that start and end on record
+        boundaries (newlines inside quoted fields are not boundaries),
+        each range is parsed with pyarrow.csv in a worker process, and
+        the batches are yielded in file order.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            column_types: Optional Arrow types for "date" and/or "value".
+            max_workers: Maximum number of worker processes. Defaults to
+                the number of CPUs; with one worker the ranges are parsed
+                in this process.
+            chunk_size: Target bytes per range. Defaults to a quarter of
+                each worker's share of the file, and at least block_size.
+
+        Returns:
+            Iterator of record batches with "date" and "value" columns.
+
+        Raises:
+            ValueError: If config is invalid, the columns are not found or
+                a row's number of fields does not match the header.
+            FileNotFoundError: If file_path does not exist.
+        """
+        path = _existing(file_path)
+        options = self._arrow_options(path, dataset_config, column_types, header_in_data=False)
+        header_row, _ = parse_cell_ref(dataset_config.get("source", {}).get("start_cell"))
+        workers = max_workers or os.cpu_count() or 1
+        if chunk_size is None:
+            share = math.ceil(path.stat().st_size / (workers * 4))
+            chunk_size = max(self.block_size, share)
+        ranges = record_ranges(path, chunk_size, skip_records=header_row)
+        workers = min(workers, len(ranges))
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            if workers <= 1:
+                tables: Iterator[pa.Table] = map(_read_range, repeat(path), ranges, repeat(options))
+                for table in tables:
+                    yield from table.to_batches()
+                return
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map() yields results in submission order.
+                for table in executor.map(_read_range, repeat(path), ranges, repeat(options)):
+                    yield from table.to_batches()
+
+        return batches()
+
+    def read_table_parallel(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        column_types: dict[str, pa.DataType] | None = None,
+        max_workers: int | None = None,
+    ) -> pa.Table:
+        """Parse a CSV file into an Arrow table using worker processes.
+
+        Args:
+            file_path: Path to the CSV file.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            column_types: Optional Arrow types for "date" and/or "value".
+            max_workers: Maximum number of worker processes.
+
+        Returns:
+            Table with "date" and "value" columns, rows in file order.
+
+        Raises:
+            ValueError: If config is invalid, the columns are not found or
+                a row's number of fields does not match the header.
+            FileNotFoundError: If file_path does not exist.
+        """
+        batches = self.iter_record_batches_parallel(
+            file_path, dataset_config, column_types, max_workers
+        )
+        schema = pa.schema(
+            [
+                ("date", (column_types or {}).get("date", pa.string())),
+                ("value", (column_types or {}).get("value", pa.string())),
+            ]
+        )
+        return pa.Table.from_batches(list(batches), schema=schema)
 
-        TODO:
-            - Read CSV file with appropriate encoding.
-            - Skip rows based on start_row config.
-            - Select columns based on config.
-            - Parse dates and numbers appropriately.
+    def _arrow_options(
+        self,
+        path: Path,
+        dataset_config: dict[str, Any],
+        column_types: dict[str, pa.DataType] | None,
+        header_in_data: bool = True,
+    ) -> dict[str, Any]:
+        """Build pyarrow.csv options reading only the mapped columns.
+
+        With header_in_data=False the options parse data rows only (as in
+        a byte range past the header), naming the columns from the header.
         """
-        # TODO: Implement CSV parsing
-        # import csv
-        # from pathlib import Path
-        #
-        # file = Path(file_path)
-        # if not file.exists():
-        #     raise FileNotFoundError(f"CSV file not found: {file_path}")
-        #
-        # source_config = dataset_config.get("source", {})
-        # columns = source_config.get("columns", {})
-        # start_row = source_config.get("start_row", 0)
-        #
-        # records = []
-        # with open(file, "r", encoding="utf-8-sig") as f:
-        #     reader = csv.DictReader(f)
-        #     for i, row in enumerate(reader):
-        #         if i < start_row:
-        #             continue
-        #         record = {
-        #             "date": row.get(columns.get("date", "date")),
-        #             "value": row.get(columns.get("value", "value")),
-        #         }
-        #         records.append(record)
-        #
-        # return records
-        pass
+        source_config = dataset_config.get("source", {})
+        header_row, _ = parse_cell_ref(source_config.get("start_cell"))
+        with open(path, encoding=self.encoding, newline="") as f:
+            header = next(
+                islice(csv.reader(f, delimiter=self.delimiter), header_row - 1, None), None
+            )
+        if header is None:
+            raise ValueError(f"CSV file has no header row {header_row}: {path}")
+        date_idx, value_idx = resolve_date_value_columns(header, source_config.get("columns", {}))
+        if max(date_idx, value_idx) >= len(header):
+            raise ValueError(f"Column index out of range for header: {header}")
+
+        types = column_types or {}
+        date_name, value_name = header[date_idx], header[value_idx]
+        if header_in_data:
+            read_options = pacsv.ReadOptions(
+                skip_rows=header_row - 1,
+                use_threads=self.use_threads,
+                block_size=self.block_size,
+                encoding=_arrow_encoding(self.encoding),
+            )
+        else:
+            # Ranges are parsed in separate processes; one thread each.
+            read_options = pacsv.ReadOptions(
+                column_names=header,
+                use_threads=False,
+                block_size=self.block_size,
+                encoding=_arrow_encoding(self.encoding),
+            )
+        return {
+            "read_options": read_options,
+            # Quoted fields may span lines; Arrow then splits blocks only at
+            # record boundaries. Rows with a wrong field count raise.
+            "parse_options": pacsv.ParseOptions(delimiter=self.delimiter, newlines_in_values=True),
+            "convert_options": pacsv.ConvertOptions(
+                include_columns=[date_name, value_name],
+                column_types={
+                    date_name: types.get("date", pa.string()),
+                    value_name: types.get("value", pa.string()),
+                },
+            ),
+        }
+
+    def parse_stream(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict[str, Any],
+    ) -> list[dict[str, str | float]]:
+        """Parse CSV content from a binary stream into raw records.
+
+        Used for sources that are not plain files on disk, such as
+        members of an archive decompressed on the fly.
+
+        Args:
+            stream: Readable binary stream positioned at the start of the CSV.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+
+        Returns:
+            List of dictionaries, each representing a raw record.
+
+        Raises:
+            ValueError: If config is invalid or the columns are not found.
+        """
+        return list(self._iter_records(stream, dataset_config))
+
+    def iter_stream_batches(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict[str, Any],
+        batch_size: int = 10_000,
+    ) -> Iterator[list[dict[str, str | float]]]:
+        """Parse CSV content from a binary stream into batches of raw records.
+
+        Args:
+            stream: Readable binary stream positioned at the start of the CSV.
+            dataset_config: Configuration dict specifying columns, start_cell, etc.
+            batch_size: Maximum number of records per batch.
+
+        Returns:
+            Iterator of record lists, in stream order.
+
+        Raises:
+            ValueError: If config is invalid or the columns are not found.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        records = self._iter_records(stream, dataset_config)
+        while batch := list(islice(records, batch_size)):
+            yield batch
+
+    def _iter_records(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict[str, Any],
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield the records of a CSV stream one at a time."""
+        source_config = dataset_config.get("source", {})
+        columns = source_config.get("columns", {})
+        header_row, _ = parse_cell_ref(source_config.get("start_cell"))
+
+        text = io.TextIOWrapper(stream, encoding=self.encoding, newline="")
+        try:
+            reader = csv.reader(text, delimiter=self.delimiter)
+            for _ in range(header_row - 1):
+                if next(reader, None) is None:
+                    return
+            header = next(reader, None)
+            if header is None:
+                return
+            date_idx, value_idx = resolve_date_value_columns(header, columns)
+            width = max(date_idx, value_idx)
+            for row in reader:
+                if len(row) > width:
+                    yield {"date": row[date_idx], "value": row[value_idx]}
+        finally:
+            # Leave the caller's stream open.
+            text.detach()
+
+    def _iter_tolerant_records(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict[str, Any],
+        quarantine: QuarantineWriter,
+        source: str,
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield the records of the good rows, quarantining the others."""
+        source_config = dataset_config.get("source", {})
+        columns = source_config.get("columns", {})
+        header_row, _ = parse_cell_ref(source_config.get("start_cell"))
+
+        # Undecodable bytes become surrogates, caught per row below.
+        text = io.TextIOWrapper(
+            stream, encoding=self.encoding, errors="surrogateescape", newline=""
+        )
+        try:
+            reader = csv.reader(text, delimiter=self.delimiter)
+            for _ in range(header_row - 1):
+                if next(reader, None) is None:
+                    return
+            header = next(reader, None)
+            if header is None:
+                return
+            date_idx, value_idx = resolve_date_value_columns(header, columns)
+            width = max(date_idx, value_idx)
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as exc:
+                    quarantine.write(source, reader.line_num, MALFORMED_ROW, str(exc))
+                    continue
+                if len(row) <= width:
+                    if row:
+                        raw = self.delimiter.join(row)
+                        quarantine.write(source, reader.line_num, SHORT_ROW, raw)
+                    continue
+                date, value = row[date_idx], row[value_idx]
+                reason = row_reason(date, value) if is_decodable(date, value) else DECODE_ERROR
+                if reason is not None:
+                    quarantine.write(source, reader.line_num, reason, self.delimiter.join(row))
+                    continue
+                yield {"date": date, "value": value}
+        finally:
+            text.detach()
+
+    def _iter_mapped_records(
+        self,
+        path: Path,
+        dataset_config: dict[str, Any],
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield the records of a memory-mapped CSV file one at a time."""
+        source_config = dataset_config.get("source", {})
+        columns = source_config.get("columns", {})
+        header_row, _ = parse_cell_ref(source_config.get("start_cell"))
+        rows = iter_mapped_rows(
+            path,
+            lambda header: resolve_date_value_columns(header, columns),
+            header_row=header_row,
+            delimiter=self.delimiter,
+            encoding=self.encoding,
+        )
+        for date, value in rows:
+            yield {"date": date, "value": value}
 
     def supports(self, file_path: str) -> bool:
         """Check if this parser supports the given file type.
@@ -82,3 +541,25 @@ class CsvReader(ParserPort):
         """
         return file_path.lower().endswith(".csv")
 
+
+def _existing(file_path: str) -> Path:
+    """Return file_path as a Path, raising if the file does not exist."""
+    file = Path(file_path)
+    if not file.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+    return file
+
+
+def _arrow_encoding(encoding: str) -> str:
+    """Map a Python codec name to pyarrow.csv, which skips UTF-8 BOMs itself."""
+    return "utf8" if encoding.lower().replace("_", "-") in ("utf-8", "utf-8-sig") else encoding
+
+
+def _read_range(path: Path, byte_range: tuple[int, int], options: dict[str, Any]) -> pa.Table:
+    """Parse one byte range of a CSV file; module level so it can run in a worker."""
+    start, end = byte_range
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    table = pacsv.read_csv(pa.BufferReader(data), **options)
+    return table.rename_columns(["date", "value"])
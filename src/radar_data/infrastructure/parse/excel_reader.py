@@ -1,30 +1,74 @@
 """Excel reader adapter implementing ParserPort.
 
-Supports .xlsx, .xlsm, .xls, and potentially .xlsb formats.
-Uses openpyxl for .xlsx/.xlsm and pyxlsb for .xlsb.
+Reads .xlsx/.xlsm with the native zipfile/iterparse backend in
+radar_data.infrastructure.parse.xlsx, or with openpyxl when selected.
 """
 
-from typing import Any
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
 
-from radar_data.domain.interfaces import ParserPort
+from radar_data.domain.interfaces import ParserPort, StreamingParserPort
+from radar_data.infrastructure.parse.columns import parse_cell_ref, resolve_date_value_columns
+from radar_data.infrastructure.parse.quarantine import QuarantineWriter, row_reason
+from radar_data.infrastructure.parse.xlsx import DateSerial, XlsxWorkbook, decode_serials
 
+# Formats the backends can read; legacy .xls and binary .xlsb need others.
+OPENPYXL_SUFFIXES = (".xlsx", ".xlsm")
+BACKENDS = ("native", "openpyxl")
 
-class ExcelReader(ParserPort):
+# Rows whose date serials are decoded together by the native backend.
+_DECODE_CHUNK = 4096
+
+
+class ExcelReader(ParserPort, StreamingParserPort):
     """Adapter for parsing Excel files.
 
-    Implements the ParserPort interface for Excel formats (.xlsx, .xlsm, .xls, .xlsb).
-    Uses openpyxl for modern Excel formats and pyxlsb for binary formats.
+    Implements the ParserPort interface for .xlsx and .xlsm workbooks.
+    Reads them with the native XLSX backend, or with openpyxl as the
+    fallback backend. Legacy .xls and binary .xlsb files are recognized
+    by supports() but rejected with a ValueError when parsed.
+
+    Both backends stream the sheet XML instead of building the workbook
+    object model: only the configured sheet is read, rows above
+    start_cell are skipped without creating cells, and only the columns
+    spanned by the mapped date and value columns are extracted.
+    iter_batches() yields the records in fixed-size batches.
+
+    The default "native" backend reads the package with zipfile and
+    ElementTree.iterparse, needs no extra dependency, keeps shared
+    strings in a flat list and decodes date serials in bulk. The
+    "openpyxl" backend uses openpyxl's read-only mode.
+
+    The header row is the row of source.start_cell (default "A1") and
+    the table starts at its column. Records hold the mapped columns
+    under the keys "date" and "value"; dates are returned as ISO 8601
+    strings and numbers as floats.
+
+    parse_tolerant() screens the raw cells of each row and streams rows
+    that fail coercion to a quarantine file instead of returning them.
 
     TODO:
-        - Implement actual Excel parsing using openpyxl/pyxlsb.
-        - Add support for multiple sheets.
-        - Add support for start_cell configuration.
-        - Add support for column selection.
-        - Add support for date/number parsing.
-        - Handle merged cells.
         - Add support for .xls (legacy) format using xlrd.
+        - Add support for .xlsb using pyxlsb.
+        - Handle merged cells.
     """
 
+    def __init__(self, backend: str = "native") -> None:
+        """Initialize the Excel reader.
+
+        Args:
+            backend: "native" (zipfile/iterparse) or "openpyxl".
+
+        Raises:
+            ValueError: If backend is unknown.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown Excel backend {backend!r}; expected one of {BACKENDS}")
+        self.backend = backend
+
     def parse(
         self,
         file_path: str,
@@ -42,45 +86,95 @@ class ExcelReader(ParserPort):
         Raises:
             ValueError: If config is invalid or file cannot be parsed.
             FileNotFoundError: If file_path does not exist.
-            ImportError: If required libraries (openpyxl, pyxlsb) are not installed.
-
-        TODO:
-            - Load Excel file with openpyxl or pyxlsb.
-            - Select sheet based on config.
-            - Parse from start_cell if specified.
-            - Extract columns based on config.
-            - Convert to list of dictionaries.
+            ImportError: If the openpyxl backend is selected but not installed.
+        """
+        return list(self._iter_records(_existing(file_path), dataset_config))
+
+    def parse_tolerant(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        quarantine_path: str | Path,
+    ) -> tuple[list[dict[str, str | float]], dict[str, int]]:
+        """Parse an Excel file, quarantining rows that fail coercion.
+
+        Rows whose date cell is not a date or period, or whose value cell
+        is not a number, are appended to quarantine_path with their sheet
+        row number and reason (see the quarantine module). Blank rows are
+        skipped as in parse().
+
+        Args:
+            file_path: Path to the Excel file.
+            dataset_config: Configuration dict specifying sheet, start_cell, columns, etc.
+            quarantine_path: Gzip-compressed CSV receiving the bad rows.
+
+        Returns:
+            Tuple of (records of the good rows, count of quarantined rows
+            per reason).
+
+        Raises:
+            ValueError: If config is invalid or the sheet/columns are not found.
+            FileNotFoundError: If file_path does not exist.
+            ImportError: If the openpyxl backend is selected but not installed.
+        """
+        path = _existing(file_path)
+        with QuarantineWriter(quarantine_path) as quarantine:
+            records = list(self._iter_records(path, dataset_config, quarantine))
+        return records, dict(quarantine.counts)
+
+    def parse_stream(
+        self,
+        stream: IO[bytes],
+        dataset_config: dict[str, Any],
+    ) -> list[dict[str, str | float]]:
+        """Parse an Excel workbook from a binary stream into raw records.
+
+        Used for workbooks that are not plain files on disk, such as
+        members of an archive.
+
+        Args:
+            stream: Readable, seekable binary stream of an .xlsx/.xlsm file.
+            dataset_config: Configuration dict specifying sheet, start_cell, columns, etc.
+
+        Returns:
+            List of dictionaries, each representing a raw record.
+
+        Raises:
+            ValueError: If config is invalid or the sheet/columns are not found.
+            ImportError: If the openpyxl backend is selected but not installed.
+        """
+        return list(self._iter_records(stream, dataset_config))
+
+    def iter_batches(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+        batch_size: int = 10_000,
+    ) -> Iterator[list[dict[str, str | float]]]:
+        """Parse an Excel sheet lazily into batches of raw records.
+
+        Args:
+            file_path: Path to the Excel file.
+            dataset_config: Configuration dict specifying sheet, start_cell, columns, etc.
+            batch_size: Maximum number of records per batch.
+
+        Returns:
+            Iterator of record lists, in sheet order.
+
+        Raises:
+            ValueError: If config is invalid or the sheet/columns are not found.
+            FileNotFoundError: If file_path does not exist.
+            ImportError: If the openpyxl backend is selected but not installed.
         """
-        # TODO: Implement Excel parsing
-        # from pathlib import Path
-        # try:
-        #     import openpyxl
-        # except ImportError:
-        #     raise ImportError("openpyxl is required for Excel parsing")
-        #
-        # file = Path(file_path)
-        # if not file.exists():
-        #     raise FileNotFoundError(f"Excel file not found: {file_path}")
-        #
-        # source_config = dataset_config.get("source", {})
-        # sheet_name = source_config.get("sheet", None)
-        # start_cell = source_config.get("start_cell", "A1")
-        # columns = source_config.get("columns", {})
-        #
-        # wb = openpyxl.load_workbook(file, data_only=True)
-        # if sheet_name:
-        #     ws = wb[sheet_name]
-        # else:
-        #     ws = wb.active
-        #
-        # # Parse from start_cell
-        # # Extract records based on columns
-        # # Return list of dictionaries
-        # records = []
-        # # ... implementation ...
-        #
-        # return records
-        pass
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        records = self._iter_records(_existing(file_path), dataset_config)
+
+        def batches() -> Iterator[list[dict[str, str | float]]]:
+            while batch := list(islice(records, batch_size)):
+                yield batch
+
+        return batches()
 
     def supports(self, file_path: str) -> bool:
         """Check if this parser supports the given file type.
@@ -93,3 +187,262 @@ class ExcelReader(ParserPort):
         """
         return file_path.lower().endswith((".xlsx", ".xlsm", ".xls", ".xlsb"))
 
+    def sheet_names(self, file_path: str) -> list[str]:
+        """List the worksheets of a workbook, in workbook order.
+
+        Used to build the (file, sheet) units of releases that split a
+        series across sheets, see ParseUseCase.execute_parallel().
+
+        Args:
+            file_path: Path to the Excel file.
+
+        Returns:
+            Sheet names.
+
+        Raises:
+            FileNotFoundError: If file_path does not exist.
+            ValueError: If the file is not a readable .xlsx/.xlsm workbook.
+        """
+        with XlsxWorkbook(_existing(file_path)) as workbook:
+            return workbook.sheet_names
+
+    def _iter_records(
+        self,
+        source: Path | IO[bytes],
+        dataset_config: dict[str, Any],
+        quarantine: QuarantineWriter | None = None,
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield the records of the configured sheet one at a time.
+
+        With a quarantine, rows failing coercion are written to it instead.
+        """
+        if self.backend == "native":
+            return self._iter_records_native(source, dataset_config, quarantine)
+        return self._iter_records_openpyxl(source, dataset_config, quarantine)
+
+    def _iter_records_native(
+        self,
+        source: Path | IO[bytes],
+        dataset_config: dict[str, Any],
+        quarantine: QuarantineWriter | None = None,
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield records read with the native zipfile/iterparse backend."""
+        source_config = dataset_config.get("source", {})
+        header_row, first_col = parse_cell_ref(source_config.get("start_cell"))
+        sheet_name = source_config.get("sheet")
+
+        workbook = XlsxWorkbook(source)
+        try:
+            header = next(
+                workbook.iter_rows(
+                    sheet_name, min_row=header_row, max_row=header_row, min_col=first_col
+                ),
+                [],
+            )
+            date_idx, value_idx = _resolve_columns(header, source_config, first_col)
+            lo, hi = min(date_idx, value_idx), max(date_idx, value_idx)
+            rows = workbook.iter_rows(
+                sheet_name,
+                min_row=header_row + 1,
+                min_col=first_col + lo,
+                max_col=first_col + hi,
+            )
+            if quarantine is not None:
+                rows = _screen_rows(
+                    rows, date_idx - lo, value_idx - lo, header_row + 1, quarantine, source
+                )
+        except BaseException:
+            workbook.close()
+            raise
+        return native_records(workbook, rows, date_idx - lo, value_idx - lo)
+
+    def _iter_records_openpyxl(
+        self,
+        source: Path | IO[bytes],
+        dataset_config: dict[str, Any],
+        quarantine: QuarantineWriter | None = None,
+    ) -> Iterator[dict[str, str | float]]:
+        """Yield records read with openpyxl's read-only mode."""
+        openpyxl = _import_openpyxl()
+        source_config = dataset_config.get("source", {})
+        header_row, first_col = parse_cell_ref(source_config.get("start_cell"))
+
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        try:
+            sheet = _select_sheet(workbook, source_config.get("sheet"))
+            # Dimensions recorded in the file may be stale; read to the end.
+            sheet.reset_dimensions()
+            header = next(
+                sheet.iter_rows(
+                    min_row=header_row,
+                    max_row=header_row,
+                    min_col=first_col + 1,
+                    values_only=True,
+                ),
+                (),
+            )
+            date_idx, value_idx = _resolve_columns(header, source_config, first_col)
+            lo, hi = min(date_idx, value_idx), max(date_idx, value_idx)
+            rows = sheet.iter_rows(
+                min_row=header_row + 1,
+                min_col=first_col + lo + 1,
+                max_col=first_col + hi + 1,
+                values_only=True,
+            )
+            if quarantine is not None:
+                rows = _screen_rows(
+                    rows, date_idx - lo, value_idx - lo, header_row + 1, quarantine, source
+                )
+        except BaseException:
+            workbook.close()
+            raise
+        return _records(workbook, rows, date_idx - lo, value_idx - lo)
+
+
+def _records(
+    workbook: Any,
+    rows: Iterator[tuple[Any, ...]],
+    date_idx: int,
+    value_idx: int,
+) -> Iterator[dict[str, str | float]]:
+    """Yield records from projected rows, closing the workbook at the end."""
+    try:
+        for row in rows:
+            date_cell, value_cell = row[date_idx], row[value_idx]
+            if date_cell is None and value_cell is None:
+                continue
+            yield {"date": _cell_value(date_cell), "value": _cell_value(value_cell)}
+    finally:
+        workbook.close()
+
+
+def native_records(
+    workbook: XlsxWorkbook,
+    rows: Iterator[list[Any]],
+    date_idx: int,
+    value_idx: int,
+) -> Iterator[dict[str, str | float]]:
+    """Yield records from native XLSX rows, decoding date serials chunk by chunk.
+
+    Shared with LayoutTemplateParser. Rows where both mapped cells are
+    empty are skipped; the workbook is closed when the iterator ends.
+
+    Args:
+        workbook: Open workbook the rows come from.
+        rows: Native rows of a sheet.
+        date_idx: 0-based index of the date cell in each row.
+        value_idx: 0-based index of the value cell in each row.
+
+    Returns:
+        Iterator of {"date", "value"} records.
+    """
+    try:
+        while chunk := list(islice(rows, _DECODE_CHUNK)):
+            pairs = []
+            for row in chunk:
+                date_cell = row[date_idx] if date_idx < len(row) else None
+                value_cell = row[value_idx] if value_idx < len(row) else None
+                if date_cell is not None or value_cell is not None:
+                    pairs.append((date_cell, value_cell))
+            serials = [cell for pair in pairs for cell in pair if isinstance(cell, DateSerial)]
+            decoded = iter(decode_serials(serials, workbook.date1904))
+            for date_cell, value_cell in pairs:
+                yield {
+                    "date": _native_value(date_cell, decoded),
+                    "value": _native_value(value_cell, decoded),
+                }
+    finally:
+        workbook.close()
+
+
+def _screen_rows(
+    rows: Iterator[Sequence[Any]],
+    date_idx: int,
+    value_idx: int,
+    first_row: int,
+    quarantine: QuarantineWriter,
+    source: Path | IO[bytes],
+) -> Iterator[Any]:
+    """Pass rows whose raw cells coerce through unchanged; quarantine the rest."""
+    name = str(source) if isinstance(source, Path) else getattr(source, "name", "<stream>")
+    for number, row in enumerate(rows, start=first_row):
+        date_cell = row[date_idx] if date_idx < len(row) else None
+        value_cell = row[value_idx] if value_idx < len(row) else None
+        if date_cell is None and value_cell is None:
+            continue
+        reason = row_reason(date_cell, value_cell)
+        if reason is None:
+            yield row
+        else:
+            quarantine.write(name, number, reason, f"{date_cell!r}, {value_cell!r}")
+
+
+def _native_value(value: Any, decoded: Iterator[str]) -> str | float:
+    """Convert a native cell value, taking date serials from decoded in order."""
+    if isinstance(value, DateSerial):
+        return next(decoded)
+    return _cell_value(value)
+
+
+def _resolve_columns(
+    header: Sequence[Any],
+    source_config: dict[str, Any],
+    first_col: int,
+) -> tuple[int, int]:
+    """Resolve the date/value columns relative to first_col from the header row."""
+    date_idx, value_idx = resolve_date_value_columns(
+        [header_text(cell) for cell in header],
+        source_config.get("columns", {}),
+        offset=first_col,
+    )
+    if min(date_idx, value_idx) < 0:
+        raise ValueError("Mapped columns must not lie left of start_cell")
+    return date_idx, value_idx
+
+
+def header_text(cell: Any) -> str:
+    """Return a header cell as text; numeric headers such as years lose their ".0"."""
+    if cell is None:
+        return ""
+    if isinstance(cell, float) and cell.is_integer():
+        return str(int(cell))
+    return str(cell)
+
+
+def _cell_value(value: Any) -> str | float:
+    """Convert a cell value to a raw record value."""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return str(value)
+
+
+def _select_sheet(workbook: Any, sheet_name: str | None) -> Any:
+    """Return the configured sheet, or the active one if none is configured."""
+    if sheet_name:
+        if sheet_name not in workbook.sheetnames:
+            raise ValueError(f"Sheet {sheet_name!r} not found: {workbook.sheetnames}")
+        return workbook[sheet_name]
+    return workbook.active or workbook.worksheets[0]
+
+
+def _existing(file_path: str) -> Path:
+    """Return file_path as a Path, raising if it does not exist or is unsupported."""
+    file = Path(file_path)
+    if not file.exists():
+        raise FileNotFoundError(f"Excel file not found: {file_path}")
+    if file.suffix.lower() not in OPENPYXL_SUFFIXES:
+        raise ValueError(f"Unsupported Excel format (only .xlsx/.xlsm): {file_path}")
+    return file
+
+
+def _import_openpyxl() -> Any:
+    """Import openpyxl, which is an optional dependency."""
+    try:
+        import openpyxl
+    except ImportError as exc:
+        raise ImportError("openpyxl is required for Excel parsing") from exc
+    return openpyxl
@@ -0,0 +1,350 @@
+"""Layout templates for provider workbooks with irregular headers.
+
+Provider sheets (BCRA, INDEC) put merged title rows, notes and blank
+rows above the table, and source notes below it. The first time a sheet
+is parsed, its layout is detected by scanning the top rows: the header
+row, the date and value column positions, and the marker that ends the
+data block. The layout is stored together with a fingerprint of the
+header area (the rows down to the header, up to the last mapped column).
+Later runs read only those rows, and when the fingerprint still matches
+they go straight to the data block without scanning.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from itertools import takewhile
+from pathlib import Path
+from typing import Any
+
+from radar_data.domain.interfaces import ParserPort
+from radar_data.infrastructure.parse.columns import column_letter_to_index
+from radar_data.infrastructure.parse.excel_reader import (
+    OPENPYXL_SUFFIXES,
+    header_text,
+    native_records,
+)
+from radar_data.infrastructure.parse.xlsx import DateSerial, XlsxWorkbook
+
+# Rows scanned for the header when no stored layout matches.
+SCAN_ROWS = 60
+LAYOUT_VERSION = 1
+
+# Date-column text that reads as a period ("2024-01", "Ene-24", "15/03/2024").
+_PERIOD = re.compile(r"\d")
+_MAX_PERIOD_LENGTH = 24
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """Position of the data block of a provider sheet.
+
+    Attributes:
+        header_row: 1-based row of the column headers.
+        date_col: 0-based column of the dates.
+        value_col: 0-based column of the values.
+        fingerprint: Digest of the column mapping and header area the
+            layout was detected on.
+        end_marker: Start of the text that followed the data when the
+            layout was detected (e.g., "Fuente: BCRA"), if any.
+        version: Layout format version.
+    """
+
+    header_row: int
+    date_col: int
+    value_col: int
+    fingerprint: str
+    end_marker: str | None = None
+    version: int = LAYOUT_VERSION
+
+
+class LayoutStore:
+    """Layouts keyed by dataset and sheet, optionally persisted as JSON."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file holding the layouts. If None, layouts are kept
+                in memory for the lifetime of the store.
+        """
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._layouts: dict[str, SheetLayout] = {}
+        if self.path is not None and self.path.exists():
+            for key, data in json.loads(self.path.read_text(encoding="utf-8")).items():
+                if data.get("version") == LAYOUT_VERSION:
+                    self._layouts[key] = SheetLayout(**data)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Drop the lock so parsers holding a store can be sent to worker processes.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> SheetLayout | None:
+        """Return the stored layout for key, if any."""
+        with self._lock:
+            return self._layouts.get(key)
+
+    def put(self, key: str, layout: SheetLayout) -> None:
+        """Store a layout and write the file, if the store has one."""
+        with self._lock:
+            self._layouts[key] = layout
+            if self.path is None:
+                return
+            payload = {name: asdict(item) for name, item in self._layouts.items()}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2, sort_keys=True)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+
+
+class LayoutTemplateParser(ParserPort):
+    """Base for provider plugins that parse sheets through layout templates.
+
+    source.columns name the date and value columns by header text (matched
+    case-insensitively, ignoring repeated whitespace) or by spreadsheet
+    letter or 0-based index; with positional columns the header is the
+    row above the first row holding a date and a number. Data ends at
+    the first note in the date column (text without digits or longer
+    than a period label), which is recorded as the layout's end marker.
+
+    Subclasses set name, used in layout keys and as the default key
+    prefix when the dataset config has no id.
+    """
+
+    name = "layout"
+
+    def __init__(self, layout_store: LayoutStore | str | Path | None = None) -> None:
+        """Initialize the parser.
+
+        Args:
+            layout_store: LayoutStore, or path of its JSON file. Defaults
+                to an in-memory store.
+        """
+        if isinstance(layout_store, LayoutStore):
+            self.layout_store = layout_store
+        else:
+            self.layout_store = LayoutStore(layout_store)
+
+    def parse(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+    ) -> list[dict[str, str | float]]:
+        """Parse a provider sheet into raw records.
+
+        Args:
+            file_path: Path to the .xlsx/.xlsm workbook.
+            dataset_config: Dataset configuration; uses id, source.sheet
+                and source.columns.
+
+        Returns:
+            List of records with "date" and "value" keys, in sheet order.
+
+        Raises:
+            FileNotFoundError: If file_path does not exist.
+            ValueError: If the sheet, header or columns cannot be found.
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Workbook not found: {file_path}")
+        source_config = dataset_config.get("source", {})
+        workbook = XlsxWorkbook(file_path)
+        try:
+            sheet = source_config.get("sheet") or workbook.active_sheet
+            key = f"{dataset_config.get('id') or self.name}:{sheet}"
+            columns = source_config.get("columns", {})
+            layout = self._stored_layout(workbook, sheet, key, columns)
+            if layout is None:
+                layout = detect_layout(workbook, sheet, columns)
+            lo = min(layout.date_col, layout.value_col)
+            rows = workbook.iter_rows(
+                sheet,
+                min_row=layout.header_row + 1,
+                min_col=lo,
+                max_col=max(layout.date_col, layout.value_col),
+            )
+        except BaseException:
+            workbook.close()
+            raise
+
+        date_idx = layout.date_col - lo
+        ended: list[str] = []
+
+        def in_data(row: list[Any]) -> bool:
+            cell = row[date_idx] if date_idx < len(row) else None
+            if _is_note(cell, layout.end_marker):
+                ended.append(str(cell).strip())
+                return False
+            return True
+
+        records = list(
+            native_records(workbook, takewhile(in_data, rows), date_idx, layout.value_col - lo)
+        )
+        end_marker = ended[0][:40] if ended else None
+        if self.layout_store.get(key) != layout or end_marker != layout.end_marker:
+            self.layout_store.put(
+                key,
+                SheetLayout(
+                    layout.header_row,
+                    layout.date_col,
+                    layout.value_col,
+                    layout.fingerprint,
+                    end_marker,
+                ),
+            )
+        return records
+
+    def supports(self, file_path: str) -> bool:
+        """Check if this parser supports the given file type.
+
+        Args:
+            file_path: Path to the file to check.
+
+        Returns:
+            True for .xlsx/.xlsm workbooks.
+        """
+        return file_path.lower().endswith(OPENPYXL_SUFFIXES)
+
+    def _stored_layout(
+        self,
+        workbook: XlsxWorkbook,
+        sheet: str,
+        key: str,
+        columns: dict[str, str],
+    ) -> SheetLayout | None:
+        """Return the stored layout if the mapping and header area still match it."""
+        layout = self.layout_store.get(key)
+        if layout is None:
+            return None
+        last_col = max(layout.date_col, layout.value_col)
+        area = workbook.iter_rows(sheet, max_row=layout.header_row, max_col=last_col)
+        return layout if _fingerprint(area, columns) == layout.fingerprint else None
+
+
+def detect_layout(
+    workbook: XlsxWorkbook,
+    sheet: str,
+    columns: dict[str, str],
+) -> SheetLayout:
+    """Detect the header row and data columns of a sheet.
+
+    Args:
+        workbook: Open workbook.
+        sheet: Sheet name.
+        columns: source.columns mapping of "date" and "value".
+
+    Returns:
+        Layout of the sheet, without an end marker.
+
+    Raises:
+        ValueError: If no header row is found in the first SCAN_ROWS rows.
+    """
+    rows = list(workbook.iter_rows(sheet, max_row=SCAN_ROWS))
+    date_spec = columns.get("date") or "date"
+    value_spec = columns.get("value") or "value"
+    found = _find_named_header(rows, date_spec, value_spec)
+    if found is None:
+        found = _find_positional_header(rows, date_spec, value_spec)
+    if found is None:
+        raise ValueError(
+            f"No header with columns {date_spec!r} and {value_spec!r} "
+            f"in the first {SCAN_ROWS} rows of sheet {sheet!r}"
+        )
+    header_row, date_col, value_col = found
+    last_col = max(date_col, value_col)
+    area = (row[: last_col + 1] for row in rows[:header_row])
+    return SheetLayout(header_row, date_col, value_col, _fingerprint(area, columns))
+
+
+def _find_named_header(
+    rows: list[list[Any]],
+    date_spec: str,
+    value_spec: str,
+) -> tuple[int, int, int] | None:
+    """Find the first row holding both configured column names."""
+    date_name, value_name = _normalize(date_spec), _normalize(value_spec)
+    for number, row in enumerate(rows, start=1):
+        texts = [_normalize(header_text(cell)) for cell in row]
+        if date_name in texts and value_name in texts:
+            return number, texts.index(date_name), texts.index(value_name)
+    return None
+
+
+def _find_positional_header(
+    rows: list[list[Any]],
+    date_spec: str,
+    value_spec: str,
+) -> tuple[int, int, int] | None:
+    """Find the row above the first date/number pair in positional columns."""
+    date_col, value_col = _position(date_spec), _position(value_spec)
+    if date_col is None or value_col is None:
+        return None
+    for number, row in enumerate(rows[1:], start=1):
+        if max(date_col, value_col) >= len(row):
+            continue
+        date_cell, value_cell = row[date_col], row[value_col]
+        if _is_period(date_cell) and isinstance(value_cell, float):
+            return number, date_col, value_col
+    return None
+
+
+def _position(spec: str) -> int | None:
+    """Return the 0-based column of a letter or index spec, else None."""
+    if spec.isdigit():
+        return int(spec)
+    if spec.isalpha() and spec.isupper() and len(spec) <= 3:
+        return column_letter_to_index(spec)
+    return None
+
+
+def _fingerprint(rows: Iterable[list[Any]], columns: dict[str, str]) -> str:
+    """Digest the column mapping and the cell values of the header area."""
+    digest = hashlib.sha256(json.dumps(columns, sort_keys=True).encode("utf-8"))
+    for row in rows:
+        texts = [header_text(cell) for cell in row]
+        while texts and not texts[-1]:
+            texts.pop()
+        digest.update(json.dumps(texts).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+def _normalize(text: str) -> str:
+    """Compare header text case-insensitively, ignoring repeated whitespace."""
+    return " ".join(text.split()).casefold()
+
+
+def _is_period(cell: Any) -> bool:
+    """Check whether a date-column cell holds a date or period label."""
+    if isinstance(cell, (DateSerial, float)):
+        return True
+    return (
+        isinstance(cell, str)
+        and len(cell.strip()) <= _MAX_PERIOD_LENGTH
+        and bool(_PERIOD.search(cell))
+    )
+
+
+def _is_note(cell: Any, end_marker: str | None) -> bool:
+    """Check whether a date-column cell is a note that ends the data block."""
+    if not isinstance(cell, str) or not cell.strip():
+        return False
+    if end_marker is not None and cell.strip().startswith(end_marker):
+        return True
+    return not _is_period(cell)
@@ -0,0 +1,186 @@
+"""Memory-mapped CSV tokenizer that decodes only the projected fields.
+
+The file is mapped read-only and tokenized in place. Rows without quote
+characters are matched directly against the mapping by a compiled regex
+that captures only the requested fields; other rows go through a
+tokenizer that locates delimiters, quotes and newlines with mmap.find().
+Fields are kept as byte offsets into the mapping, and only the requested
+fields are decoded, straight from a memoryview slice, when a row is
+yielded. Pages come from the OS page cache, so the file is never copied
+into the Python heap.
+
+Quoting follows RFC 4180 (fields may be quoted, embedded quotes are
+doubled and quoted fields may contain newlines). The encoding must be
+ASCII-compatible, such as UTF-8 or Latin-1.
+"""
+
+import mmap
+import re
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+_NEWLINE = b"\n"
+_CR = ord("\r")
+_BOM = b"\xef\xbb\xbf"
+
+# A field as (start, end, has doubled quotes) offsets into the mapping.
+_Span = tuple[int, int, bool]
+
+
+def iter_mapped_rows(
+    path: str | Path,
+    resolve: Callable[[list[str]], Sequence[int]],
+    header_row: int = 1,
+    delimiter: str = ",",
+    quotechar: str = '"',
+    encoding: str = "utf-8-sig",
+) -> Iterator[list[str]]:
+    """Yield the projected fields of each data row of a memory-mapped CSV.
+
+    Args:
+        path: Path to the CSV file.
+        resolve: Called with the decoded header row; returns the 0-based
+            indexes of the fields to yield.
+        header_row: 1-based row holding the header; rows above it are skipped.
+        delimiter: Field delimiter.
+        quotechar: Quote character.
+        encoding: ASCII-compatible text encoding of the file.
+
+    Returns:
+        Iterator of field lists in the order returned by resolve. Blank
+        rows and rows with too few fields are skipped.
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, "madvise"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    view = memoryview(mapped)
+    try:
+        codec = "utf-8" if encoding.lower().replace("_", "-") == "utf-8-sig" else encoding
+        tokenizer = _Tokenizer(mapped, delimiter.encode(codec), quotechar.encode(codec))
+        pos = len(_BOM) if mapped[: len(_BOM)] == _BOM else 0
+
+        header: list[_Span] = []
+        for _ in range(header_row):
+            if pos >= tokenizer.size:
+                return
+            header, pos = tokenizer.record(pos)
+        indexes = list(resolve([_decode(view, span, codec, quotechar) for span in header]))
+        width = max(indexes) + 1
+        match = _row_pattern(indexes, tokenizer.delimiter, tokenizer.quotechar).match
+        groups = [sorted(set(indexes)).index(index) + 1 for index in indexes]
+
+        while pos < tokenizer.size:
+            row = match(mapped, pos)
+            if row is not None:
+                pos = row.end()
+                yield [str(view[slice(*row.span(group))], codec) for group in groups]
+                continue
+            spans, pos = tokenizer.record(pos, width)
+            if len(spans) == width:
+                yield [_decode(view, spans[index], codec, quotechar) for index in indexes]
+    finally:
+        view.release()
+        mapped.close()
+
+
+class _Tokenizer:
+    """Locate the fields of CSV records inside a mapped buffer."""
+
+    def __init__(self, buffer: mmap.mmap, delimiter: bytes, quotechar: bytes) -> None:
+        self.buffer = buffer
+        self.size = len(buffer)
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.quote = quotechar[0]
+
+    def record(self, pos: int, limit: int | None = None) -> tuple[list[_Span], int]:
+        """Tokenize the record starting at pos.
+
+        Args:
+            pos: Offset of the first byte of the record.
+            limit: Number of leading fields to return; the rest of the
+                record is only scanned far enough to find its end.
+
+        Returns:
+            Tuple of (field spans, offset of the next record). A blank
+            line has no fields.
+        """
+        buffer, size = self.buffer, self.size
+        find, delimiter, quotechar = buffer.find, self.delimiter, self.quotechar
+        line_end = find(_NEWLINE, pos)
+        if line_end < 0:
+            line_end = size
+        if pos == line_end or (pos + 1 == line_end and buffer[pos] == _CR):
+            return [], line_end + 1
+
+        spans: list[_Span] = []
+        while True:
+            if pos < size and buffer[pos] == self.quote:
+                close, escaped = self._closing_quote(pos + 1)
+                if limit is None or len(spans) < limit:
+                    spans.append((pos + 1, close, escaped))
+                if close >= line_end:
+                    # The quoted field spanned one or more newlines.
+                    line_end = find(_NEWLINE, close)
+                    if line_end < 0:
+                        line_end = size
+                next_delimiter = find(delimiter, close + 1, line_end)
+            else:
+                next_delimiter = find(delimiter, pos, line_end)
+                end = line_end if next_delimiter < 0 else next_delimiter
+                if limit is None or len(spans) < limit:
+                    if end == line_end and end > pos and buffer[end - 1] == _CR:
+                        end -= 1
+                    spans.append((pos, end, False))
+            if next_delimiter < 0:
+                return spans, line_end + 1
+            pos = next_delimiter + 1
+            if limit is not None and len(spans) >= limit and find(quotechar, pos, line_end) < 0:
+                # No quoted newline can follow, so the record ends at line_end.
+                return spans, line_end + 1
+
+    def _closing_quote(self, pos: int) -> tuple[int, bool]:
+        """Return the offset of the quote closing a field and whether it has doubled quotes."""
+        find, quotechar, size = self.buffer.find, self.quotechar, self.size
+        escaped = False
+        while True:
+            close = find(quotechar, pos)
+            if close < 0:
+                return size, escaped
+            if close + 1 < size and self.buffer[close + 1] == self.quote:
+                escaped = True
+                pos = close + 2
+                continue
+            return close, escaped
+
+
+def _row_pattern(indexes: Sequence[int], delimiter: bytes, quotechar: bytes) -> re.Pattern[bytes]:
+    """Compile a regex matching a whole quote-free row and capturing the indexed fields.
+
+    Groups follow the sorted, de-duplicated indexes. Rows with quotes,
+    blank rows and rows with too few fields do not match.
+    """
+    sep = re.escape(delimiter)
+    field = b"[^" + sep + re.escape(quotechar) + rb"\r\n]*"
+    # A blank row has no fields, even when only column 0 is requested.
+    parts = [rb"(?!\r?\n|\Z)"]
+    previous = -1
+    for index in sorted(set(indexes)):
+        if previous < 0:
+            parts.append(b"(?:" + field + sep + b"){%d}(" % index + field + b")")
+        else:
+            skipped = index - previous - 1
+            parts.append(b"(?:" + sep + field + b"){%d}" % skipped + sep + b"(" + field + b")")
+        previous = index
+    tail = b"[^" + re.escape(quotechar) + rb"\n]*(?:\n|\Z)"
+    return re.compile(b"".join(parts) + tail)
+
+
+def _decode(view: memoryview, span: _Span, encoding: str, quotechar: str) -> str:
+    """Decode one field straight from the mapping."""
+    start, end, escaped = span
+    text = str(view[start:end], encoding)
+    return text.replace(quotechar * 2, quotechar) if escaped else text
@@ -1,56 +1,22 @@
-"""Empty parser plugin skeleton for INDEC IPC dataset.
+"""Parser plugin for the INDEC consumer price index workbook.
 
-This is a placeholder for dataset-specific parsing logic.
-Implement this when adding INDEC IPC parsing support.
+The INDEC IPC releases put several title and note rows above the index
+table and methodological notes below it; the layout is detected once
+and then reused through a layout template.
 """
 
-from typing import Any
+from radar_data.infrastructure.parse.layout import LayoutTemplateParser
 
-from radar_data.domain.interfaces import ParserPort
 
-
-class IndecIpcParser(ParserPort):
+class IndecIpcParser(LayoutTemplateParser):
     """Dataset-specific parser for INDEC Consumer Price Index.
 
+    Configure source.sheet with the release sheet and source.columns
+    with the period and index column headers or letters.
+
     TODO:
-        - Implement INDEC-specific parsing logic.
-        - Handle INDEC's Excel/CSV format and structure.
-        - Extract date and value columns according to INDEC schema.
-        - Handle any INDEC-specific edge cases.
+        - Handle the regional breakdown sheets, which lay periods out
+          across columns.
     """
 
-    def parse(
-        self,
-        file_path: str,
-        dataset_config: dict[str, Any],
-    ) -> list[dict[str, str | float]]:
-        """Parse INDEC IPC file into raw records.
-
-        Args:
-            file_path: Path to the INDEC file.
-            dataset_config: Dataset configuration.
-
-        Returns:
-            List of raw records.
-
-        TODO:
-            - Implement INDEC-specific parsing.
-        """
-        # TODO: Implement INDEC-specific parsing logic
-        pass
-
-    def supports(self, file_path: str) -> bool:
-        """Check if this parser supports the given file type.
-
-        Args:
-            file_path: Path to the file to check.
-
-        Returns:
-            True if file is INDEC IPC format, False otherwise.
-
-        TODO:
-            - Implement file type detection.
-        """
-        # TODO: Implement INDEC file detection
-        pass
-
+    name = "indec_ipc"
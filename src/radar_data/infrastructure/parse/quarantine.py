@@ -0,0 +1,148 @@
+"""Quarantine of rows that fail coercion in tolerant parsing.
+
+In tolerant mode, readers screen each data row before building its
+record. A row passes when its date cell reads as a date or period and
+its value cell as a number. Rows that fail are written to a quarantine
+file with their source, 1-based row or line number, reason and raw
+content, and parsing continues. Rows that pass are not copied or
+rewritten.
+
+The quarantine file is a gzip-compressed CSV with the columns source,
+row, reason and raw. Each write session appends a gzip member, so one
+file can collect the rows of several parses. The file is only created
+once a row is quarantined.
+"""
+
+import csv
+import gzip
+import re
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+# Reasons a row is quarantined.
+MALFORMED_ROW = "malformed_row"
+SHORT_ROW = "short_row"
+DECODE_ERROR = "decode_error"
+MISSING_DATE = "missing_date"
+INVALID_DATE = "invalid_date"
+MISSING_VALUE = "missing_value"
+INVALID_VALUE = "invalid_value"
+
+QUARANTINE_COLUMNS = ("source", "row", "reason", "raw")
+# Raw content longer than this is truncated.
+MAX_RAW_LENGTH = 512
+
+# Numbers with either decimal convention ("1234.5", "1.234,5", "-3,2%", "1e6").
+_NUMBER = re.compile(r"[-+]?(?:\d[\d.,' ]*|[.,]\d+)(?:[eE][-+]?\d+)?\s*%?")
+_DIGIT = re.compile(r"\d")
+
+
+class QuarantineWriter:
+    """Append quarantined rows to a gzip-compressed CSV file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the writer.
+
+        Args:
+            path: Quarantine file; rows are appended if it exists.
+        """
+        self.path = Path(path)
+        self.counts: Counter[str] = Counter()
+        self._file: IO[str] | None = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "QuarantineWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, source: str, row: int, reason: str, raw: str) -> None:
+        """Quarantine one row.
+
+        Args:
+            source: File (or archive member) the row comes from.
+            row: 1-based row number in a sheet, or line number in a CSV.
+            reason: One of the reason constants of this module.
+            raw: Raw content of the row.
+        """
+        if self._writer is None:
+            self._open()
+        self._writer.writerow((source, row, reason, raw[:MAX_RAW_LENGTH]))
+        self.counts[reason] += 1
+
+    def close(self) -> None:
+        """Flush and close the quarantine file, if it was opened."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def _open(self) -> None:
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Replace characters the file cannot hold, such as undecodable bytes
+        # kept as surrogates by tolerant CSV decoding.
+        self._file = gzip.open(
+            self.path, "at", encoding="utf-8", errors="backslashreplace", newline=""
+        )
+        self._writer = csv.writer(self._file)
+        if is_new:
+            self._writer.writerow(QUARANTINE_COLUMNS)
+
+
+def row_reason(date_cell: Any, value_cell: Any) -> str | None:
+    """Return why a row's date and value cells fail coercion, or None.
+
+    Cells are raw CSV fields or raw sheet values. Dates pass as datetime
+    values, numbers (Excel date serials) or text with a digit ("2024-01",
+    "Ene-24"); values pass as numbers or numeric text in either decimal
+    convention.
+
+    Args:
+        date_cell: Raw date cell.
+        value_cell: Raw value cell.
+
+    Returns:
+        Reason constant, or None if the row passes.
+    """
+    if isinstance(date_cell, str):
+        if not date_cell.strip():
+            return MISSING_DATE
+        if not _DIGIT.search(date_cell):
+            return INVALID_DATE
+    elif date_cell is None:
+        return MISSING_DATE
+    elif isinstance(date_cell, bool) or not isinstance(date_cell, (int, float, date)):
+        return INVALID_DATE
+
+    if isinstance(value_cell, str):
+        text = value_cell.strip()
+        if not text:
+            return MISSING_VALUE
+        if not _NUMBER.fullmatch(text):
+            return INVALID_VALUE
+    elif value_cell is None:
+        return MISSING_VALUE
+    elif isinstance(value_cell, bool) or not isinstance(value_cell, (int, float)):
+        return INVALID_VALUE
+    return None
+
+
+def is_decodable(*fields: str) -> bool:
+    """Check that text fields hold no surrogates left by undecodable bytes."""
+    for field in fields:
+        if not field.isascii():
+            try:
+                field.encode("utf-8")
+            except UnicodeEncodeError:
+                return False
+    return True
@@ -0,0 +1,395 @@
+"""Parser registry with content sniffing and lazily imported parsers.
+
+Parsers are registered by name as "module:attribute" import targets (or
+factories) together with the file formats they handle. Nothing is
+imported until a parser is first requested, so building a registry does
+not pay the import cost of every backend (pyarrow, openpyxl, plugins).
+
+The format of a file is detected from its first bytes rather than its
+extension: ZIP containers are told apart by their members (XLSX, XLSB or
+plain ZIP), OLE2 signatures mark legacy XLS, and text that splits into a
+consistent number of delimited fields is CSV. The delimiter found for a
+CSV file is passed on to the parser selected for it, so ";"-separated
+files are not read as a single column. Results are cached per
+file path, size and modification time (or per content digest when the
+caller already knows it), so the cache never reads more than the sniff.
+
+Third-party parsers are discovered through the "radar_data.parsers"
+entry point group; each entry point's value is registered as an import
+target and only loaded when used.
+"""
+
+import copy
+import threading
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from importlib import import_module
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any
+
+from radar_data.domain.interfaces import ParserPort
+
+ENTRY_POINT_GROUP = "radar_data.parsers"
+SNIFF_BYTES = 8192
+
+_ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06")
+_OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_GZIP_MAGIC = b"\x1f\x8b"
+_CSV_DELIMITERS = ",;\t|"
+
+# Format assumed from the extension when a file cannot be read.
+_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".xlsx": "xlsx",
+    ".xlsm": "xlsx",
+    ".xlsb": "xlsb",
+    ".xls": "xls",
+    ".zip": "zip",
+    ".gz": "gzip",
+}
+
+# Built-in parsers: name -> (import target, formats handled).
+BUILTIN_PARSERS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "csv": ("radar_data.infrastructure.parse.csv_reader:CsvReader", ("csv",)),
+    "excel": ("radar_data.infrastructure.parse.excel_reader:ExcelReader", ("xlsx",)),
+    "archive": ("radar_data.infrastructure.parse.archive:ArchiveReader", ("zip", "gzip")),
+}
+
+ParserFactory = str | Callable[[], ParserPort]
+
+
+class ParserRegistry(ParserPort):
+    """Registry selecting parsers by sniffed file format or by name.
+
+    The registry is itself a ParserPort: parse() detects the format of
+    the file, or uses the parser named by source.parser in the dataset
+    config, and delegates to that parser. When a detected CSV file uses
+    another delimiter than the selected parser's delimiter attribute, a
+    copy of the parser with the sniffed delimiter is used instead.
+    """
+
+    def __init__(self, discover_plugins: bool = True, cache_size: int = 1024) -> None:
+        """Initialize the registry with the built-in parsers.
+
+        Args:
+            discover_plugins: Whether to register the parsers advertised
+                under the "radar_data.parsers" entry point group.
+            cache_size: Maximum number of files whose detected format is
+                remembered.
+        """
+        self.cache_size = cache_size
+        self._factories: dict[str, ParserFactory] = {}
+        self._formats: dict[str, str] = {}
+        self._parsers: dict[str, ParserPort] = {}
+        self._detected: OrderedDict[Hashable, tuple[str, str | None]] = OrderedDict()
+        self._delimited: dict[tuple[str, str], ParserPort] = {}
+        self._lock = threading.Lock()
+        for name, (target, formats) in BUILTIN_PARSERS.items():
+            self.register(name, target, formats)
+        if discover_plugins:
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                self.register(entry_point.name, entry_point.value)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the registered parsers."""
+        return list(self._factories)
+
+    def register(
+        self,
+        name: str,
+        factory: ParserFactory,
+        formats: tuple[str, ...] = (),
+    ) -> None:
+        """Register a parser without importing it.
+
+        Args:
+            name: Name used in source.parser and get().
+            factory: "module:attribute" import target of a parser class
+                or factory, or a callable returning the parser.
+            formats: Detected formats this parser handles by default.
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._parsers.pop(name, None)
+            for key in [key for key in self._delimited if key[0] == name]:
+                del self._delimited[key]
+            for fmt in formats:
+                self._formats[fmt] = name
+
+    def get(self, name: str) -> ParserPort:
+        """Return the parser registered as name, importing it on first use.
+
+        Args:
+            name: Registered parser name.
+
+        Returns:
+            Parser instance, shared by later calls.
+
+        Raises:
+            KeyError: If no parser is registered under name.
+            ImportError: If the parser's module cannot be imported.
+        """
+        with self._lock:
+            if name in self._parsers:
+                return self._parsers[name]
+            if name not in self._factories:
+                raise KeyError(f"No parser registered as {name!r}: {self.names}")
+            factory = self._factories[name]
+            parser = _load(factory)() if isinstance(factory, str) else factory()
+            self._parsers[name] = parser
+            return parser
+
+    def detect(self, file_path: str, digest: str | None = None) -> str:
+        """Detect the format of a file from its content.
+
+        Args:
+            file_path: Path to the file.
+            digest: SHA-256 hex digest of the file, if already known (for
+                example from the content store); identical files then share
+                one detection. Otherwise results are cached per path, size
+                and modification time.
+
+        Returns:
+            One of "csv", "xlsx", "xlsb", "xls", "zip", "gzip", "html" or
+            "unknown".
+
+        Raises:
+            FileNotFoundError: If file_path does not exist.
+        """
+        return self._detect(file_path, digest)[0]
+
+    def _detect(self, file_path: str, digest: str | None) -> tuple[str, str | None]:
+        """Detect the format of a file and, for CSV, its delimiter."""
+        key: Hashable = digest or _stat_key(file_path)
+        with self._lock:
+            if key in self._detected:
+                self._detected.move_to_end(key)
+                return self._detected[key]
+        fmt = detect_format(file_path)
+        detected = (fmt, detect_delimiter(file_path) if fmt == "csv" else None)
+        with self._lock:
+            self._detected[key] = detected
+            while len(self._detected) > self.cache_size:
+                self._detected.popitem(last=False)
+        return detected
+
+    def parser_for(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any] | None = None,
+        digest: str | None = None,
+    ) -> ParserPort:
+        """Select the parser for a file.
+
+        Args:
+            file_path: Path to the file.
+            dataset_config: Optional dataset config; source.parser names a
+                registered parser and skips detection.
+            digest: Optional SHA-256 hex digest of the file.
+
+        Returns:
+            The parser for the configured name or the detected format;
+            for CSV files, set to the sniffed delimiter.
+
+        Raises:
+            ValueError: If no parser handles the detected format.
+            KeyError: If source.parser names an unregistered parser.
+            FileNotFoundError: If file_path does not exist.
+        """
+        name = (dataset_config or {}).get("source", {}).get("parser")
+        if name:
+            return self.get(name)
+        fmt, delimiter = self._detect(file_path, digest)
+        if fmt not in self._formats:
+            raise ValueError(f"No parser registered for {fmt!r} file: {file_path}")
+        name = self._formats[fmt]
+        parser = self.get(name)
+        if delimiter is None or getattr(parser, "delimiter", delimiter) == delimiter:
+            return parser
+        with self._lock:
+            if (name, delimiter) not in self._delimited:
+                delimited: Any = copy.copy(parser)
+                delimited.delimiter = delimiter
+                self._delimited[name, delimiter] = delimited
+            return self._delimited[name, delimiter]
+
+    def parse(
+        self,
+        file_path: str,
+        dataset_config: dict[str, Any],
+    ) -> list[dict[str, str | float]]:
+        """Parse a file with the parser selected by parser_for().
+
+        Args:
+            file_path: Path to the file to parse.
+            dataset_config: Configuration dict of the dataset.
+
+        Returns:
+            List of dictionaries, each representing a raw record.
+
+        Raises:
+            ValueError: If no parser handles the file or config is invalid.
+            FileNotFoundError: If file_path does not exist.
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return self.parser_for(file_path, dataset_config).parse(file_path, dataset_config)
+
+    def supports(self, file_path: str) -> bool:
+        """Check whether a registered parser handles the file's format.
+
+        Missing files are judged by their extension, so callers see the
+        FileNotFoundError from parse().
+
+        Args:
+            file_path: Path to the file to check.
+
+        Returns:
+            True if a parser is registered for the detected format.
+        """
+        if Path(file_path).exists():
+            fmt = self.detect(file_path)
+        else:
+            fmt = _SUFFIX_FORMATS.get(Path(file_path).suffix.lower(), "unknown")
+        return fmt in self._formats
+
+
+def _stat_key(file_path: str) -> tuple[str, int, int]:
+    """Identify a file version by resolved path, size and modification time."""
+    path = Path(file_path)
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def detect_format(file_path: str | Path) -> str:
+    """Detect a file's format from its leading bytes (and ZIP members).
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Format name, see ParserRegistry.detect().
+
+    Raises:
+        FileNotFoundError: If file_path does not exist.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    if head.startswith(_ZIP_MAGIC):
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                names = set(archive.namelist())
+        except zipfile.BadZipFile:
+            return "unknown"
+        if "xl/workbook.xml" in names:
+            return "xlsx"
+        if "xl/workbook.bin" in names:
+            return "xlsb"
+        return "zip"
+    return sniff_format(head)
+
+
+def detect_delimiter(file_path: str | Path) -> str | None:
+    """Detect the field delimiter of a CSV file from its leading bytes.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The delimiter, or None if the file has a single column or is
+        not delimited text.
+
+    Raises:
+        FileNotFoundError: If file_path does not exist.
+    """
+    with open(file_path, "rb") as f:
+        return sniff_delimiter(f.read(SNIFF_BYTES))
+
+
+def sniff_delimiter(head: bytes) -> str | None:
+    """Detect the field delimiter of delimited text from its first bytes.
+
+    Args:
+        head: Leading bytes of the file (a few KiB).
+
+    Returns:
+        The delimiter among ",", ";", tab and "|" that splits the most
+        lines into the same number of fields, or None if none does.
+    """
+    return _field_delimiter(_sample_lines(_head_text(head)))
+
+
+def sniff_format(head: bytes) -> str:
+    """Detect a non-ZIP format from the first bytes of a file.
+
+    Args:
+        head: Leading bytes of the file (a few KiB).
+
+    Returns:
+        "xls", "gzip", "html", "csv" or "unknown". ZIP containers are
+        reported as "zip"; use detect_format() to look inside them.
+    """
+    if head.startswith(_ZIP_MAGIC):
+        return "zip"
+    if head.startswith(_OLE2_MAGIC):
+        return "xls"
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if not head or b"\x00" in head:
+        return "unknown"
+    text = _head_text(head)
+    if text[:15].lower().startswith(("<!doctype html", "<html")):
+        return "html"
+    return "csv" if _looks_delimited(text) else "unknown"
+
+
+def _head_text(head: bytes) -> str:
+    """Decode the first bytes of a file, without a BOM or leading blanks."""
+    return head.decode("utf-8", errors="replace").lstrip("\ufeff \t\r\n")
+
+
+def _sample_lines(text: str) -> list[str]:
+    """Return the complete non-blank lines of a sample."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if len(lines) > 1 and not text.endswith(("\n", "\r")):
+        lines.pop()  # the sample may end mid-line
+    return lines
+
+
+def _field_delimiter(lines: list[str]) -> str | None:
+    """Pick the delimiter splitting the most lines into the same field count."""
+    best, best_rows = None, 0
+    for delimiter in _CSV_DELIMITERS:
+        counts = [line.count(delimiter) for line in lines[:50]]
+        if not counts or max(counts) == 0:
+            continue
+        rows = counts.count(max(counts))
+        # Allow title rows above the header and ragged trailing notes.
+        if rows >= max(1, len(counts) // 2) and rows > best_rows:
+            best, best_rows = delimiter, rows
+    return best
+
+
+def _looks_delimited(text: str) -> bool:
+    """Check whether text splits into lines with a consistent field count."""
+    if any(ch < " " and ch not in "\t\r\n" for ch in text):
+        return False
+    lines = _sample_lines(text)
+    if not lines:
+        return False
+    if _field_delimiter(lines) is not None:
+        return True
+    # A single-column file is still CSV.
+    return all(len(line) < 1024 for line in lines)
+
+
+def _load(target: str) -> Callable[[], ParserPort]:
+    """Import a "module:attribute" target."""
+    module_name, _, attribute = target.partition(":")
+    obj: Any = import_module(module_name)
+    for part in attribute.split(".") if attribute else ():
+        obj = getattr(obj, part)
+    return obj  # type: ignore[no-any-return]
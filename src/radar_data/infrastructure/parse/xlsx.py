@@ -0,0 +1,402 @@
+"""Native XLSX sheet reader built on zipfile and incremental XML parsing.
+
+Reads .xlsx/.xlsm workbooks without openpyxl. The small package parts
+(workbook, relationships, styles, shared strings) are read with
+ElementTree.iterparse. Sheet XML is fed to expat in chunks without
+building an element tree; rows outside the requested range are dropped
+from their row number before their cells are looked at, and cells
+outside the column range are skipped from their reference alone. Shared
+strings are loaded once into a flat list, and date-formatted cells are
+returned as DateSerial values so callers can decode them in bulk with
+decode_serials().
+"""
+
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+from xml.etree.ElementTree import Element, iterparse
+from xml.parsers import expat
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from radar_data.infrastructure.parse.columns import column_letter_to_index
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_TEXT = f"{_MAIN_NS}t"
+
+# Element names as reported by expat with "}" as namespace separator.
+_ROW = f"{_MAIN_NS[1:]}row"
+_C = f"{_MAIN_NS[1:]}c"
+_V = f"{_MAIN_NS[1:]}v"
+_T = f"{_MAIN_NS[1:]}t"
+
+# Bytes of compressed-member output handed to expat per call.
+_CHUNK_SIZE = 1 << 16
+
+# Built-in number formats that display dates or times.
+_DATE_FORMAT_IDS = frozenset({14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47})
+# Quoted literals, escapes and [colour]/[locale] sections of a format code.
+_FORMAT_LITERALS = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+
+# Days between each workbook epoch and the Unix epoch.
+_UNIX_OFFSET_1900 = 25569
+_UNIX_OFFSET_1904 = 24107
+# Serial of the nonexistent 1900-02-29 that Excel's 1900 system counts.
+# Earlier serials are shifted by a day; 60 itself reads as 1900-02-28,
+# as in openpyxl.
+PHANTOM_LEAP_SERIAL = 60
+_TICKS_PER_DAY = {"s": 86_400, "ms": 86_400_000, "us": 86_400_000_000}
+
+
+class DateSerial(float):
+    """Numeric cell value whose number format displays a date."""
+
+
+class XlsxWorkbook:
+    """Read-only access to the sheets of an .xlsx/.xlsm workbook.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, source: str | Path | IO[bytes]) -> None:
+        """Open a workbook and read its sheet list, styles and strings.
+
+        Args:
+            source: Path or seekable binary stream of the workbook.
+
+        Raises:
+            ValueError: If the source is not a valid XLSX package.
+        """
+        try:
+            self._zip = zipfile.ZipFile(source)
+        except zipfile.BadZipFile as exc:
+            raise ValueError(f"Not an XLSX workbook: {source}") from exc
+        try:
+            self._sheets, self.date1904, self._active = self._read_workbook()
+            self._date_styles = self._read_date_styles()
+            self.shared_strings = self._read_shared_strings()
+        except BaseException:
+            self._zip.close()
+            raise
+
+    @property
+    def sheet_names(self) -> list[str]:
+        """Names of the worksheets, in workbook order."""
+        return list(self._sheets)
+
+    @property
+    def active_sheet(self) -> str:
+        """Name of the sheet that is active when the workbook is opened."""
+        names = self.sheet_names
+        return names[self._active] if 0 <= self._active < len(names) else names[0]
+
+    def iter_rows(
+        self,
+        sheet: str | None = None,
+        min_row: int = 1,
+        max_row: int | None = None,
+        min_col: int = 0,
+        max_col: int | None = None,
+    ) -> Iterator[list[Any]]:
+        """Iterate the cell values of a sheet row by row.
+
+        Missing rows inside the range are returned as rows of None, so
+        row positions are preserved.
+
+        Args:
+            sheet: Sheet name; defaults to the active sheet.
+            min_row: First 1-based row to return.
+            max_row: Last 1-based row to return, or None for all.
+            min_col: First 0-based column to return.
+            max_col: Last 0-based column to return, or None for all.
+
+        Returns:
+            Iterator of value lists starting at min_col. Values are str,
+            float, DateSerial, bool or None.
+
+        Raises:
+            ValueError: If the sheet does not exist.
+        """
+        name = sheet if sheet else self.active_sheet
+        if name not in self._sheets:
+            raise ValueError(f"Sheet {name!r} not found: {self.sheet_names}")
+        return self._iter_sheet(self._sheets[name], min_row, max_row, min_col, max_col)
+
+    def close(self) -> None:
+        """Close the underlying archive."""
+        self._zip.close()
+
+    def __enter__(self) -> "XlsxWorkbook":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _iter_sheet(
+        self,
+        part: str,
+        min_row: int,
+        max_row: int | None,
+        min_col: int,
+        max_col: int | None,
+    ) -> Iterator[list[Any]]:
+        """Stream rows of a worksheet part, feeding its XML to expat in chunks."""
+        reader = _SheetReader(
+            self.shared_strings, self._date_styles, min_row, max_row, min_col, max_col
+        )
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = reader.start
+        parser.EndElementHandler = reader.end
+        parser.CharacterDataHandler = reader.data
+        with self._zip.open(part) as f:
+            while not reader.done and (chunk := f.read(_CHUNK_SIZE)):
+                parser.Parse(chunk, False)
+                yield from reader.drain()
+            if not reader.done:
+                parser.Parse(b"", True)
+        yield from reader.drain()
+
+    def _read_workbook(self) -> tuple[dict[str, str], bool, int]:
+        """Map sheet names to worksheet parts; read the date system and active tab."""
+        targets = {}
+        rels = _parse(self._zip, "xl/_rels/workbook.xml.rels")
+        for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                part = target.lstrip("/")
+            else:
+                part = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = part
+
+        workbook = _parse(self._zip, "xl/workbook.xml")
+        sheets = {}
+        for sheet in workbook.iter(f"{_MAIN_NS}sheet"):
+            rel_id = sheet.get(f"{_REL_NS}id")
+            if rel_id in targets:
+                sheets[sheet.get("name", "")] = targets[rel_id]
+        properties = workbook.find(f"{_MAIN_NS}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        view = workbook.find(f"{_MAIN_NS}bookViews/{_MAIN_NS}workbookView")
+        active = int(view.get("activeTab", "0")) if view is not None else 0
+        return sheets, date1904, active
+
+    def _read_date_styles(self) -> frozenset[int]:
+        """Return the indexes of cell styles with a date number format."""
+        if "xl/styles.xml" not in self._zip.namelist():
+            return frozenset()
+        styles = _parse(self._zip, "xl/styles.xml")
+        date_formats = set(_DATE_FORMAT_IDS)
+        for fmt in styles.iter(f"{_MAIN_NS}numFmt"):
+            if _is_date_format(fmt.get("formatCode", "")):
+                date_formats.add(int(fmt.get("numFmtId", "0")))
+        cell_xfs = styles.find(f"{_MAIN_NS}cellXfs")
+        if cell_xfs is None:
+            return frozenset()
+        return frozenset(
+            index
+            for index, xf in enumerate(cell_xfs.iter(f"{_MAIN_NS}xf"))
+            if int(xf.get("numFmtId", "0")) in date_formats
+        )
+
+    def _read_shared_strings(self) -> list[str]:
+        """Load the shared strings table into a flat list."""
+        if "xl/sharedStrings.xml" not in self._zip.namelist():
+            return []
+        strings = []
+        with self._zip.open("xl/sharedStrings.xml") as f:
+            for _, item in iterparse(f, events=("end",)):
+                if item.tag == f"{_MAIN_NS}si":
+                    strings.append("".join(text.text or "" for text in item.iter(_TEXT)))
+                    item.clear()
+        return strings
+
+
+class _SheetReader:
+    """Expat handlers that turn worksheet XML into rows of cell values.
+
+    No element tree is built: rows outside [min_row, max_row] are
+    ignored from their "r" attribute, cells outside [min_col, max_col]
+    from their reference, and text is only collected for kept cells.
+    """
+
+    def __init__(
+        self,
+        strings: list[str],
+        date_styles: frozenset[int],
+        min_row: int,
+        max_row: int | None,
+        min_col: int,
+        max_col: int | None,
+    ) -> None:
+        self.strings = strings
+        self.date_styles = date_styles
+        self.min_row = min_row
+        self.max_row = max_row
+        self.min_col = min_col
+        self.max_col = max_col
+        self.width = 0 if max_col is None else max_col - min_col + 1
+        self.rows: list[list[Any]] = []
+        self.done = False
+        self.expected = min_row
+        self.row_number = 0
+        self.values: list[Any] | None = None
+        self.col = -1
+        self.kind = "n"
+        self.style: str | None = None
+        self.text: list[str] | None = None
+        self.collect = False
+        self.columns: dict[str, int] = {}
+
+    def drain(self) -> list[list[Any]]:
+        """Return and forget the rows completed so far."""
+        rows, self.rows = self.rows, []
+        return rows
+
+    def start(self, name: str, attrs: dict[str, str]) -> None:
+        if name == _C:
+            if self.values is None:
+                return
+            ref = attrs.get("r")
+            self.col = self._column(ref) if ref else self.col + 1
+            if self.col < self.min_col or (self.max_col is not None and self.col > self.max_col):
+                self.text = None
+                return
+            self.kind = attrs.get("t", "n")
+            self.style = attrs.get("s")
+            self.text = []
+        elif name == _V or name == _T:
+            self.collect = self.text is not None
+        elif name == _ROW:
+            ref = attrs.get("r")
+            self.row_number = int(ref) if ref else self.row_number + 1
+            if self.max_row is not None and self.row_number > self.max_row:
+                self.done = True
+            if self.row_number < self.min_row or self.done:
+                self.values = None
+                return
+            while self.expected < self.row_number:
+                self.rows.append([None] * self.width)
+                self.expected += 1
+            self.values = [None] * self.width
+            self.col = -1
+
+    def end(self, name: str) -> None:
+        if name == _C:
+            if self.text is not None and self.values is not None:
+                offset = self.col - self.min_col
+                if offset >= len(self.values):
+                    self.values.extend([None] * (offset + 1 - len(self.values)))
+                self.values[offset] = self._value("".join(self.text))
+                self.text = None
+        elif name == _V or name == _T:
+            self.collect = False
+        elif name == _ROW and self.values is not None:
+            self.rows.append(self.values)
+            self.values = None
+            self.expected = self.row_number + 1
+
+    def data(self, text: str) -> None:
+        if self.collect:
+            self.text.append(text)  # type: ignore[union-attr]
+
+    def _column(self, cell_ref: str) -> int:
+        """Return the 0-based column of a cell reference, caching by letters."""
+        letters = cell_ref.rstrip("0123456789")
+        col = self.columns.get(letters)
+        if col is None:
+            col = self.columns[letters] = column_letter_to_index(letters)
+        return col
+
+    def _value(self, text: str) -> Any:
+        """Decode the collected text of a kept cell according to its type."""
+        kind = self.kind
+        if kind == "inlineStr":
+            return text
+        if not text:
+            return None
+        if kind == "s":
+            return self.strings[int(text)]
+        if kind == "n":
+            if self.style is not None and int(self.style) in self.date_styles:
+                return DateSerial(text)
+            return float(text)
+        if kind == "b":
+            return text == "1"
+        # "str" (formula result), "e" (error) and "d" (ISO date) stay as text.
+        return text
+
+
+def decode_serials(serials: Sequence[float], date1904: bool = False) -> list[str]:
+    """Convert Excel date serials to ISO 8601 strings in one vectorized pass.
+
+    Args:
+        serials: Date serial numbers (days since the workbook epoch).
+        date1904: Whether the workbook uses the 1904 date system.
+
+    Returns:
+        ISO 8601 datetime strings ("2024-01-31T00:00:00"), one per serial.
+    """
+    if not serials:
+        return []
+    stamps = serials_to_timestamps(pa.array(serials, type=pa.float64()), date1904, unit="s")
+    text = pc.strftime(stamps, format="%Y-%m-%dT%H:%M:%S")
+    return text.to_pylist()  # type: ignore[no-any-return]
+
+
+def serials_to_timestamps(
+    serials: pa.Array,
+    date1904: bool = False,
+    unit: str = "us",
+) -> pa.TimestampArray:
+    """Convert Excel date serials to timestamps, rounded to unit.
+
+    In the 1900 system, serials below PHANTOM_LEAP_SERIAL are shifted by
+    a day, as Excel counts the nonexistent 1900-02-29.
+
+    Args:
+        serials: Numeric array of date serials; nulls stay null.
+        date1904: Whether the workbook uses the 1904 date system.
+        unit: Timestamp unit: "s", "ms" or "us".
+
+    Returns:
+        Timestamp array of the given unit.
+    """
+    days = pc.cast(serials, pa.float64())
+    if not date1904:
+        days = pc.if_else(pc.less(days, PHANTOM_LEAP_SERIAL), pc.add(days, 1), days)
+    offset = _UNIX_OFFSET_1904 if date1904 else _UNIX_OFFSET_1900
+    ticks = pc.round(pc.multiply(pc.subtract(days, offset), _TICKS_PER_DAY[unit]))
+    return pc.cast(pc.cast(ticks, pa.int64()), pa.timestamp(unit))
+
+
+def _parse(archive: zipfile.ZipFile, name: str) -> Element:
+    """Parse a small XML part of the package in full."""
+    with archive.open(name) as f:
+        root: Element | None = None
+        for _, element in iterparse(f, events=("end",)):
+            root = element
+    if root is None:
+        raise ValueError(f"Empty XML part: {name}")
+    return root
+
+
+def _is_date_format(code: str) -> bool:
+    """Check whether a custom number format code displays a date or time."""
+    stripped = _FORMAT_LITERALS.sub("", code).lower()
+    return (
+        any(token in stripped for token in ("d", "m", "y", "h", "s")) and "general" not in stripped
+    )
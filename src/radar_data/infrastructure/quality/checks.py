@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from radar_data.domain.batch import ObservationData
 from radar_data.domain.entities import Observation
 from radar_data.domain.interfaces import CleanerPort
 
@@ -22,13 +23,13 @@ class QualityChecker(CleanerPort):
 
     def clean(
         self,
-        observations: list[Observation],
+        observations: ObservationData,
         quality_profile: dict[str, Any],
-    ) -> tuple[list[Observation], dict[str, int]]:
+    ) -> tuple[ObservationData, dict[str, int]]:
         """Apply quality checks and cleaning rules to observations.
 
         Args:
-            observations: List of observations to clean.
+            observations: Observations to clean, as a list or an ObservationBatch.
             quality_profile: Configuration dict specifying which checks to run.
 
         Returns:
@@ -39,7 +40,8 @@ class QualityChecker(CleanerPort):
             - Run continuity checks if enabled.
             - Run outlier detection if enabled.
             - Run range validation if enabled.
-            - Filter or flag problematic observations.
+            - Filter or flag problematic observations (ObservationBatch.filter()
+              for batches).
             - Generate quality report with counts.
         """
         # TODO: Implement quality checks
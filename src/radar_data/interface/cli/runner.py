@@ -1,7 +1,8 @@
 """CLI entrypoint for radar-data-pipeline.
 
 This module provides the command-line interface for the pipeline,
-with subcommands for each stage: fetch, parse, normalize, quality, write.
+with subcommands for each stage: fetch, parse, normalize, quality, write,
+plus metrics to aggregate the fetch metrics recorded by a run.
 """
 
 import argparse
@@ -38,6 +39,12 @@ def main() -> None:
         default="data/raw",
         help="Output directory for fetched files (default: data/raw)",
     )
+    fetch_parser.add_argument(
+        "--metrics",
+        type=str,
+        default=None,
+        help="Append per-request fetch metrics as JSON lines to this file",
+    )
 
     # Parse command
     parse_parser = subparsers.add_parser("parse", help="Parse raw files into structured data")
@@ -58,6 +65,18 @@ def main() -> None:
         default="data/parsed",
         help="Output directory for parsed files (default: data/parsed)",
     )
+    parse_parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Reuse parsed results cached in this directory for unchanged files",
+    )
+    parse_parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used cache entries above this size",
+    )
 
     # Normalize command
     normalize_parser = subparsers.add_parser(
@@ -132,12 +151,38 @@ def main() -> None:
         help="Output format (default: parquet)",
     )
 
+    # Metrics command
+    metrics_parser = subparsers.add_parser(
+        "metrics", help="Aggregate fetch metrics recorded with fetch --metrics"
+    )
+    metrics_parser.add_argument(
+        "metrics_file",
+        type=str,
+        help="JSON-lines file written by fetch --metrics",
+    )
+    metrics_parser.add_argument(
+        "--by",
+        type=str,
+        choices=["dataset", "host", "dataset-host"],
+        default="dataset-host",
+        help="Grouping of the summary (default: dataset-host)",
+    )
+    metrics_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print summaries as JSON lines instead of a table",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(0)
 
+    # Metrics only read the metrics file, not the dataset configuration
+    if args.command == "metrics":
+        handle_metrics(args)
+
     # Validate config file exists
     config_path = Path(args.config)
     if not config_path.exists():
@@ -174,9 +219,11 @@ def handle_fetch(args: argparse.Namespace) -> None:
     print(f"TODO: implement fetch for dataset '{args.dataset_id}'")
     print(f"  Config: {args.config}")
     print(f"  Output: {args.output}")
+    print(f"  Metrics: {args.metrics}")
     # TODO: Implement fetch logic
     # from radar_data.infrastructure.config.loader import load_configs
     # from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+    # from radar_data.infrastructure.net.metrics import MetricsSink
     # from radar_data.application.use_cases.fetch_use_case import FetchUseCase
     #
     # datasets, _ = load_configs(args.config)
@@ -185,12 +232,62 @@ def handle_fetch(args: argparse.Namespace) -> None:
     #     print(f"Error: Dataset '{args.dataset_id}' not found", file=sys.stderr)
     #     sys.exit(1)
     #
-    # fetcher = HttpFetcher()
+    # metrics = MetricsSink(args.metrics) if args.metrics else None
+    # if metrics is not None:
+    #     metrics.register(dataset["source"]["url"], dataset["id"])
+    # fetcher = HttpFetcher(metrics=metrics)
     # use_case = FetchUseCase(fetcher)
     # use_case.execute(dataset["source"]["url"], args.output)
     sys.exit(0)
 
 
+def handle_metrics(args: argparse.Namespace) -> None:
+    """Handle metrics command.
+
+    Prints per-group request counts, cache outcomes, bytes, connect and
+    TTFB times and transfer throughput, so slow runs can be attributed
+    to the network or to local processing.
+
+    Args:
+        args: Parsed command-line arguments.
+    """
+    import json
+    from dataclasses import asdict
+
+    from radar_data.infrastructure.net.metrics import load_metrics, summarize
+
+    metrics_path = Path(args.metrics_file)
+    if not metrics_path.exists():
+        print(f"Error: Metrics file not found: {args.metrics_file}", file=sys.stderr)
+        sys.exit(1)
+
+    by = {
+        "dataset": ("dataset_id",),
+        "host": ("host",),
+        "dataset-host": ("dataset_id", "host"),
+    }[args.by]
+    summaries = summarize(load_metrics(metrics_path), by=by)
+
+    if args.json:
+        for summary in summaries:
+            print(json.dumps(asdict(summary)))
+        sys.exit(0)
+
+    print(
+        f"{'group':<40}{'reqs':>6}{'errs':>6}{'retry':>6}{'304':>6}{'hits':>6}"
+        f"{'MB':>10}{'conn s':>8}{'ttfb p50':>10}{'ttfb p95':>10}{'xfer s':>8}{'Mbit/s':>9}"
+    )
+    for s in summaries:
+        group = "/".join(value or "-" for value in s.key)
+        print(
+            f"{group:<40}{s.requests:>6}{s.errors:>6}{s.retries:>6}{s.not_modified:>6}"
+            f"{s.cache_hits:>6}{s.bytes_received / 1e6:>10.2f}{s.connect_seconds:>8.2f}"
+            f"{s.ttfb_p50:>10.3f}{s.ttfb_p95:>10.3f}{s.transfer_seconds:>8.2f}"
+            f"{s.throughput_mbps:>9.1f}"
+        )
+    sys.exit(0)
+
+
 def handle_parse(args: argparse.Namespace) -> None:
     """Handle parse command.
 
@@ -206,7 +303,17 @@ def handle_parse(args: argparse.Namespace) -> None:
     print(f"  Config: {args.config}")
     print(f"  Input: {args.input}")
     print(f"  Output: {args.output}")
+    print(f"  Cache: {args.cache_dir}")
     # TODO: Implement parse logic
+    # from radar_data.infrastructure.io.parse_cache import ArrowParseCache
+    # from radar_data.infrastructure.parse.registry import ParserRegistry
+    # from radar_data.application.use_cases.parse_use_case import ParseUseCase
+    #
+    # cache = None
+    # if args.cache_dir:
+    #     max_bytes = int(args.cache_max_mb * 1e6) if args.cache_max_mb else None
+    #     cache = ArrowParseCache(args.cache_dir, max_bytes=max_bytes)
+    # use_case = ParseUseCase(ParserRegistry(), cache=cache)
     sys.exit(0)
 
 
@@ -270,4 +377,3 @@ def handle_write(args: argparse.Namespace) -> None:
 
 if __name__ == "__main__":
     main()
-
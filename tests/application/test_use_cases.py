@@ -3,6 +3,10 @@
 TODO: Implement actual use case tests when use case logic is added.
 """
 
+from collections.abc import Iterator
+
+import pytest
+
 from radar_data.application.use_cases import (
     FetchUseCase,
     NormalizeUseCase,
@@ -10,6 +14,29 @@ from radar_data.application.use_cases import (
     QualityUseCase,
     WriteUseCase,
 )
+from radar_data.domain.entities import FetchResult
+
+
+class _StubFetcher:
+    """In-memory FetcherPort that fails for URLs containing 'bad'."""
+
+    def fetch(self, source_url: str, destination_path: str) -> str:
+        if "bad" in source_url:
+            raise FileNotFoundError(source_url)
+        return destination_path
+
+    def fetch_with_metadata(
+        self, source_url: str, destination_path: str
+    ) -> tuple[str, dict[str, str]]:
+        return self.fetch(source_url, destination_path), {"ETag": '"v1"'}
+
+
+class _StubBatchFetcher:
+    """BatchFetcherPort that yields targets in reverse order."""
+
+    def fetch_many(self, targets: list[tuple[str, str]]) -> Iterator[FetchResult]:
+        for url, dest in reversed(targets):
+            yield FetchResult(source_url=url, destination_path=dest, file_path=dest)
 
 
 def test_use_cases_exist() -> None:
@@ -30,3 +57,76 @@ def test_use_cases_exist() -> None:
     assert QualityUseCase is not None
     assert WriteUseCase is not None
 
+
+def test_fetch_use_case_execute_many_serial_fallback() -> None:
+    """Test that execute_many falls back to serial fetching and reports errors."""
+    use_case = FetchUseCase(_StubFetcher())
+
+    results = list(use_case.execute_many([("http://x/good", "a"), ("http://x/bad", "b")]))
+
+    assert [result.ok for result in results] == [True, False]
+    assert results[1].error is not None and "FileNotFoundError" in results[1].error
+
+
+def test_fetch_use_case_execute_many_uses_batch_fetcher() -> None:
+    """Test that execute_many delegates to the batch fetcher when provided."""
+    use_case = FetchUseCase(_StubFetcher(), batch_fetcher=_StubBatchFetcher())
+
+    results = list(use_case.execute_many([("u1", "a"), ("u2", "b")]))
+
+    assert [result.source_url for result in results] == ["u2", "u1"]
+
+
+class _StubParser:
+    """Non-streaming ParserPort returning a fixed list of records."""
+
+    def parse(self, file_path: str, dataset_config: dict) -> list[dict[str, str | float]]:
+        return [{"date": f"2024-01-{day:02d}", "value": float(day)} for day in range(1, 6)]
+
+    def supports(self, file_path: str) -> bool:
+        return file_path.endswith(".csv")
+
+
+def test_parse_use_case_execute_batches_chunks_non_streaming_parser() -> None:
+    """Test that records of a plain ParserPort are split into batches."""
+    use_case = ParseUseCase(_StubParser())
+
+    batches = list(use_case.execute_batches("data.csv", {}, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert use_case.execute("data.csv", {}) == [r for batch in batches for r in batch]
+    with pytest.raises(ValueError):
+        use_case.execute("data.xlsx", {})
+
+
+class _UnitParser:
+    """Picklable ParserPort echoing the file and sheet it was asked to parse."""
+
+    def parse(self, file_path: str, dataset_config: dict) -> list[dict[str, str | float]]:
+        sheet = dataset_config["source"].get("sheet")
+        return [{"date": f"{file_path}:{sheet}", "value": float(row)} for row in range(2)]
+
+    def supports(self, file_path: str) -> bool:
+        return file_path.endswith(".xlsx")
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_parse_use_case_execute_parallel_keeps_unit_order(max_workers: int) -> None:
+    """Test that units are parsed with their sheet and merged in unit order."""
+    use_case = ParseUseCase(_UnitParser())
+    config = {"source": {"sheet": "Cuadro 1"}}
+    units = [("a.xlsx", "Cuadro 2"), ("a.xlsx", None), ("b.xlsx", "Cuadro 2")]
+
+    records = use_case.execute_parallel(units, config, max_workers=max_workers)
+
+    assert [record["date"] for record in records] == [
+        "a.xlsx:Cuadro 2",
+        "a.xlsx:Cuadro 2",
+        "a.xlsx:Cuadro 1",
+        "a.xlsx:Cuadro 1",
+        "b.xlsx:Cuadro 2",
+        "b.xlsx:Cuadro 2",
+    ]
+    assert config == {"source": {"sheet": "Cuadro 1"}}
+    with pytest.raises(ValueError):
+        use_case.execute_parallel([("c.csv", None)], config)
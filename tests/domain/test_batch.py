@@ -0,0 +1,65 @@
+"""Tests for the columnar ObservationBatch."""
+
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+
+from radar_data.domain import ObservationBatch
+from radar_data.domain.entities import Observation, Provenance
+from radar_data.domain.errors import InvalidObservationError
+
+PROVENANCE = Provenance(
+    source_url="https://example.com/data.csv",
+    fetched_at=datetime(2024, 1, 1),
+    dataset_id="test_dataset",
+)
+
+
+def test_batch_round_trips_observations() -> None:
+    """Test conversion from and to Observations, tables and filtered batches."""
+    observations = [
+        Observation("A", datetime(2024, 1, 1), 1.5, PROVENANCE),
+        Observation("B", datetime(2024, 1, 2, 12, 30), 2.0, PROVENANCE),
+        Observation("A", datetime(2024, 1, 3), -3.25, PROVENANCE),
+    ]
+
+    batch = ObservationBatch.from_observations(observations)
+
+    assert batch.provenance == PROVENANCE
+    assert batch.series_codes.dictionary.to_pylist() == ["A", "B"]
+    assert batch.timestamps.type == pa.int64()
+    assert batch.to_observations() == observations
+    table = batch.to_table()
+    assert table.column_names == ["series_code", "timestamp", "value"]
+    assert ObservationBatch.from_table(table, PROVENANCE).to_observations() == observations
+    assert [obs.value for obs in batch.filter([True, False, True])] == [1.5, -3.25]
+
+
+def test_batch_from_arrays_with_one_series_code() -> None:
+    """Test building a batch from columns sharing one code."""
+    timestamps = pa.array([datetime(2024, 1, 1), datetime(2024, 2, 1)], pa.timestamp("ms"))
+
+    batch = ObservationBatch.from_arrays("X", timestamps, pa.array([1, 2]))
+
+    assert len(batch) == 2
+    assert batch.series_codes.to_pylist() == ["X", "X"]
+    assert batch.timestamps.to_pylist() == [1704067200000000, 1706745600000000]
+    assert batch.values.type == pa.float64()
+    assert batch.provenance is None
+
+
+def test_batch_rejects_inconsistent_columns() -> None:
+    """Test that nulls, length mismatches and mixed provenances are rejected."""
+    with pytest.raises(InvalidObservationError) as excinfo:
+        ObservationBatch.from_arrays("X", [datetime(2024, 1, 1)] * 2, [1.0, None])
+    assert excinfo.value.observation_index == 1
+    with pytest.raises(InvalidObservationError):
+        ObservationBatch.from_arrays(["X"], [datetime(2024, 1, 1)], [1.0, 2.0])
+    with pytest.raises(InvalidObservationError):
+        ObservationBatch.from_observations(
+            [
+                Observation("X", datetime(2024, 1, 1), 1.0, PROVENANCE),
+                Observation("X", datetime(2024, 1, 2), 2.0),
+            ]
+        )
@@ -5,7 +5,7 @@ TODO: Implement actual entity tests when domain logic is added.
 
 from datetime import datetime
 
-from radar_data.domain.entities import Observation, Provenance, Series
+from radar_data.domain.entities import FetchResult, Observation, Provenance, Series
 
 
 def test_series_creation() -> None:
@@ -68,3 +68,20 @@ def test_provenance_creation() -> None:
     assert provenance.dataset_id == "test_dataset"
     assert provenance.file_hash == "abc123"
 
+
+
+def test_fetch_result_to_provenance() -> None:
+    """Test that a FetchResult carries its content hash into Provenance."""
+    result = FetchResult(
+        source_url="https://example.com/data.csv",
+        destination_path="data/raw/data.csv",
+        file_path="data/raw/data.csv",
+        metadata={"Content-Hash": "abc123"},
+    )
+
+    provenance = result.to_provenance("test_dataset", fetched_at=datetime(2024, 1, 1))
+
+    assert result.ok
+    assert provenance.file_hash == "abc123"
+    assert provenance.source_url == "https://example.com/data.csv"
+    assert provenance.dataset_id == "test_dataset"
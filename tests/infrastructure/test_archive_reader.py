@@ -0,0 +1,53 @@
+"""Tests for the archive reader adapter."""
+
+import gzip
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from radar_data.infrastructure.parse.archive import ArchiveReader
+
+CONFIG = {"source": {"columns": {"date": "fecha", "value": "valor"}}}
+
+
+def _csv(rows: list[tuple[str, str]]) -> bytes:
+    lines = ["fecha,valor"] + [f"{date},{value}" for date, value in rows]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_zip_members_are_selected_by_glob_in_member_order(tmp_path: Path) -> None:
+    """Test that matching members are parsed and concatenated in order."""
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("series/ipc_2023.csv", _csv([("2023-12", "1")]))
+        archive.writestr("README.txt", "ignored")
+        archive.writestr("series/ipc_2024.csv", _csv([("2024-01", "2"), ("2024-02", "3")]))
+    config = {"source": {**CONFIG["source"], "member": "series/ipc_*.csv"}}
+
+    records = ArchiveReader(max_workers=2).parse(str(path), config)
+
+    assert [record["date"] for record in records] == ["2023-12", "2024-01", "2024-02"]
+    assert not (tmp_path / "series").exists()
+
+
+def test_gzip_member_is_streamed(tmp_path: Path) -> None:
+    """Test that a .csv.gz file is parsed as its single member."""
+    path = tmp_path / "reservas.csv.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(_csv([("2024-01-02", "100")]))
+
+    reader = ArchiveReader()
+
+    assert reader.members(str(path)) == ["reservas.csv"]
+    assert reader.parse(str(path), CONFIG) == [{"date": "2024-01-02", "value": "100"}]
+
+
+def test_no_matching_member_raises(tmp_path: Path) -> None:
+    """Test that a glob matching nothing raises ValueError."""
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("notes.txt", "nothing to parse")
+
+    with pytest.raises(ValueError):
+        ArchiveReader().parse(str(path), CONFIG)
@@ -0,0 +1,54 @@
+"""Tests for the concurrent fetch engine."""
+
+import time
+from pathlib import Path
+
+from radar_data.infrastructure.net.concurrent_fetcher import ConcurrentFetcher
+from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+from tests.support.http_server import serve_files
+
+
+def test_fetch_many_runs_downloads_concurrently(tmp_path: Path) -> None:
+    """Test that wall-clock time tracks the slowest source, not the sum."""
+    files = {f"/file{i}.csv": f"date,value\n2024-01-0{i},{i}\n".encode() for i in range(8)}
+    with serve_files(files, latency=0.3) as (base_url, _):
+        fetcher = ConcurrentFetcher(HttpFetcher(), max_concurrency=8, max_per_host=8)
+        targets = [(base_url + path, str(tmp_path / path.lstrip("/"))) for path in files]
+
+        started = time.perf_counter()
+        results = list(fetcher.fetch_many(targets))
+        elapsed = time.perf_counter() - started
+
+    assert len(results) == 8
+    assert all(result.ok for result in results)
+    assert elapsed < 8 * 0.3 / 2
+    for path, body in files.items():
+        assert (tmp_path / path.lstrip("/")).read_bytes() == body
+
+
+def test_fetch_many_respects_per_host_limit(tmp_path: Path) -> None:
+    """Test that no more than max_per_host requests hit one host at once."""
+    files = {f"/file{i}.csv": b"x" for i in range(6)}
+    with serve_files(files, latency=0.1) as (base_url, state):
+        fetcher = ConcurrentFetcher(HttpFetcher(), max_concurrency=6, max_per_host=2)
+        targets = [(base_url + path, str(tmp_path / path.lstrip("/"))) for path in files]
+        results = list(fetcher.fetch_many(targets))
+
+    assert all(result.ok for result in results)
+    assert state.peak_in_flight <= 2
+
+
+def test_fetch_many_reports_failures_without_aborting(tmp_path: Path) -> None:
+    """Test that a failing source is reported and the batch continues."""
+    with serve_files({"/ok.csv": b"ok"}) as (base_url, _):
+        fetcher = ConcurrentFetcher(HttpFetcher(), max_concurrency=2)
+        targets = [
+            (base_url + "/missing.csv", str(tmp_path / "missing.csv")),
+            (base_url + "/ok.csv", str(tmp_path / "ok.csv")),
+        ]
+        results = {result.source_url: result for result in fetcher.fetch_many(targets)}
+
+    assert results[base_url + "/ok.csv"].ok
+    missing = results[base_url + "/missing.csv"]
+    assert not missing.ok
+    assert missing.error is not None and "FileNotFoundError" in missing.error
@@ -0,0 +1,49 @@
+"""Tests for the content-addressed raw file store."""
+
+from pathlib import Path
+
+from radar_data.infrastructure.io.content_store import ContentStore, hash_file
+
+
+def _write(path: Path, content: bytes) -> Path:
+    path.write_bytes(content)
+    return path
+
+
+def test_identical_payloads_are_stored_once(tmp_path: Path) -> None:
+    """Test that the same content under different names shares one blob."""
+    store = ContentStore(tmp_path / "store")
+
+    first = store.put_file(_write(tmp_path / "reservas_2024-01.xlsx", b"same"))
+    second = store.put_file(_write(tmp_path / "reservas_2024-02.xlsx", b"same"))
+
+    assert first == second
+    assert first.digest == hash_file(first.path)
+    assert first.path.endswith(".xlsx")
+    assert not (tmp_path / "reservas_2024-02.xlsx").exists()
+    assert store.total_bytes == 4
+
+
+def test_least_recently_used_blobs_are_evicted(tmp_path: Path) -> None:
+    """Test that the byte budget evicts the least recently used blob."""
+    store = ContentStore(tmp_path / "store", max_bytes=20)
+    a = store.put_file(_write(tmp_path / "a.csv", b"a" * 10))
+    b = store.put_file(_write(tmp_path / "b.csv", b"b" * 10))
+    store.get(a.digest)
+
+    c = store.put_file(_write(tmp_path / "c.csv", b"c" * 10))
+
+    assert store.get(b.digest) is None
+    assert not Path(b.path).exists()
+    assert store.get(a.digest) is not None
+    assert store.get(c.digest) is not None
+    assert store.total_bytes == 20
+
+
+def test_index_is_persisted(tmp_path: Path) -> None:
+    """Test that a new store instance sees blobs stored by a previous one."""
+    blob = ContentStore(tmp_path / "store").put_file(_write(tmp_path / "a.csv", b"abc"))
+
+    reopened = ContentStore(tmp_path / "store")
+
+    assert reopened.get(blob.digest) == blob
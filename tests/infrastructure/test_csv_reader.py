@@ -0,0 +1,240 @@
+"""Tests for the CSV reader adapter."""
+
+import csv
+import gzip
+import io
+import tracemalloc
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from radar_data.application.use_cases.parse_use_case import ParseUseCase
+from radar_data.infrastructure.parse.csv_reader import CsvReader
+
+CONFIG = {"source": {"columns": {"date": "fecha", "value": "valor"}}}
+
+
+def test_parse_selects_columns_by_header_name(tmp_path: Path) -> None:
+    """Test that configured columns are read by header name."""
+    path = tmp_path / "reservas.csv"
+    path.write_text("﻿fecha,otro,valor\n2024-01-02,x,100.5\n2024-01-03,y,101\n")
+
+    records = CsvReader().parse(str(path), CONFIG)
+
+    assert records == [
+        {"date": "2024-01-02", "value": "100.5"},
+        {"date": "2024-01-03", "value": "101"},
+    ]
+
+
+def test_parse_stream_honours_start_cell_and_letters() -> None:
+    """Test that the header row comes from start_cell and letters select columns."""
+    stream = io.BytesIO(b"Titulo;;\nfecha;x;valor\n2024-01;1;2,5\n")
+    config = {"source": {"start_cell": "A2", "columns": {"date": "A", "value": "C"}}}
+
+    records = CsvReader(delimiter=";").parse_stream(stream, config)
+
+    assert records == [{"date": "2024-01", "value": "2,5"}]
+    assert not stream.closed
+
+
+def test_parse_rejects_unknown_column(tmp_path: Path) -> None:
+    """Test that a missing column raises ValueError."""
+    path = tmp_path / "ipc.csv"
+    path.write_text("periodo,indice\n2024-01,100\n")
+
+    with pytest.raises(ValueError):
+        CsvReader().parse(str(path), CONFIG)
+
+
+def test_iter_batches_streams_bounded_batches(tmp_path: Path) -> None:
+    """Test that batches hold at most batch_size records, in file order."""
+    path = tmp_path / "reservas.csv"
+    path.write_text("fecha,valor\n" + "".join(f"2024-01-{d:02d},{d}\n" for d in range(1, 8)))
+
+    batches = list(CsvReader().iter_batches(str(path), CONFIG, batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [r for batch in batches for r in batch] == CsvReader().parse(str(path), CONFIG)
+
+
+def test_iter_batches_memory_is_bounded_by_batch_size(tmp_path: Path) -> None:
+    """Test that streaming a large file does not materialize every row."""
+    path = tmp_path / "large.csv"
+    path.write_text("fecha,valor\n" + "".join(f"2024-01-01,{n}\n" for n in range(50_000)))
+
+    tracemalloc.start()
+    try:
+        count = sum(len(batch) for batch in CsvReader().iter_batches(str(path), CONFIG, 1000))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 50_000
+    assert peak < 2 * 1024 * 1024
+
+
+def test_parse_use_case_streams_csv_reader(tmp_path: Path) -> None:
+    """Test that ParseUseCase passes CsvReader batches through lazily."""
+    path = tmp_path / "reservas.csv"
+    path.write_text("fecha,valor\n2024-01-02,1\n2024-01-03,2\n")
+
+    batches = ParseUseCase(CsvReader()).execute_batches(str(path), CONFIG, batch_size=1)
+
+    assert next(batches) == [{"date": "2024-01-02", "value": "1"}]
+    assert next(batches) == [{"date": "2024-01-03", "value": "2"}]
+    with pytest.raises(FileNotFoundError):
+        ParseUseCase(CsvReader()).execute_batches(str(tmp_path / "missing.csv"), CONFIG)
+
+
+def test_read_table_projects_mapped_columns(tmp_path: Path) -> None:
+    """Test that the columnar path reads only the mapped columns, typed."""
+    path = tmp_path / "wide.csv"
+    path.write_text("Titulo,,,\nfecha,a,b,valor\n2024-01-02,x,y,100.5\n2024-01-04,x,y,7\n")
+    config = {"source": {"start_cell": "A2", "columns": {"date": "A", "value": "valor"}}}
+
+    table = CsvReader().read_table(str(path), config, column_types={"value": pa.float64()})
+
+    assert table.column_names == ["date", "value"]
+    assert table.schema.field("value").type == pa.float64()
+    assert table.to_pylist() == [
+        {"date": "2024-01-02", "value": 100.5},
+        {"date": "2024-01-04", "value": 7.0},
+    ]
+    # Short rows are errors on the columnar path; parse_tolerant() quarantines them.
+    with path.open("a") as f:
+        f.write("2024-01-05,x,y\n")
+    with pytest.raises(ValueError, match="Expected 4 columns"):
+        CsvReader().read_table(str(path), config)
+
+
+def test_iter_record_batches_matches_record_path(tmp_path: Path) -> None:
+    """Test that Arrow record batches hold the same rows as parse()."""
+    path = tmp_path / "reservas.csv"
+    path.write_text("fecha,valor\n" + "".join(f"2024-01-01,{n}\n" for n in range(5000)))
+
+    batches = list(CsvReader(block_size=16 * 1024).iter_record_batches(str(path), CONFIG))
+
+    assert len(batches) > 1
+    assert pa.Table.from_batches(batches).to_pylist() == CsvReader().parse(str(path), CONFIG)
+
+
+def test_read_table_keeps_quoted_newlines_across_blocks(tmp_path: Path) -> None:
+    """Test that multi-block Arrow reads agree with parse() on quoted newlines."""
+    path = tmp_path / "ipc.csv"
+    rows = [f'2024-{n:05d},"{n},5\nnota ""{n}"""\n' for n in range(5000)]
+    path.write_text("fecha,valor\n" + "".join(rows))
+    reader = CsvReader(block_size=4096)
+
+    table = reader.read_table(str(path), CONFIG)
+    batches = list(reader.iter_record_batches(str(path), CONFIG))
+
+    assert len(batches) > 1
+    assert table.to_pylist() == CsvReader().parse(str(path), CONFIG)
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_parallel_batches_split_on_record_boundaries(tmp_path: Path, max_workers: int) -> None:
+    """Test that byte-range parsing keeps quoted newlines and row order."""
+    path = tmp_path / "ipc.csv"
+    rows = [f'2024-{n:04d},"{n},5\nnota ""{n}"""\n' for n in range(500)]
+    path.write_text("Titulo\nfecha,valor\n" + "".join(rows))
+    config = {"source": {"start_cell": "A2", "columns": {"date": "fecha", "value": "valor"}}}
+    reader = CsvReader()
+
+    batches = list(
+        reader.iter_record_batches_parallel(
+            str(path), config, max_workers=max_workers, chunk_size=256
+        )
+    )
+    table = pa.Table.from_batches(batches)
+
+    assert len(batches) > 10
+    assert table.column("date").to_pylist() == [f"2024-{n:04d}" for n in range(500)]
+    assert table.column("value")[7].as_py() == '7,5\nnota "7"'
+    assert reader.read_table_parallel(str(path), config, max_workers=max_workers).equals(table)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_parallel_ranges_larger_than_block_keep_quoted_newlines(
+    tmp_path: Path, max_workers: int
+) -> None:
+    """Test that ranges spanning several Arrow blocks do not cut quoted records."""
+    path = tmp_path / "ipc.csv"
+    rows = [f'2024-{n:05d},"{n},5\nnota ""{n}"""\n' for n in range(20_000)]
+    path.write_text("fecha,valor\n" + "".join(rows))
+    reader = CsvReader(block_size=4096)
+
+    table = pa.Table.from_batches(
+        list(
+            reader.iter_record_batches_parallel(
+                str(path), CONFIG, max_workers=max_workers, chunk_size=64 * 1024
+            )
+        )
+    )
+
+    assert table.num_rows == 20_000
+    assert table.column("value")[12_345].as_py() == '12345,5\nnota "12345"'
+    assert reader.read_table_parallel(str(path), CONFIG, max_workers=max_workers).equals(table)
+
+
+def test_memory_map_matches_csv_module(tmp_path: Path) -> None:
+    """Test that the memory-mapped tokenizer agrees with csv on quoting and blank rows."""
+    path = tmp_path / "ipc.csv"
+    path.write_bytes(
+        "﻿fecha;nota;valor\r\n"
+        '2024-01;"a;b";1,5\r\n'
+        '2024-02;"linea\r\nnueva ""x""";2\r\n'
+        "\r\n"
+        "2024-03;sólo dos\r\n"
+        '"2024-04";;"4"'.encode()
+    )
+    config = {"source": {"columns": {"date": "fecha", "value": "valor"}}}
+    reader = CsvReader(delimiter=";", memory_map=True)
+
+    records = reader.parse(str(path), config)
+
+    assert records == CsvReader(delimiter=";").parse(str(path), config)
+    assert [r["date"] for r in records] == ["2024-01", "2024-02", "2024-04"]
+    batches = list(reader.iter_batches(str(path), config, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+def test_parse_tolerant_quarantines_bad_rows(tmp_path: Path) -> None:
+    """Test that bad rows are quarantined with line and reason while parsing continues."""
+    path = tmp_path / "ipc.csv"
+    path.write_bytes(
+        b"fecha;valor\n2024-01;1.234,5\n2024-02;s/d\n2024-03\n;7\n2024-04;\xff8\n2024-05;-3,2%\n"
+    )
+    quarantine = tmp_path / "quarantine.csv.gz"
+
+    records, counts = CsvReader(delimiter=";").parse_tolerant(str(path), CONFIG, quarantine)
+
+    assert records == [
+        {"date": "2024-01", "value": "1.234,5"},
+        {"date": "2024-05", "value": "-3,2%"},
+    ]
+    assert counts == {"invalid_value": 1, "short_row": 1, "missing_date": 1, "decode_error": 1}
+    with gzip.open(quarantine, "rt", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["source", "row", "reason", "raw"]
+    assert [(row[1], row[2]) for row in rows[1:]] == [
+        ("3", "invalid_value"),
+        ("4", "short_row"),
+        ("5", "missing_date"),
+        ("6", "decode_error"),
+    ]
+    assert rows[4][3] == "2024-04;\\udcff8"
+
+
+def test_parse_tolerant_skips_malformed_rows(tmp_path: Path) -> None:
+    """Test that tokenizer errors are quarantined instead of aborting the parse."""
+    path = tmp_path / "reservas.csv"
+    path.write_text(f'fecha,valor\n2024-01-02,1\n2024-01-03,"{"9" * 200_000}"\n2024-01-04,2\n')
+
+    records, counts = CsvReader().parse_tolerant(str(path), CONFIG, tmp_path / "q.csv.gz")
+
+    assert [record["date"] for record in records] == ["2024-01-02", "2024-01-04"]
+    assert counts == {"malformed_row": 1}
@@ -0,0 +1,123 @@
+"""Tests for HTML link discovery."""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from radar_data.infrastructure.net import discovery
+from radar_data.infrastructure.net.discovery import (
+    DiscoveryCache,
+    LinkDiscoverer,
+    discover_download_links,
+)
+from tests.support.http_server import serve_files
+
+INDEX = b"""<html><body>
+<a href="series/reservas.xlsx">Reservas</a>
+<a href="/files/ipc.csv#latest">IPC</a>
+<a href="sub/">Older releases</a>
+<a href="https://other.example/page.html">Elsewhere</a>
+<a href="mailto:datos@example.com">Contact</a>
+</body></html>"""
+
+SUB = b"""<html><body><a href="2023.csv">2023</a><a href="deeper/">More</a></body></html>"""
+
+
+def test_discover_download_links_resolves_and_filters() -> None:
+    """Test that relative links are resolved and filtered by pattern."""
+    with serve_files({"/data/": INDEX}) as (base_url, _):
+        links = discover_download_links(base_url + "/data/", pattern=".csv")
+
+    assert links == [base_url + "/files/ipc.csv"]
+
+
+def test_discovery_follows_links_to_bounded_depth() -> None:
+    """Test recursive discovery stops at max_depth."""
+    files = {"/data/": INDEX, "/data/sub/": SUB, "/data/sub/deeper/": b'<a href="x.csv">x</a>'}
+    with serve_files(files) as (base_url, state):
+        links = LinkDiscoverer(max_depth=1).discover([base_url + "/data/"])
+
+    assert links == [
+        base_url + "/data/series/reservas.xlsx",
+        base_url + "/files/ipc.csv",
+        base_url + "/data/sub/2023.csv",
+    ]
+    assert state.requests == 2
+
+
+def test_discovery_fetches_pages_concurrently() -> None:
+    """Test that pages of one level are fetched in parallel."""
+    files = {f"/p{i}/": f'<a href="f{i}.csv">f</a>'.encode() for i in range(6)}
+    with serve_files(files, latency=0.2) as (base_url, _):
+        started = time.perf_counter()
+        links = LinkDiscoverer(max_workers=6).discover([base_url + path for path in files])
+        elapsed = time.perf_counter() - started
+
+    assert len(links) == 6
+    assert elapsed < 6 * 0.2 / 2
+
+
+def test_discovery_cache_skips_unchanged_pages(tmp_path: Path) -> None:
+    """Test that cached validators and fingerprints detect unchanged pages."""
+    with serve_files({"/data/": INDEX}) as (base_url, state):
+        LinkDiscoverer(cache=DiscoveryCache(tmp_path)).discover([base_url + "/data/"])
+        discoverer = LinkDiscoverer(cache=DiscoveryCache(tmp_path))
+        links = discoverer.discover([base_url + "/data/"], pattern=".xlsx")
+
+    assert links == [base_url + "/data/series/reservas.xlsx"]
+    assert [visit.status for visit in discoverer.last_visits] == ["not_modified"]
+    assert state.not_modified == 1
+
+    with serve_files({"/data/": INDEX}, etag=False) as (base_url, _):
+        LinkDiscoverer(cache=DiscoveryCache(tmp_path / "fp")).discover([base_url + "/data/"])
+        discoverer = LinkDiscoverer(cache=DiscoveryCache(tmp_path / "fp"))
+        discoverer.discover([base_url + "/data/"])
+
+    assert [visit.status for visit in discoverer.last_visits] == ["unchanged"]
+
+
+def test_discovery_fingerprint_hit_skips_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a page without validators is not parsed again when unchanged."""
+    files = {"/data/": INDEX}
+    parsed: list[str] = []
+    read_page = discovery._read_page
+
+    def counting_read_page(base_url: str, *args: Any) -> discovery.CachedPage:
+        parsed.append(base_url)
+        return read_page(base_url, *args)
+
+    monkeypatch.setattr(discovery, "_read_page", counting_read_page)
+    with serve_files(files, etag=False) as (base_url, _):
+        first = LinkDiscoverer(cache=DiscoveryCache(tmp_path)).discover([base_url + "/data/"])
+        discoverer = LinkDiscoverer(cache=DiscoveryCache(tmp_path))
+        assert discoverer.discover([base_url + "/data/"]) == first
+        assert [visit.status for visit in discoverer.last_visits] == ["unchanged"]
+        assert len(parsed) == 1
+
+        files["/data/"] = INDEX + b'<a href="new.csv">new</a>'
+        links = discoverer.discover([base_url + "/data/"], pattern="new.csv")
+
+    assert links == [base_url + "/data/new.csv"]
+    assert [visit.status for visit in discoverer.last_visits] == ["fetched"]
+    assert len(parsed) == 2
+
+
+def test_discovery_reports_failed_pages_and_continues() -> None:
+    """Test that a dead index page is recorded without aborting the others."""
+    with serve_files({"/ok/": b'<a href="f.csv">f</a>'}) as (base_url, _):
+        discoverer = LinkDiscoverer()
+        links = discoverer.discover([base_url + "/missing/", base_url + "/ok/"])
+        with pytest.raises(requests.RequestException, match="404"):
+            discover_download_links(base_url + "/missing/")
+
+    assert links == [base_url + "/ok/f.csv"]
+    assert [(visit.status, visit.error is None) for visit in discoverer.last_visits] == [
+        ("error", False),
+        ("fetched", True),
+    ]
+    assert "404" in (discoverer.last_visits[0].error or "")
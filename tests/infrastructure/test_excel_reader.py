@@ -0,0 +1,189 @@
+"""Tests for the Excel reader adapter."""
+
+import gzip
+import io
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from radar_data.application.use_cases import ParseUseCase
+from radar_data.infrastructure.parse.archive import ArchiveReader
+from radar_data.infrastructure.parse.excel_reader import ExcelReader
+from radar_data.infrastructure.parse.xlsx import XlsxWorkbook, decode_serials
+
+openpyxl = pytest.importorskip("openpyxl")
+
+CONFIG = {
+    "source": {
+        "sheet": "Serie",
+        "start_cell": "B3",
+        "columns": {"date": "Fecha", "value": "Reservas"},
+    }
+}
+
+
+def _workbook(rows: int = 5) -> bytes:
+    """Build a workbook with a cover sheet and a data table starting at B3."""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Portada"
+    workbook.active["A1"] = "BCRA - Series"
+    sheet = workbook.create_sheet("Serie")
+    sheet["A1"] = "Reservas internacionales"
+    sheet.append([])
+    sheet.append([None, "Fecha", "Notas", "Reservas", "Otro"])
+    for day in range(1, rows + 1):
+        sheet.append([None, datetime(2024, 1, day), "-", 1000 + day, "x"])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(params=["native", "openpyxl"])
+def reader(request: pytest.FixtureRequest) -> ExcelReader:
+    """ExcelReader for each backend."""
+    return ExcelReader(backend=request.param)
+
+
+def test_parse_reads_configured_sheet_from_start_cell(tmp_path: Path, reader: ExcelReader) -> None:
+    """Test that the mapped columns of the configured sheet are extracted."""
+    path = tmp_path / "reservas.xlsx"
+    path.write_bytes(_workbook(rows=2))
+
+    records = reader.parse(str(path), CONFIG)
+
+    assert records == [
+        {"date": "2024-01-01T00:00:00", "value": 1001.0},
+        {"date": "2024-01-02T00:00:00", "value": 1002.0},
+    ]
+
+
+def test_iter_batches_and_column_letters(tmp_path: Path, reader: ExcelReader) -> None:
+    """Test batching and columns given as sheet letters."""
+    path = tmp_path / "reservas.xlsx"
+    path.write_bytes(_workbook(rows=5))
+    config = {"source": {**CONFIG["source"], "columns": {"date": "B", "value": "D"}}}
+
+    batches = list(reader.iter_batches(str(path), config, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[-1] == [{"date": "2024-01-05T00:00:00", "value": 1005.0}]
+
+
+def test_missing_sheet_raises(tmp_path: Path, reader: ExcelReader) -> None:
+    """Test that an unknown sheet name raises ValueError."""
+    path = tmp_path / "reservas.xlsx"
+    path.write_bytes(_workbook())
+    config = {"source": {**CONFIG["source"], "sheet": "Otra"}}
+
+    with pytest.raises(ValueError):
+        reader.parse(str(path), config)
+
+
+def test_native_backend_matches_openpyxl(tmp_path: Path) -> None:
+    """Test that both backends agree on strings, gaps, dates and the active sheet."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Datos"
+    sheet.append(["Periodo", "Valor", "Fuente"])
+    sheet.append([datetime(1900, 2, 28), 1.5, "INDEC"])
+    sheet.append([datetime(2024, 3, 1, 12, 30), "s/d", "INDEC"])
+    sheet.append([])
+    sheet.append([datetime(2024, 4, 1), None, "BCRA"])
+    sheet.append(["2024-05", 7, None])
+    path = tmp_path / "datos.xlsx"
+    workbook.save(path)
+    config = {"source": {"columns": {"date": "Periodo", "value": "Valor"}}}
+
+    native = ExcelReader(backend="native").parse(str(path), config)
+
+    assert native == ExcelReader(backend="openpyxl").parse(str(path), config)
+    assert native[1] == {"date": "2024-03-01T12:30:00", "value": "s/d"}
+    assert len(native) == 4
+
+
+def test_parse_tolerant_quarantines_rows_by_sheet_row(tmp_path: Path, reader: ExcelReader) -> None:
+    """Test that rows failing coercion are quarantined with their sheet row."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Periodo", "Valor"])
+    sheet.append([datetime(2024, 1, 1), 1.5])
+    sheet.append([datetime(2024, 2, 1), "#N/A"])
+    sheet.append([])
+    sheet.append(["Fuente: INDEC", None])
+    sheet.append(["2024-05", "1.234,5"])
+    path = tmp_path / "datos.xlsx"
+    workbook.save(path)
+    quarantine = tmp_path / "quarantine.csv.gz"
+    config = {"source": {"columns": {"date": "Periodo", "value": "Valor"}}}
+
+    records, counts = reader.parse_tolerant(str(path), config, quarantine)
+
+    assert records == [
+        {"date": "2024-01-01T00:00:00", "value": 1.5},
+        {"date": "2024-05", "value": "1.234,5"},
+    ]
+    assert counts == {"invalid_value": 1, "invalid_date": 1}
+    with gzip.open(quarantine, "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [line.split(",")[1:3] for line in lines[1:]] == [
+        ["3", "invalid_value"],
+        ["5", "invalid_date"],
+    ]
+
+
+def test_xlsx_workbook_skips_rows_and_columns() -> None:
+    """Test that XlsxWorkbook returns only the requested window of a sheet."""
+    with XlsxWorkbook(io.BytesIO(_workbook(rows=4))) as workbook:
+        assert workbook.sheet_names == ["Portada", "Serie"]
+        assert workbook.active_sheet == "Portada"
+        rows = list(workbook.iter_rows("Serie", min_row=3, max_row=5, min_col=2, max_col=3))
+
+    assert rows == [["Notas", "Reservas"], ["-", 1001.0], ["-", 1002.0]]
+
+
+def test_sheets_parse_in_parallel_units(tmp_path: Path) -> None:
+    """Test that every sheet of a workbook can be fanned out as a parse unit."""
+    path = tmp_path / "reservas.xlsx"
+    path.write_bytes(_workbook(rows=3))
+    reader = ExcelReader()
+    units: list[tuple[str, str | None]] = [
+        (str(path), sheet) for sheet in reader.sheet_names(str(path))
+    ]
+    config = {"source": {**CONFIG["source"], "columns": {"date": "B", "value": "D"}}}
+
+    records = ParseUseCase(reader).execute_parallel(units, config, max_workers=2)
+
+    assert [unit[1] for unit in units] == ["Portada", "Serie"]
+    assert len(records) == 3
+
+
+def test_decode_serials_matches_excel_epochs() -> None:
+    """Test bulk serial decoding for both date systems and the 1900 leap bug."""
+    assert decode_serials([45292, 60, 61, 45292.5]) == [
+        "2024-01-01T00:00:00",
+        "1900-02-28T00:00:00",
+        "1900-03-01T00:00:00",
+        "2024-01-01T12:00:00",
+    ]
+    assert decode_serials([0], date1904=True) == ["1904-01-01T00:00:00"]
+    assert decode_serials([]) == []
+
+
+def test_unknown_backend_raises() -> None:
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        ExcelReader(backend="xlrd")
+
+
+def test_workbook_inside_zip_is_parsed_from_stream(tmp_path: Path) -> None:
+    """Test that ArchiveReader streams .xlsx members into ExcelReader."""
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("reservas.xlsx", _workbook(rows=3))
+    config = {"source": {**CONFIG["source"], "member": "*.xlsx"}}
+
+    records = ArchiveReader().parse(str(path), config)
+
+    assert len(records) == 3
@@ -0,0 +1,253 @@
+"""Tests for the HTTP fetcher adapter."""
+
+import hashlib
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import requests
+
+from radar_data.infrastructure.io.content_store import ContentStore, hash_file
+from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+from radar_data.infrastructure.net.validator_store import ValidatorStore
+from tests.support.http_server import serve_files
+
+
+def test_conditional_get_skips_unchanged_source(tmp_path: Path) -> None:
+    """Test that a 304 returns the cached file without a body transfer."""
+    files = {"/data.csv": b"date,value\n2024-01-01,1\n"}
+    with serve_files(files) as (base_url, state):
+        fetcher = HttpFetcher(validator_store=ValidatorStore(tmp_path))
+        first_path, first_meta = fetcher.fetch_with_metadata(
+            base_url + "/data.csv", str(tmp_path / "run1.csv")
+        )
+        # A fresh store instance proves the validators were persisted.
+        fetcher = HttpFetcher(validator_store=ValidatorStore(tmp_path))
+        second_path, second_meta = fetcher.fetch_with_metadata(
+            base_url + "/data.csv", str(tmp_path / "run2.csv")
+        )
+
+    assert first_meta["Status"] == "200"
+    assert second_meta["Status"] == "304"
+    assert second_path == first_path
+    assert second_meta["ETag"] == first_meta["ETag"]
+    assert not (tmp_path / "run2.csv").exists()
+    assert state.requests == 2
+    assert state.not_modified == 1
+    assert state.bytes_sent == len(files["/data.csv"])
+
+
+def test_conditional_get_downloads_changed_source(tmp_path: Path) -> None:
+    """Test that a changed source is downloaded again and validators updated."""
+    files = {"/data.csv": b"v1"}
+    with serve_files(files) as (base_url, _):
+        fetcher = HttpFetcher(validator_store=ValidatorStore(tmp_path))
+        fetcher.fetch(base_url + "/data.csv", str(tmp_path / "run1.csv"))
+        files["/data.csv"] = b"v2"
+        path, metadata = fetcher.fetch_with_metadata(
+            base_url + "/data.csv", str(tmp_path / "run2.csv")
+        )
+
+    assert metadata["Status"] == "200"
+    assert Path(path).read_bytes() == b"v2"
+    cached = ValidatorStore(tmp_path).get(base_url + "/data.csv")
+    assert cached is not None and cached.file_path == path
+
+
+def test_validator_store_ignores_sources_without_validators(tmp_path: Path) -> None:
+    """Test that sources without ETag/Last-Modified are always re-fetched."""
+    with serve_files({"/data.csv": b"x"}, etag=False) as (base_url, state):
+        fetcher = HttpFetcher(validator_store=ValidatorStore(tmp_path))
+        fetcher.fetch(base_url + "/data.csv", str(tmp_path / "a.csv"))
+        fetcher.fetch(base_url + "/data.csv", str(tmp_path / "b.csv"))
+
+    assert state.not_modified == 0
+    assert state.bytes_sent == 2
+
+
+def test_content_store_deduplicates_republished_files(tmp_path: Path) -> None:
+    """Test that identical payloads from different URLs share one blob."""
+    files = {"/2024-01/ipc.xlsx": b"same workbook", "/2024-02/ipc.xlsx": b"same workbook"}
+    with serve_files(files) as (base_url, _):
+        fetcher = HttpFetcher(content_store=ContentStore(tmp_path / "store"))
+        path1, meta1 = fetcher.fetch_with_metadata(
+            base_url + "/2024-01/ipc.xlsx", str(tmp_path / "raw" / "a.xlsx")
+        )
+        path2, meta2 = fetcher.fetch_with_metadata(
+            base_url + "/2024-02/ipc.xlsx", str(tmp_path / "raw" / "b.xlsx")
+        )
+
+    assert path1 == path2
+    assert meta1["Content-Hash"] == meta2["Content-Hash"] == hash_file(path1)
+    assert Path(path1).read_bytes() == b"same workbook"
+
+
+def test_large_download_streams_with_flat_memory(tmp_path: Path) -> None:
+    """Test that a download is hashed in flight without buffering the body."""
+    body = os.urandom(16 * 1024 * 1024)
+    with serve_files({"/bundle.zip": body}) as (base_url, _):
+        fetcher = HttpFetcher(chunk_size=64 * 1024)
+        tracemalloc.start()
+        try:
+            path, metadata = fetcher.fetch_with_metadata(
+                base_url + "/bundle.zip", str(tmp_path / "bundle.zip")
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert peak < 4 * 1024 * 1024
+    assert metadata["Content-Hash"] == hashlib.sha256(body).hexdigest()
+    assert Path(path).read_bytes() == body
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle.zip"]
+
+
+def test_interrupted_download_leaves_destination_untouched(tmp_path: Path) -> None:
+    """Test that a truncated transfer does not replace the existing file."""
+    destination = tmp_path / "data.csv"
+    destination.write_bytes(b"previous")
+    with serve_files({"/data.csv": b"x" * 4096}, etag=False) as (base_url, state):
+        state.truncate_after = 1024
+        with pytest.raises(requests.RequestException):
+            HttpFetcher(retries=0).fetch(base_url + "/data.csv", str(destination))
+
+    assert destination.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.csv"]
+
+
+def test_failed_transfer_is_retried_from_checkpoint(tmp_path: Path) -> None:
+    """Test that a retry resumes with a Range request instead of byte zero."""
+    body = os.urandom(256 * 1024)
+    with serve_files({"/bundle.zip": body}) as (base_url, state):
+        state.truncate_after, state.truncate_times = 100_000, 1
+        path, metadata = HttpFetcher(retries=1, chunk_size=4096).fetch_with_metadata(
+            base_url + "/bundle.zip", str(tmp_path / "bundle.zip")
+        )
+
+    assert Path(path).read_bytes() == body
+    assert metadata["Content-Hash"] == hashlib.sha256(body).hexdigest()
+    # Only the tail is re-sent; a chunk left incomplete by the failure may repeat.
+    assert len(state.range_requests) == 1
+    assert state.bytes_sent < len(body) + 4096
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle.zip"]
+
+
+def test_interrupted_download_resumes_on_next_run(tmp_path: Path) -> None:
+    """Test that a later run resumes a partial download left by a failed one."""
+    body = os.urandom(256 * 1024)
+    destination = str(tmp_path / "bundle.zip")
+    with serve_files({"/bundle.zip": body}) as (base_url, state):
+        state.truncate_after, state.truncate_times = 50_000, 1
+        with pytest.raises(requests.RequestException):
+            HttpFetcher(retries=0, chunk_size=4096).fetch(base_url + "/bundle.zip", destination)
+        assert (tmp_path / ".bundle.zip.part.json").exists()
+
+        path = HttpFetcher(retries=0).fetch(base_url + "/bundle.zip", destination)
+
+    assert Path(path).read_bytes() == body
+    assert len(state.range_requests) == 1
+    assert state.range_requests[0].endswith(f"-{len(body) - 1}")
+    assert state.bytes_sent < len(body) + 4096
+
+
+def test_changed_source_restarts_partial_download(tmp_path: Path) -> None:
+    """Test that If-Range makes a changed source download in full."""
+    files = {"/data.csv": b"a" * 10_000}
+    destination = str(tmp_path / "data.csv")
+    with serve_files(files) as (base_url, state):
+        state.truncate_after, state.truncate_times = 4_000, 1
+        with pytest.raises(requests.RequestException):
+            HttpFetcher(retries=0, chunk_size=1024).fetch(base_url + "/data.csv", destination)
+        files["/data.csv"] = b"b" * 12_000
+
+        path = HttpFetcher(retries=0).fetch(base_url + "/data.csv", destination)
+
+    assert Path(path).read_bytes() == b"b" * 12_000
+    assert state.range_requests == []
+
+
+def test_segmented_download_joins_parallel_ranges(tmp_path: Path) -> None:
+    """Test that a large file is split into parallel ranges and joined."""
+    body = os.urandom(1024 * 1024 + 7)
+    with serve_files({"/bundle.zip": body}) as (base_url, state):
+        fetcher = HttpFetcher(segments=4, segment_min_bytes=1024, chunk_size=16 * 1024)
+        path, metadata = fetcher.fetch_with_metadata(
+            base_url + "/bundle.zip", str(tmp_path / "bundle.zip")
+        )
+
+    assert Path(path).read_bytes() == body
+    assert metadata["Content-Hash"] == hashlib.sha256(body).hexdigest()
+    assert metadata["Content-Length"] == str(len(body))
+    assert len(state.range_requests) == 3
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle.zip"]
+
+
+def test_segmented_download_falls_back_without_range_support(tmp_path: Path) -> None:
+    """Test that servers without Accept-Ranges get a single streamed GET."""
+    body = os.urandom(64 * 1024)
+    with serve_files({"/bundle.zip": body}) as (base_url, state):
+        state.ranges = False
+        fetcher = HttpFetcher(segments=4, segment_min_bytes=1024)
+        path = fetcher.fetch(base_url + "/bundle.zip", str(tmp_path / "bundle.zip"))
+
+    assert Path(path).read_bytes() == body
+    assert state.requests == 1
+
+
+def test_session_pool_reuses_connections(tmp_path: Path) -> None:
+    """Test that sequential fetches to one host share a keep-alive connection."""
+    files = {f"/file{i}.csv": b"x" * 100 for i in range(5)}
+    with serve_files(files) as (base_url, state):
+        fetcher = HttpFetcher()
+        for path in files:
+            fetcher.fetch(base_url + path, str(tmp_path / path.lstrip("/")))
+
+    assert state.requests == 5
+    assert len(state.connections) == 1
+
+
+def test_throttled_requests_are_retried_with_backoff(tmp_path: Path) -> None:
+    """Test that 503 responses are retried, honouring Retry-After."""
+    with serve_files({"/data.csv": b"ok"}) as (base_url, state):
+        state.fail_times = 2
+        path = HttpFetcher(retries=2, backoff_base=0.01).fetch(
+            base_url + "/data.csv", str(tmp_path / "data.csv")
+        )
+
+    assert Path(path).read_bytes() == b"ok"
+    assert state.requests == 3
+
+
+def test_retries_are_bounded(tmp_path: Path) -> None:
+    """Test that a persistently failing source raises after the last retry."""
+    with serve_files({"/data.csv": b"ok"}) as (base_url, state):
+        state.fail_times = 10
+        with pytest.raises(requests.HTTPError):
+            HttpFetcher(retries=1, backoff_base=0.01).fetch(
+                base_url + "/data.csv", str(tmp_path / "data.csv")
+            )
+
+    assert state.requests == 2
+
+
+def test_random_server_errors_are_retried(tmp_path: Path) -> None:
+    """Test that injected transient errors are absorbed by retries."""
+    files = {f"/{n}.csv": b"x" * 100 for n in range(10)}
+    with serve_files(files, error_rate=0.3) as (base_url, state):
+        fetcher = HttpFetcher(retries=10, backoff_base=0.001)
+        for path in files:
+            fetcher.fetch(base_url + path, str(tmp_path / path.lstrip("/")))
+
+    assert state.errors > 0
+    assert state.requests == len(files) + state.errors
+
+
+def test_bandwidth_limit_paces_transfer(tmp_path: Path) -> None:
+    """Test that the server's bandwidth cap slows the download down."""
+    with serve_files({"/data.csv": b"x" * 20_000}, bandwidth=100_000) as (base_url, _):
+        started = time.perf_counter()
+        HttpFetcher().fetch(base_url + "/data.csv", str(tmp_path / "data.csv"))
+
+    assert time.perf_counter() - started >= 0.15
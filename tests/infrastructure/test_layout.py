@@ -0,0 +1,132 @@
+"""Tests for layout templates of provider parser plugins."""
+
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from radar_data.infrastructure.parse import layout as layout_module
+from radar_data.infrastructure.parse.layout import LayoutStore
+from radar_data.infrastructure.parse.plugins.example_bcra_reservas import BcraReservasParser
+from radar_data.infrastructure.parse.plugins.example_indec_ipc import IndecIpcParser
+
+openpyxl = pytest.importorskip("openpyxl")
+
+CONFIG = {
+    "id": "bcra_reservas",
+    "source": {"sheet": "Serie", "columns": {"date": "Fecha", "value": "Reservas"}},
+}
+EXPECTED = [
+    {"date": "2024-01-01T00:00:00", "value": 1001.0},
+    {"date": "2024-01-02T00:00:00", "value": 1002.0},
+    {"date": "2024-01-03T00:00:00", "value": 1003.0},
+]
+
+
+def _save(path: Path, title_rows: int = 2) -> None:
+    """Write a BCRA-like sheet: titles, header, data, then source notes."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Serie"
+    for row in range(1, title_rows + 1):
+        sheet.cell(row=row, column=1, value=f"Titulo {row}")
+    sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=4)
+    sheet.append([])
+    sheet.append(["Fecha", "Notas", " reservas ", "Otro"])
+    for day in range(1, 4):
+        sheet.append([datetime(2024, 1, day), "-", 1000 + day, "x"])
+    sheet.append([])
+    sheet.append(["Fuente: BCRA"])
+    sheet.append([datetime(2024, 2, 1), None, 9.0])
+    workbook.save(path)
+
+
+def test_first_parse_detects_and_stores_layout(tmp_path: Path) -> None:
+    """Test that the header, columns and end marker are detected."""
+    path = tmp_path / "reservas.xlsx"
+    _save(path)
+    store = LayoutStore(tmp_path / "layouts.json")
+
+    assert BcraReservasParser(store).parse(str(path), CONFIG) == EXPECTED
+
+    layout = LayoutStore(tmp_path / "layouts.json").get("bcra_reservas:Serie")
+    assert layout is not None
+    assert (layout.header_row, layout.date_col, layout.value_col) == (4, 0, 2)
+    assert layout.end_marker == "Fuente: BCRA"
+
+
+def test_failed_store_write_leaves_no_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed write removes its temp file and keeps the old file."""
+    path = tmp_path / "reservas.xlsx"
+    _save(path)
+    store = LayoutStore(tmp_path / "layouts.json")
+    BcraReservasParser(store).parse(str(path), CONFIG)
+    layout = store.get("bcra_reservas:Serie")
+    assert layout is not None
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(layout_module.json, "dump", fail)
+    with pytest.raises(OSError, match="disk full"):
+        store.put("otra:Serie", layout)
+
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+    assert LayoutStore(tmp_path / "layouts.json").get("otra:Serie") is None
+
+
+def test_matching_fingerprint_skips_detection(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that later parses reuse the stored layout without scanning."""
+    path = tmp_path / "reservas.xlsx"
+    _save(path)
+    parser = BcraReservasParser(tmp_path / "layouts.json")
+    parser.parse(str(path), CONFIG)
+
+    def fail(*args: object) -> None:
+        raise AssertionError("layout detected again")
+
+    monkeypatch.setattr(layout_module, "detect_layout", fail)
+    assert parser.parse(str(path), CONFIG) == EXPECTED
+    assert pickle.loads(pickle.dumps(parser)).parse(str(path), CONFIG) == EXPECTED
+
+
+def test_changed_header_area_triggers_detection(tmp_path: Path) -> None:
+    """Test that a moved header invalidates the stored layout."""
+    path = tmp_path / "reservas.xlsx"
+    _save(path)
+    parser = BcraReservasParser()
+    parser.parse(str(path), CONFIG)
+
+    _save(path, title_rows=4)
+
+    assert parser.parse(str(path), CONFIG) == EXPECTED
+    layout = parser.layout_store.get("bcra_reservas:Serie")
+    assert layout is not None and layout.header_row == 6
+
+
+def test_positional_columns_and_missing_header(tmp_path: Path) -> None:
+    """Test letter-mapped columns and the error when no header is found."""
+    path = tmp_path / "ipc.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Indice de precios al consumidor"])
+    sheet.append(["Periodo", "Nivel general"])
+    sheet.append(["2024-01", 100.0])
+    sheet.append(["2024-02", 113.2])
+    sheet.append(["Nota: base diciembre 2016 = 100"])
+    workbook.save(path)
+    parser = IndecIpcParser()
+    config = {"source": {"columns": {"date": "A", "value": "B"}}}
+
+    assert parser.parse(str(path), config) == [
+        {"date": "2024-01", "value": 100.0},
+        {"date": "2024-02", "value": 113.2},
+    ]
+    assert parser.supports("ipc.XLSX") and not parser.supports("ipc.csv")
+    with pytest.raises(ValueError, match="No header"):
+        parser.parse(str(path), {"source": {"columns": {"date": "Mes", "value": "Valor"}}})
@@ -0,0 +1,87 @@
+"""Tests for fetch transfer metrics."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from radar_data.infrastructure.io.content_store import ContentStore
+from radar_data.infrastructure.net.http_fetcher import HttpFetcher
+from radar_data.infrastructure.net.metrics import MetricsSink, load_metrics, summarize
+from radar_data.infrastructure.net.validator_store import ValidatorStore
+from tests.support.http_server import serve_files
+
+
+def test_fetch_emits_transfer_metrics(tmp_path: Path) -> None:
+    """Test that downloads, 304s and retries are recorded per fetch."""
+    sink = MetricsSink(tmp_path / "metrics.jsonl")
+    with serve_files({"/data.csv": b"x" * 5000}, latency=0.02) as (base_url, state):
+        url = base_url + "/data.csv"
+        sink.register(url, "example_bcra_reservas")
+        fetcher = HttpFetcher(
+            validator_store=ValidatorStore(tmp_path), metrics=sink, backoff_base=0.001
+        )
+        fetcher.fetch(url, str(tmp_path / "run1.csv"))
+        state.fail_times = 1
+        fetcher.fetch(url, str(tmp_path / "run2.csv"))
+
+    first, second = load_metrics(tmp_path / "metrics.jsonl")
+    assert first.dataset_id == "example_bcra_reservas"
+    assert first.status == 200
+    assert first.bytes_received == 5000
+    assert first.connect_seconds > 0
+    assert first.ttfb_seconds >= 0.02
+    assert not first.cache_hit
+    assert second.status == 304
+    assert second.not_modified and second.cache_hit
+    assert second.bytes_received == 0
+    assert second.retries == 1
+
+
+def test_failed_fetch_and_content_store_hit_are_recorded(tmp_path: Path) -> None:
+    """Test that errors and content-store deduplication show up in the records."""
+    sink = MetricsSink()
+    with serve_files({"/a.csv": b"same", "/b.csv": b"same"}) as (base_url, _):
+        fetcher = HttpFetcher(content_store=ContentStore(tmp_path / "store"), metrics=sink)
+        fetcher.fetch(base_url + "/a.csv", str(tmp_path / "a.csv"))
+        fetcher.fetch(base_url + "/b.csv", str(tmp_path / "b.csv"))
+        try:
+            fetcher.fetch(base_url + "/missing.csv", str(tmp_path / "c.csv"))
+        except FileNotFoundError:
+            pass
+
+    a, b, missing = sink.records
+    assert not a.cache_hit and b.cache_hit
+    assert missing.status == 404
+    assert missing.error.startswith("FileNotFoundError")
+
+    [summary] = summarize(sink.records, by=("host",))
+    assert summary.requests == 3
+    assert summary.errors == 1
+    assert summary.cache_hits == 1
+    assert summary.bytes_received == 8
+
+
+def test_cli_aggregates_metrics_file(tmp_path: Path) -> None:
+    """Test that the metrics subcommand summarizes a metrics file."""
+    sink = MetricsSink(tmp_path / "metrics.jsonl")
+    with serve_files({"/data.csv": b"x" * 100}) as (base_url, _):
+        sink.register(base_url + "/data.csv", "example_indec_ipc")
+        HttpFetcher(metrics=sink).fetch(base_url + "/data.csv", str(tmp_path / "data.csv"))
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "radar_data.interface.cli.runner",
+            "metrics",
+            str(tmp_path / "metrics.jsonl"),
+            "--by",
+            "dataset",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent.parent,
+    )
+
+    assert result.returncode == 0
+    assert "example_indec_ipc" in result.stdout
@@ -0,0 +1,247 @@
+"""Tests for the normalization adapters."""
+
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+
+from radar_data.domain.entities import Provenance
+from radar_data.infrastructure.normalize import dates as dates_module
+from radar_data.infrastructure.normalize.dates import (
+    EXCEL_SERIAL,
+    infer_date_format,
+    parse_date_column,
+)
+from radar_data.infrastructure.normalize.mapping import MappingNormalizer
+from radar_data.infrastructure.normalize.memo import ParseMemo
+from radar_data.infrastructure.normalize.numbers import (
+    ARGENTINE,
+    NumberFormat,
+    coerce_numbers,
+    number_format_from_config,
+)
+from radar_data.infrastructure.parse.xlsx import decode_serials
+
+CONFIG = {
+    "name": "Reservas",
+    "provider": "BCRA",
+    "source": {"columns": {"date": "fecha", "value": "valor"}},
+    "normalize": {"internal_series_code": "BCRA_RESERVES", "unit": "USD", "frequency": "daily"},
+}
+
+
+@pytest.mark.parametrize(
+    ("values", "expected_format"),
+    [
+        (["2024-01-02T00:00:00", "2024-03-01T12:30:00"], "%Y-%m-%dT%H:%M:%S"),
+        (["05/03/2024", "28/02/2024"], "%d/%m/%Y"),
+        (["2024-01", "2024-02"], "%Y-%m"),
+        (["45292", "45293.5"], EXCEL_SERIAL),
+    ],
+)
+def test_infer_date_format(values: list[str], expected_format: str) -> None:
+    """Test that a column's format is inferred from its values."""
+    assert infer_date_format(values) == expected_format
+
+
+def test_parse_date_column_spanish_months_and_serials() -> None:
+    """Test Spanish month names, Excel serials in mixed cells and the 1900 leap bug."""
+    assert parse_date_column(["Ene-24", "feb-24", "Sept. 2023"]).to_pylist() == [
+        datetime(2024, 1, 1),
+        datetime(2024, 2, 1),
+        datetime(2023, 9, 1),
+    ]
+    assert parse_date_column([45292.0, "2024-01-05", 59.0, 61.0]).to_pylist() == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 5),
+        datetime(1900, 2, 28),
+        datetime(1900, 3, 1),
+    ]
+
+
+def test_excel_serials_agree_across_readers_and_normalizer() -> None:
+    """Test that serials 59, 60 (the phantom 1900-02-29) and 61 decode alike everywhere."""
+    expected = [datetime(1900, 2, 28), datetime(1900, 2, 28), datetime(1900, 3, 1)]
+
+    assert parse_date_column([59.0, 60.0, 61.0]).to_pylist() == expected
+    assert parse_date_column(["59", "60", "61"], EXCEL_SERIAL).to_pylist() == expected
+    assert decode_serials([59, 60, 61]) == [day.isoformat() for day in expected]
+
+
+def test_parse_date_column_falls_back_per_row() -> None:
+    """Test that rows off the inferred format use dateutil and bad dates raise."""
+    values = ["10/03/2024", "5/3/2024", "2024-03-06", "29/02/2024"]
+
+    assert parse_date_column(values).to_pylist() == [
+        datetime(2024, 3, 10),
+        datetime(2024, 3, 5),
+        datetime(2024, 3, 6),
+        datetime(2024, 2, 29),
+    ]
+    with pytest.raises(ValueError, match="31/02/2024"):
+        parse_date_column(["01/02/2024", "31/02/2024"])
+
+
+def test_parse_date_column_pads_unpadded_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that d/m/yyyy dates without zero padding skip the dateutil fallback."""
+
+    def no_fallback(text: str | None) -> datetime:
+        raise AssertionError(f"{text!r} fell back to dateutil")
+
+    monkeypatch.setattr(dates_module, "_fallback", no_fallback)
+
+    assert parse_date_column(["5/3/2024", "15/3/2024", "1/12/2023"]).to_pylist() == [
+        datetime(2024, 3, 5),
+        datetime(2024, 3, 15),
+        datetime(2023, 12, 1),
+    ]
+    assert parse_date_column(["3/2024", "11/2024"]).to_pylist() == [
+        datetime(2024, 3, 1),
+        datetime(2024, 11, 1),
+    ]
+    assert parse_date_column(["45292.5", "45293"], EXCEL_SERIAL).to_pylist() == [
+        datetime(2024, 1, 1, 12),
+        datetime(2024, 1, 2),
+    ]
+
+
+def test_normalize_builds_series_and_observations() -> None:
+    """Test normalization of parser records and of records keyed by source column."""
+    records: list[dict[str, str | float]] = [
+        {"date": "02/01/2024", "value": "100.5"},
+        {"date": "03/01/2024", "value": 101.0},
+    ]
+
+    series, observations = MappingNormalizer().normalize(records, CONFIG)
+
+    assert (series.code, series.name, series.provider) == ("BCRA_RESERVES", "Reservas", "BCRA")
+    assert [(obs.timestamp, obs.value) for obs in observations] == [
+        (datetime(2024, 1, 2), 100.5),
+        (datetime(2024, 1, 3), 101.0),
+    ]
+    by_column: list[dict[str, str | float]] = [{"fecha": "2024-01-02", "valor": "7"}]
+    _, observations = MappingNormalizer().normalize(by_column, CONFIG)
+    assert observations[0].timestamp == datetime(2024, 1, 2)
+    with pytest.raises(ValueError):
+        MappingNormalizer().normalize([{"fecha": "2024-01-02"}], CONFIG)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (
+            ["1.234.567,89", "-3,2%", " 12 ", "s/d", "///", "-"],
+            [1234567.89, -3.2, 12.0, None, None, None],
+        ),
+        (["1,234.5", "$ 7", "N/D"], [1234.5, 7.0, None]),
+        (["100.5", "101"], [100.5, 101.0]),
+        (["1.234.567", "12.345", "999"], [1234567.0, 12345.0, 999.0]),
+        (["1.234.567", "999"], [1234567.0, 999.0]),
+        (["12.345", "1.000"], [12345.0, 1000.0]),
+        (["1,234,567", "10.5"], [1234567.0, 10.5]),
+        ([1.5, "2,5", "-"], [1.5, 2.5, None]),
+    ],
+)
+def test_coerce_numbers_infers_separators(
+    values: list[str | float], expected: list[float | None]
+) -> None:
+    """Test Argentine and English formats, signs, spaces and null tokens."""
+    assert coerce_numbers(values).to_pylist() == pytest.approx(expected)
+
+
+def test_coerce_numbers_with_configured_format() -> None:
+    """Test explicit separators and null tokens, and rejection of bad values."""
+    assert coerce_numbers(["1.234"], ARGENTINE).to_pylist() == [1234.0]
+    assert coerce_numbers(["1.234"], NumberFormat(decimal=".")).to_pylist() == [1.234]
+    fmt = number_format_from_config({"decimal_separator": ",", "null_tokens": ["n.d."]})
+    assert (fmt.decimal, fmt.thousands) == (",", ".")
+    assert coerce_numbers(["1.000,5", "N.D."], fmt).to_pylist() == [1000.5, None]
+    with pytest.raises(ValueError, match="s/d"):
+        coerce_numbers(["1,5", "s/d"], fmt)
+    with pytest.raises(ValueError, match="abc"):
+        coerce_numbers(["1,5", "abc"])
+    with pytest.raises(ValueError):
+        NumberFormat(decimal=",", thousands=",")
+
+
+def test_normalize_drops_null_tokens() -> None:
+    """Test that values are coerced with the configured locale and placeholders dropped."""
+    records: list[dict[str, str | float]] = [
+        {"date": "2024-01", "value": "1.234,5"},
+        {"date": "2024-02", "value": "s/d"},
+        {"date": "2024-03", "value": "2.000"},
+    ]
+    normalize = {"internal_series_code": "AR", "unit": "ARS", "frequency": "monthly"}
+    config = {"normalize": {**normalize, "decimal_separator": ","}}
+
+    _, observations = MappingNormalizer().normalize(records, config)
+
+    assert [(obs.timestamp.month, obs.value) for obs in observations] == [(1, 1234.5), (3, 2000.0)]
+
+
+def test_normalize_batch_matches_observation_list() -> None:
+    """Test that the columnar path yields the same observations as the list path."""
+    records: list[dict[str, str | float]] = [
+        {"date": "02/01/2024", "value": "100.5"},
+        {"date": "03/01/2024", "value": "-"},
+        {"date": "04/01/2024", "value": 101.0},
+    ]
+    provenance = Provenance("https://example.com/r.csv", datetime(2024, 1, 5), "reservas")
+
+    series, batch = MappingNormalizer().normalize_batch(records, CONFIG, provenance)
+    _, observations = MappingNormalizer().normalize(records, CONFIG)
+
+    assert series.code == "BCRA_RESERVES"
+    assert batch.provenance == provenance
+    assert [(obs.timestamp, obs.value) for obs in batch] == [
+        (obs.timestamp, obs.value) for obs in observations
+    ]
+    assert len(batch) == 2
+
+
+def test_memo_parses_repeated_strings_once() -> None:
+    """Test that series sharing a date axis reuse the memoized dates and values."""
+    calls: list[list[str]] = []
+    memo = ParseMemo()
+
+    def parse(distinct: pa.Array) -> pa.Array:
+        calls.append(distinct.to_pylist())
+        return pa.array([float(text) for text in distinct.to_pylist()])
+
+    column = pa.array(["1.5", "2", "1.5", None])
+    assert memo.map_unique("value", column, parse, pa.float64()).to_pylist() == [
+        1.5,
+        2.0,
+        1.5,
+        None,
+    ]
+    assert memo.map_unique("value", pa.array(["2", "3"]), parse, pa.float64()).to_pylist() == [
+        2.0,
+        3.0,
+    ]
+    assert calls == [["1.5", "2"], ["3"]]
+    assert (memo.stats.hits, memo.stats.misses) == (1, 3)
+
+    normalizer = MappingNormalizer(memo)
+    records: list[dict[str, str | float]] = [{"date": "2024-01", "value": "1.5"}]
+    for _ in range(3):
+        _, observations = normalizer.normalize(records, CONFIG)
+    assert observations[0].timestamp == datetime(2024, 1, 1)
+    # Values are memoized per number format, so only the two later calls hit.
+    assert memo.stats.hits == 1 + 4
+
+
+def test_memo_evicts_least_recently_used() -> None:
+    """Test the LRU bound and the eviction counter."""
+    memo = ParseMemo(maxsize=2)
+    memo.put("a", 1)
+    memo.put("b", 2)
+    assert memo.get("a") == 1
+    memo.put("c", 3)
+
+    assert memo.get("b") is None
+    assert (memo.get("a"), memo.get("c")) == (1, 3)
+    assert memo.stats.evictions == 1
+    assert memo.stats.hit_rate == pytest.approx(3 / 4)
+    with pytest.raises(ValueError):
+        ParseMemo(maxsize=0)
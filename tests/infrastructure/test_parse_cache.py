@@ -0,0 +1,106 @@
+"""Tests for the Arrow IPC parse cache."""
+
+from pathlib import Path
+
+import pytest
+
+from radar_data.application.use_cases import ParseUseCase
+from radar_data.infrastructure.io.parse_cache import ArrowParseCache
+from radar_data.infrastructure.parse.csv_reader import CsvReader
+from radar_data.infrastructure.parse.registry import ParserRegistry
+
+SOURCE = {"columns": {"date": "fecha", "value": "valor"}}
+
+
+def test_round_trip_keeps_mixed_value_types(tmp_path: Path) -> None:
+    """Test that text, numbers and missing keys survive the Arrow encoding."""
+    raw = tmp_path / "raw.xlsx"
+    raw.write_bytes(b"workbook")
+    records: list[dict[str, str | float]] = [
+        {"date": "2024-01-01T00:00:00", "value": 1.5},
+        {"date": 2024.0, "value": "s/d"},
+        {"date": "2024-03-01T00:00:00"},
+    ]
+    cache = ArrowParseCache(tmp_path / "cache")
+
+    assert cache.get(str(raw), "excel@1", SOURCE) is None
+    cache.put(str(raw), "excel@1", SOURCE, records)
+
+    assert cache.get(str(raw), "excel@1", SOURCE) == records
+    assert cache.get(str(raw), "excel@2", SOURCE) is None
+    assert cache.get(str(raw), "excel@1", {**SOURCE, "sheet": "Otra"}) is None
+    raw.write_bytes(b"workbook v2")
+    assert cache.get(str(raw), "excel@1", SOURCE) is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Test that the byte budget evicts the oldest entries first."""
+    cache = ArrowParseCache(tmp_path / "cache")
+    records: list[dict[str, str | float]] = [{"date": f"d{n}", "value": n} for n in range(200)]
+    raws = []
+    for n in range(3):
+        raw = tmp_path / f"raw{n}.csv"
+        raw.write_text(f"file {n}")
+        raws.append(str(raw))
+    cache.put(raws[0], "csv", SOURCE, records)
+    entry_size = cache.total_bytes
+    cache.max_bytes = 2 * entry_size
+
+    cache.put(raws[1], "csv", SOURCE, records)
+    cache.put(raws[2], "csv", SOURCE, records)
+
+    assert cache.total_bytes <= 2 * entry_size
+    assert cache.get(raws[0], "csv", SOURCE) is None
+    assert cache.get(raws[2], "csv", SOURCE) == records
+
+
+def test_parse_use_case_skips_parsing_on_hit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that reruns and normalize-only config changes reuse cached records."""
+    raw = tmp_path / "reservas.csv"
+    raw.write_text("fecha,valor\n2024-01-02,100\n")
+    reader = CsvReader()
+    use_case = ParseUseCase(reader, cache=ArrowParseCache(tmp_path / "cache"))
+    config = {"source": SOURCE, "normalize": {"unit": "USD"}}
+    first = use_case.execute(str(raw), config)
+
+    def fail(*args: object) -> None:
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(reader, "parse", fail)
+    monkeypatch.setattr(reader, "iter_batches", fail)
+
+    assert use_case.execute(str(raw), {**config, "normalize": {"unit": "ARS"}}) == first
+    assert list(use_case.execute_batches(str(raw), config)) == [first]
+    assert use_case.execute_parallel([(str(raw), None)], config) == first
+    assert ParseUseCase(CsvReader(delimiter=";")).parser_id != use_case.parser_id
+    tuned = CsvReader(use_threads=False, block_size=4096, memory_map=True)
+    assert ParseUseCase(tuned).parser_id == use_case.parser_id
+
+
+def test_registry_cache_key_follows_delegated_parser(tmp_path: Path) -> None:
+    """Test that a new version of the parser picked by the registry misses the cache."""
+
+    class PluginReader(CsvReader):
+        version = "1.0"
+
+    plugin = PluginReader()
+    registry = ParserRegistry(discover_plugins=False)
+    registry.register("plugin", lambda: plugin)
+    raw = tmp_path / "reservas.csv"
+    raw.write_text("fecha,valor\n2024-01-02,100\n")
+    config = {"source": {**SOURCE, "parser": "plugin"}}
+    use_case = ParseUseCase(registry, cache=ArrowParseCache(tmp_path / "cache"))
+    use_case.execute(str(raw), config)
+    first_id = use_case.parser_id_for(str(raw), config)
+
+    assert "PluginReader@1.0" in first_id
+    assert use_case.cache is not None
+    assert use_case.cache.get(str(raw), first_id, config["source"]) is not None
+    plugin.version = "2.0"
+    second_id = use_case.parser_id_for(str(raw), config)
+    assert second_id != first_id
+    assert use_case.cache.get(str(raw), second_id, config["source"]) is None
+    plugin.delimiter = ";"
+    assert use_case.parser_id_for(str(raw), config) != second_id
@@ -0,0 +1,129 @@
+"""Tests for the parser registry."""
+
+import gzip
+import io
+import sys
+import zipfile
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from radar_data.application.use_cases import ParseUseCase
+from radar_data.infrastructure.parse import registry as registry_module
+from radar_data.infrastructure.parse.csv_reader import CsvReader
+from radar_data.infrastructure.parse.registry import (
+    ParserRegistry,
+    detect_format,
+    sniff_delimiter,
+    sniff_format,
+)
+
+PLUGIN_MODULE = "radar_data.infrastructure.parse.plugins.example_indec_ipc"
+CONFIG = {"source": {"columns": {"date": "fecha", "value": "valor"}}}
+
+
+def test_detect_format_from_content(tmp_path: Path) -> None:
+    """Test that formats are sniffed from bytes, not extensions."""
+    xlsx = io.BytesIO()
+    with zipfile.ZipFile(xlsx, "w") as archive:
+        archive.writestr("xl/workbook.xml", "<workbook/>")
+    files = {
+        "serie.dat": b"\xef\xbb\xbffecha;valor\n2024-01;1,5\n2024-02;2\n",
+        "reservas.bin": xlsx.getvalue(),
+        "legacy.xlsx": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + bytes(100),
+        "bundle.xlsx": gzip.compress(b"fecha,valor\n"),
+        "error.csv": b"<!DOCTYPE html><html><body>503</body></html>",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_bytes(content)
+
+    assert [detect_format(tmp_path / name) for name in files] == [
+        "csv",
+        "xlsx",
+        "xls",
+        "gzip",
+        "html",
+    ]
+    assert sniff_format(bytes(range(256))) == "unknown"
+    assert sniff_delimiter(files["serie.dat"]) == ";"
+    assert sniff_delimiter(b"fecha\tvalor\n2024-01\t1,5\n") == "\t"
+    assert sniff_delimiter(b"fecha\n2024-01\n") is None
+
+
+def test_detect_caches_by_file_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a format is sniffed once per file version or known digest, never hashed."""
+    path = tmp_path / "serie.csv"
+    path.write_text("fecha,valor\n2024-01,1\n")
+    calls: list[str] = []
+    original = registry_module.detect_format
+
+    def counting_detect(file_path: str) -> str:
+        calls.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(registry_module, "detect_format", counting_detect)
+    registry = ParserRegistry(discover_plugins=False)
+
+    assert registry.detect(str(path)) == "csv"
+    assert registry.detect(str(path)) == "csv"
+    assert len(calls) == 1
+    path.write_bytes(gzip.compress(path.read_bytes()))
+    assert registry.detect(str(path)) == "gzip"
+    copy = tmp_path / "copia.txt"
+    copy.write_bytes(path.read_bytes())
+    assert registry.detect(str(path), digest="abc") == "gzip"
+    assert registry.detect(str(copy), digest="abc") == "gzip"
+    assert len(calls) == 3
+
+
+def test_plugins_are_discovered_and_imported_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entry point plugins are registered without being imported."""
+    monkeypatch.delitem(sys.modules, PLUGIN_MODULE, raising=False)
+    plugin = EntryPoint(
+        name="indec_ipc",
+        value=f"{PLUGIN_MODULE}:IndecIpcParser",
+        group=registry_module.ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(registry_module, "entry_points", lambda group: [plugin])
+
+    registry = ParserRegistry()
+
+    assert "indec_ipc" in registry.names
+    assert PLUGIN_MODULE not in sys.modules
+    parser = registry.parser_for("ignored.csv", {"source": {"parser": "indec_ipc"}})
+    assert type(parser).__name__ == "IndecIpcParser"
+    assert PLUGIN_MODULE in sys.modules
+    assert registry.get("indec_ipc") is parser
+
+
+def test_parse_use_case_with_registry(tmp_path: Path) -> None:
+    """Test that the registry selects the CSV parser for an extensionless file."""
+    path = tmp_path / "descarga"
+    path.write_text("fecha,valor\n2024-01,1\n")
+    use_case = ParseUseCase(ParserRegistry(discover_plugins=False))
+
+    assert use_case.execute(str(path), CONFIG) == [{"date": "2024-01", "value": "1"}]
+    with pytest.raises(FileNotFoundError):
+        use_case.execute(str(tmp_path / "falta.csv"), CONFIG)
+    (tmp_path / "viejo.xls").write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1")
+    with pytest.raises(ValueError):
+        use_case.execute(str(tmp_path / "viejo.xls"), CONFIG)
+
+
+def test_registry_parses_with_sniffed_delimiter(tmp_path: Path) -> None:
+    """Test that a ";"-delimited file is parsed with ";", not the default ","."""
+    path = tmp_path / "serie.csv"
+    path.write_text("fecha;valor\n2024-01;1,5\n2024-02;2\n")
+    registry = ParserRegistry(discover_plugins=False)
+
+    parser = registry.parser_for(str(path))
+    assert isinstance(parser, CsvReader)
+    default = registry.get("csv")
+    assert isinstance(default, CsvReader)
+    assert (parser.delimiter, default.delimiter) == (";", ",")
+    assert registry.parse(str(path), CONFIG) == [
+        {"date": "2024-01", "value": "1,5"},
+        {"date": "2024-02", "value": "2"},
+    ]
+    assert registry.parser_for(str(path)) is parser
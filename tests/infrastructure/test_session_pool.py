@@ -0,0 +1,60 @@
+"""Tests for pooled sessions, rate limiting and retry backoff."""
+
+import pytest
+
+from radar_data.infrastructure.net.session_pool import SessionPool, TokenBucket, backoff_delay
+
+
+class _FakeClock:
+    """Manually advanced clock whose sleep moves time forward."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_requests() -> None:
+    """Test that requests beyond the burst wait for tokens at the given rate."""
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_rate_limits_match_provider_subdomains() -> None:
+    """Test that a provider domain limit covers all of its hosts."""
+    pool = SessionPool(rate_limits={"bcra.gob.ar": (2.0, 1.0), "indec.gob.ar": (1.0, 1.0)})
+
+    bcra = pool.bucket_for("https://www.bcra.gob.ar/Pdfs/series.xlsm")
+
+    assert bcra is not None
+    assert pool.bucket_for("https://api.bcra.gob.ar/x") is bcra
+    assert pool.bucket_for("https://www.indec.gob.ar/x") is not bcra
+    assert pool.bucket_for("https://example.com/x") is None
+
+
+def test_session_pool_shares_session_per_host() -> None:
+    """Test that one session is kept per host."""
+    pool = SessionPool()
+
+    assert pool.session_for("https://a.example/x") is pool.session_for("https://a.example/y")
+    assert pool.session_for("https://a.example/x") is not pool.session_for("https://b.example/x")
+
+
+def test_backoff_delay_is_jittered_and_capped() -> None:
+    """Test exponential growth with jitter, the cap and Retry-After."""
+    delays = [backoff_delay(4, base=1.0, cap=5.0) for _ in range(50)]
+
+    assert all(0 <= delay <= 5.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert backoff_delay(0, base=1.0, cap=5.0, retry_after="3") == 3.0
+    assert backoff_delay(0, base=1.0, cap=5.0, retry_after="120") == 5.0
@@ -0,0 +1,253 @@
+"""Local stand-in HTTP server for fetch-layer tests.
+
+Serves in-memory files from a background thread so fetchers can be
+exercised without touching real provider endpoints. Latency, bandwidth,
+ETag and Range support and error rates are configurable, which also
+makes it the target of the fetch benchmarks in benchmarks/.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+START_DATE = date(2000, 1, 1)
+
+
+@dataclass
+class ServerState:
+    """Files served and request statistics collected by the server.
+
+    Attributes:
+        files: Mapping of URL path (e.g., "/a.csv") to file content.
+        latency: Seconds to sleep before answering each request.
+        bandwidth: If set, maximum body bytes sent per second per response.
+        etag: Whether to send ETag headers and honour If-None-Match.
+        ranges: Whether to advertise Accept-Ranges and honour Range/If-Range.
+        truncate_after: If set, drop the connection after sending this many
+            body bytes while still advertising the full Content-Length.
+        truncate_times: How many responses to truncate; None for all.
+        fail_times: How many requests to answer with 503 before serving.
+        retry_after: Retry-After header value sent with 503 responses.
+        error_rate: Probability of answering a request with error_status.
+        error_status: Status code of randomly injected errors.
+        rng: Random generator for injected errors, seeded for repeatability.
+        requests: Number of requests received.
+        errors: Number of injected error responses sent (503s and random errors).
+        not_modified: Number of 304 responses sent.
+        bytes_sent: Total number of body bytes sent.
+        range_requests: Range header of every ranged request honoured.
+        connections: Client addresses seen, one per TCP connection.
+        in_flight: Number of requests currently being handled.
+        peak_in_flight: Highest in_flight value observed.
+    """
+
+    files: dict[str, bytes]
+    latency: float = 0.0
+    bandwidth: float | None = None
+    etag: bool = True
+    ranges: bool = True
+    truncate_after: int | None = None
+    truncate_times: int | None = None
+    fail_times: int = 0
+    retry_after: str = "0"
+    error_rate: float = 0.0
+    error_status: int = 500
+    rng: random.Random = field(default_factory=lambda: random.Random(0))
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    bytes_sent: int = 0
+    range_requests: list[str] = field(default_factory=list)
+    connections: set[tuple[str, int]] = field(default_factory=set)
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802
+        state = self.server.state
+        with state.lock:
+            state.requests += 1
+            state.in_flight += 1
+            state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+            state.connections.add(self.client_address[:2])
+            fail = state.fail_times > 0
+            state.fail_times -= int(fail)
+            error = not fail and state.error_rate > 0 and state.rng.random() < state.error_rate
+            state.errors += int(fail or error)
+        try:
+            if state.latency:
+                time.sleep(state.latency)
+            if fail or error:
+                self.send_response(503 if fail else state.error_status)
+                if fail:
+                    self.send_header("Retry-After", state.retry_after)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = state.files.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{hashlib.sha1(body).hexdigest()}"' if state.etag else ""
+            if etag and self.headers.get("If-None-Match") == etag:
+                with state.lock:
+                    state.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            start, end = 0, len(body)
+            byte_range = self._requested_range(len(body), etag)
+            if byte_range is not None:
+                start, end = byte_range
+                with state.lock:
+                    state.range_requests.append(self.headers["Range"])
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(body)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start))
+            if etag:
+                self.send_header("ETag", etag)
+            if state.ranges:
+                self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            payload = body[start:end]
+            with state.lock:
+                truncate = state.truncate_after is not None and state.truncate_times != 0
+                if truncate and state.truncate_times is not None:
+                    state.truncate_times -= 1
+            if truncate:
+                payload = payload[: state.truncate_after]
+                self.close_connection = True
+            try:
+                self._write_body(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                # Clients may stop reading early, e.g. after the first segment.
+                self.close_connection = True
+                return
+            with state.lock:
+                state.bytes_sent += len(payload)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _write_body(self, payload: bytes) -> None:
+        """Write the response body, paced to the configured bandwidth."""
+        bandwidth = self.server.state.bandwidth
+        if not bandwidth:
+            self.wfile.write(payload)
+            return
+        chunk_size = max(1024, int(bandwidth / 50))
+        started = time.perf_counter()
+        for offset in range(0, len(payload), chunk_size):
+            self.wfile.write(payload[offset : offset + chunk_size])
+            ahead = (offset + chunk_size) / bandwidth - (time.perf_counter() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def _requested_range(self, size: int, etag: str) -> tuple[int, int] | None:
+        """Return the (start, end) byte range to serve, or None for the full body."""
+        header = self.headers.get("Range", "")
+        if not self.server.state.ranges or not header.startswith("bytes="):
+            return None
+        if_range = self.headers.get("If-Range")
+        if if_range is not None and if_range != etag:
+            return None
+        first, _, last = header[len("bytes=") :].partition("-")
+        start = int(first)
+        end = int(last) + 1 if last else size
+        return start, min(end, size)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    state: ServerState
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        pass
+
+
+def synthetic_files(
+    count: int,
+    size: int,
+    prefix: str = "/series_",
+    seed: int = 0,
+) -> dict[str, bytes]:
+    """Build CSV-like files of a given size to serve.
+
+    Args:
+        count: Number of files.
+        size: Size in bytes of each file.
+        prefix: URL path prefix; files are named <prefix><n>.csv.
+        seed: Seed for the generated values, so runs are repeatable.
+
+    Returns:
+        Mapping of URL path to file content.
+    """
+    rng = random.Random(seed)
+    files = {}
+    for n in range(count):
+        rows = [b"fecha,valor\n"]
+        length = len(rows[0])
+        day = 0
+        while length < size:
+            day_date = START_DATE + timedelta(days=day)
+            row = f"{day_date.isoformat()},{rng.uniform(0, 100000):.2f}\n".encode()
+            rows.append(row)
+            length += len(row)
+            day += 1
+        files[f"{prefix}{n}.csv"] = b"".join(rows)[:size]
+    return files
+
+
+@contextmanager
+def serve_files(
+    files: dict[str, bytes],
+    latency: float = 0.0,
+    etag: bool = True,
+    **options: Any,
+) -> Iterator[tuple[str, ServerState]]:
+    """Serve files over HTTP on a random local port.
+
+    Args:
+        files: Mapping of URL path to file content. The dict is shared
+            with the server, so tests can update content between requests.
+        latency: Seconds to sleep before answering each request.
+        etag: Whether to send ETag headers and honour If-None-Match.
+        **options: Further ServerState options (e.g., bandwidth, ranges,
+            error_rate), which can also be changed on the state later.
+
+    Yields:
+        Tuple of (base_url, state) where base_url has no trailing slash.
+    """
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.state = ServerState(files=files, latency=latency, etag=etag, **options)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        yield f"http://{host}:{port}", server.state
+    finally:
+        server.shutdown()
+        server.server_close()